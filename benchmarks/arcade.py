@@ -0,0 +1,104 @@
+"""Measures arcade frame time as players are added.
+
+Flies every arcade game with a simple autopilot and, at every quality profile, times
+whole frames (stepping all games, then drawing every viewport and presenting once) for
+one to `constants.ARCADE_MAX_PLAYERS` players. Each player added shrinks the viewports,
+so the frame time should stay about flat. Runs headless with SDL's dummy video driver.
+
+Usage: python -m benchmarks.arcade [FRAMES]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+import main
+
+from managers.arcade_manager import ArcadeManager
+from managers.atlas_manager import SpriteAtlas, SpriteBatch
+from managers.background_manager import ParallaxBackground
+from managers.game_states import create_bird_surface
+from managers.render_manager import FrameBuffer, split_viewports
+
+
+def autopilot(arcade: ArcadeManager) -> list[bool]:
+    """Decides every player's jump: flap whenever the bird sinks below the next gap's middle.
+
+    Args:
+        arcade (ArcadeManager): The games being flown.
+
+    Returns:
+        list[bool]: Jump input of each player.
+    """
+    jumps = []
+    for bird, pipe_manager in zip(arcade.birds, arcade.pipe_managers):
+        next_pair = next(
+            pair for pair in pipe_manager.pipe_pairs if pair.x + 80 >= bird.x
+        )
+        jumps.append(bird.y > next_pair.top_pipe_height + 110 and bird.velocity > 0)
+    return jumps
+
+
+def time_frames(frame_buffer: FrameBuffer, players: int, frames: int) -> float:
+    """Flies an arcade session and times its frames.
+
+    Args:
+        frame_buffer (FrameBuffer): The framebuffer to split between the players.
+        players (int): Number of players.
+        frames (int): Frames to time.
+
+    Returns:
+        float: Mean frame time in milliseconds, excluding the autopilot.
+    """
+    bird_surfaces = [
+        create_bird_surface(color) for color in constants.ARCADE_COLORS[:players]
+    ]
+    arcade = ArcadeManager(bird_surfaces, seed=0)
+    viewports = split_viewports(frame_buffer.surface, players)
+    sprite_batch = SpriteBatch(SpriteAtlas(viewports[0], bird_surfaces))
+    backgrounds = [ParallaxBackground(viewports[0]) for _ in range(players)]
+    frame_buffer.surface.fill(constants.BLACK)
+    for player in range(players):
+        arcade.restart(player)
+
+    elapsed = 0.0
+    for _ in range(frames):
+        jumps = autopilot(arcade)
+        start = time.perf_counter()
+        arcade.step(jumps)
+        for background in backgrounds:
+            background.update(4)
+        main.draw_arcade_window(frame_buffer, arcade, viewports, sprite_batch, backgrounds)
+        elapsed += time.perf_counter() - start
+    return elapsed * 1000 / frames
+
+
+def run(frames: int = 600) -> None:
+    """Prints the mean frame time per quality profile and player count.
+
+    Args:
+        frames (int, optional): Frames timed per measurement. Defaults to 600.
+
+    Returns:
+        None
+    """
+    pygame.display.init()
+    window = pygame.display.set_mode([constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT])
+
+    counts = range(1, constants.ARCADE_MAX_PLAYERS + 1)
+    print(f"{'profile':<8}" + "".join(f"{f'{count}P':>12}" for count in counts))
+    for quality in constants.QUALITY_PROFILES:
+        frame_buffer = FrameBuffer.from_quality(window, quality)
+        timings = [time_frames(frame_buffer, count, frames) for count in counts]
+        print(f"{quality:<8}" + "".join(f"{timing:>9.3f} ms" for timing in timings))
+
+    pygame.display.quit()
+
+
+if __name__ == "__main__":
+    run(*(int(argument) for argument in sys.argv[1:2]))
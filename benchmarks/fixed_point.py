@@ -0,0 +1,116 @@
+"""Measures simulation throughput of float and fixed-point physics.
+
+Times two paths with the same seeded inputs in both modes:
+
+* scalar: `step_playing` on one bird and its pipes, as the game and replays run it;
+* batched: `simulate_trajectories`, stepping many recorded runs at once with NumPy
+  (float64 arrays on the float path, int32 on the fixed-point one).
+
+Fixed point buys determinism, not speed: in CPython, ints beyond the small-int cache
+are allocated by every operation while floats come from a free list, and NumPy steps
+int32 and float64 arrays of this size at about the same rate.
+
+Usage: python -m benchmarks.fixed_point [RUNS] [FRAMES]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import constants
+
+from entities.bird import Bird
+from managers.game_manager import reset_game, step_playing
+from managers.ghost_manager import simulate_trajectories
+from managers.pipe_manager import PipeManager
+from managers.score_manager import ScoreManager
+
+# Best of this many timings is reported
+REPEATS: int = 3
+
+
+def time_scalar(jumps: np.ndarray, fixed_point: bool) -> float:
+    """Steps one bird through the given inputs, restarting after every crash.
+
+    Args:
+        jumps (np.ndarray): Jump input per frame.
+        fixed_point (bool): Whether to use fixed-point physics.
+
+    Returns:
+        float: Frames stepped per second.
+    """
+    surface = pygame.Surface((constants.BIRD_SIZE, constants.BIRD_SIZE))
+    bird = Bird(70, 90, surface, fixed_point)
+    pipe_manager = PipeManager(
+        gap=200,
+        pipe_width=80,
+        speed=4,
+        spawn_distance=300,
+        seed=0,
+        fixed_point=fixed_point,
+    )
+    score_manager = ScoreManager()
+    reset_game(bird, pipe_manager, score_manager)
+    inputs = jumps.tolist()
+
+    last_pipe_passed = -1
+    start = time.perf_counter()
+    for jump in inputs:
+        last_pipe_passed, crashed = step_playing(
+            bird, pipe_manager, score_manager, jump, last_pipe_passed
+        )
+        if crashed:
+            reset_game(bird, pipe_manager, score_manager)
+            last_pipe_passed = -1
+    return len(inputs) / (time.perf_counter() - start)
+
+
+def time_batched(runs: list[tuple[np.ndarray, int]], fixed_point: bool) -> float:
+    """Simulates every run at once.
+
+    Args:
+        runs (list[tuple[np.ndarray, int]]): Jump frames and length of each run.
+        fixed_point (bool): Whether to use fixed-point physics.
+
+    Returns:
+        float: Bird frames simulated per second.
+    """
+    start = time.perf_counter()
+    simulate_trajectories(runs, fixed_point=fixed_point)
+    return sum(frames for _, frames in runs) / (time.perf_counter() - start)
+
+
+def run(runs: int = 2000, frames: int = 2000) -> None:
+    """Prints the throughput of both paths in both modes.
+
+    Args:
+        runs (int, optional): Runs simulated by the batched path. Defaults to 2000.
+        frames (int, optional): Frames per run. Defaults to 2000.
+
+    Returns:
+        None
+    """
+    rng = np.random.default_rng(0)
+    jumps = rng.random((runs, frames)) < 0.06
+    batch = [(np.flatnonzero(row) + 1, frames) for row in jumps]
+
+    print(f"{'path':<8} {'float':>16} {'fixed point':>16} {'speedup':>8}")
+    for name, timer, work in (
+        ("scalar", time_scalar, jumps[:10].ravel()),
+        ("batched", time_batched, batch),
+    ):
+        float_rate = max(timer(work, False) for _ in range(REPEATS))
+        fixed_rate = max(timer(work, True) for _ in range(REPEATS))
+        print(
+            f"{name:<8} {float_rate:>10,.0f} fps {fixed_rate:>10,.0f} fps "
+            f"{fixed_rate / float_rate:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    run(*(int(argument) for argument in sys.argv[1:3]))
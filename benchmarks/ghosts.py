@@ -0,0 +1,99 @@
+"""Measures drawing many ghost birds with one batched blit against one `Bird.draw` each.
+
+Builds random runs, replays them with `simulate_trajectories` and times a frame of
+ghost drawing at every quality profile. Runs headless with SDL's dummy video driver.
+
+Usage: python -m benchmarks.ghosts [GHOSTS] [FRAMES]
+"""
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import constants
+
+from entities.bird import Bird
+from managers.game_states import create_bird_surface
+from managers.ghost_manager import GhostManager, simulate_trajectories
+from managers.render_manager import FrameBuffer
+
+
+def random_runs(count: int, frames: int, seed: int = 0) -> list[tuple[np.ndarray, int]]:
+    """Creates runs that jump at random, lasting at least `frames` frames.
+
+    Args:
+        count (int): Number of runs.
+        frames (int): Minimum run length.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        list[tuple[np.ndarray, int]]: Jump frames and length of each run.
+    """
+    rng = random.Random(seed)
+    runs = []
+    for _ in range(count):
+        length = frames + rng.randrange(frames)
+        jumps = [frame for frame in range(1, length + 1) if rng.random() < 0.06]
+        runs.append((np.array(jumps, dtype=np.int64), length))
+    return runs
+
+
+def run(ghosts: int = 500, frames: int = 600) -> None:
+    """Prints the mean ghost drawing time per frame for both approaches.
+
+    Args:
+        ghosts (int, optional): Number of ghosts on screen. Defaults to 500.
+        frames (int, optional): Frames drawn per measurement. Defaults to 600.
+
+    Returns:
+        None
+    """
+    pygame.display.init()
+    window = pygame.display.set_mode([constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT])
+
+    surface = create_bird_surface(constants.BLUE)
+    surface.set_colorkey(constants.BLACK)
+
+    start = time.perf_counter()
+    trajectories = simulate_trajectories(random_runs(ghosts, frames))
+    print(f"replayed {ghosts} runs in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    ghost_manager = GhostManager(surface)
+    ghost_manager.extend(trajectories)
+
+    # Baseline: one Bird per ghost with the same translucent sprite, one blit each
+    sprite = surface.convert_alpha()
+    sprite.fill((255, 255, 255, 96), special_flags=pygame.BLEND_RGBA_MULT)
+    birds = [Bird(70, 90, sprite) for _ in trajectories]
+
+    print(f"{'profile':<8} {'batched':>12} {'per bird':>12}")
+    for quality, size in constants.QUALITY_PROFILES.items():
+        screen = FrameBuffer(window, size).surface
+
+        ghost_manager.start_run()
+        start = time.perf_counter()
+        for _ in range(frames):
+            ghost_manager.step(70, 90)
+            ghost_manager.draw(screen)
+        batched = (time.perf_counter() - start) * 1000 / frames
+
+        start = time.perf_counter()
+        for frame in range(frames):
+            for bird, trajectory in zip(birds, trajectories):
+                bird.set_state((70, float(trajectory[frame, 1]), 0.0))
+                bird.draw(screen)
+        per_bird = (time.perf_counter() - start) * 1000 / frames
+
+        print(f"{quality:<8} {batched:>9.3f} ms {per_bird:>9.3f} ms")
+
+    pygame.display.quit()
+
+
+if __name__ == "__main__":
+    run(*(int(argument) for argument in sys.argv[1:3]))
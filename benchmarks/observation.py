@@ -0,0 +1,76 @@
+"""Times `Observer` as a bot would use it every tick.
+
+Flies a seeded run with an autopilot that decides from observations alone, then
+prints the mean cost of an observation with and without rays.
+tests/test_observation.py checks that observing allocates nothing and that every ray
+distance is right.
+
+Usage: python -m benchmarks.observation [FRAMES] [RAYS]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+
+from entities.bird import Bird
+from managers.game_manager import reset_game, step_playing
+from managers.observation_manager import FEATURE_NAMES, Observer
+from managers.pipe_manager import PipeManager
+from managers.score_manager import ScoreManager
+
+
+def run(frames: int = 1200, rays: int = 16) -> None:
+    """Flies a run, then times the observations of its last frame.
+
+    Args:
+        frames (int, optional): Frames to fly. Defaults to 1200.
+        rays (int, optional): Rays of the ray-casting observer. Defaults to 16.
+
+    Returns:
+        None
+    """
+    surface = pygame.Surface((constants.BIRD_SIZE, constants.BIRD_SIZE))
+    bird = Bird(70, 90, surface)
+    pipe_manager = PipeManager(gap=200, pipe_width=80, speed=4, spawn_distance=300, seed=0)
+    score_manager = ScoreManager()
+    reset_game(bird, pipe_manager, score_manager)
+
+    plain = Observer(bird, pipe_manager)
+    casting = Observer(bird, pipe_manager, rays=rays)
+    plain_buffer = plain.create_buffer()
+    casting_buffer = casting.create_buffer()
+    bird_y = FEATURE_NAMES.index("bird_y")
+    gap_top = FEATURE_NAMES.index("gap_top")
+    velocity = FEATURE_NAMES.index("bird_velocity")
+
+    last_pipe_passed = -1
+    for frame in range(frames):
+        plain.observe(plain_buffer)
+        # Autopilot on observations only: flap below the middle of the next gap
+        jump = bool(
+            plain_buffer[bird_y] > plain_buffer[gap_top] + 110 and plain_buffer[velocity] > 0
+        )
+        last_pipe_passed, crashed = step_playing(
+            bird, pipe_manager, score_manager, jump, last_pipe_passed
+        )
+        if crashed:
+            print(f"autopilot crashed at frame {frame}")
+            break
+
+    for name, observer, buffer in (("plain", plain, plain_buffer), ("rays", casting, casting_buffer)):
+        start = time.perf_counter()
+        for _ in range(10000):
+            observer.observe(buffer)
+        elapsed = (time.perf_counter() - start) * 1e6 / 10000
+        print(f"{name:<6} {observer.size:>3} values {elapsed:>8.2f} us per observation")
+    print(f"score {score_manager.score}")
+
+
+if __name__ == "__main__":
+    run(*(int(argument) for argument in sys.argv[1:3]))
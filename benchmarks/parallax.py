@@ -0,0 +1,77 @@
+"""Measures what each parallax background layer adds to a frame.
+
+At every quality profile, times clearing the framebuffer with the plain white fill the
+background replaces, then drawing the background with its first one, two, ... layers
+while it scrolls at the pipes' speed. Prints the total per layer count and the cost
+each layer adds, so new art can be budgeted before it ships. Runs headless with SDL's
+dummy video driver, so only the cost of drawing into the framebuffer is measured.
+
+Usage: python -m benchmarks.parallax [FRAMES]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+
+from managers.background_manager import DEFAULT_LAYERS, ParallaxBackground
+from managers.render_manager import FrameBuffer
+
+
+def time_background(screen: pygame.Surface, layers: int, frames: int) -> float:
+    """Scrolls and draws a background with the first layers of `DEFAULT_LAYERS`.
+
+    Args:
+        screen (pygame.Surface): The framebuffer surface.
+        layers (int): Number of layers, 0 for the plain fill.
+        frames (int): Frames to draw.
+
+    Returns:
+        float: Mean milliseconds per frame.
+    """
+    background = ParallaxBackground(screen, DEFAULT_LAYERS[:layers]) if layers else None
+    start = time.perf_counter()
+    for _ in range(frames):
+        if background is not None:
+            background.update(4)
+            background.draw(screen)
+        else:
+            screen.fill(constants.WHITE)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def run(frames: int = 600) -> None:
+    """Prints the background cost per quality profile and layer count.
+
+    Args:
+        frames (int, optional): Frames drawn per measurement. Defaults to 600.
+
+    Returns:
+        None
+    """
+    pygame.display.init()
+    window = pygame.display.set_mode([constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT])
+
+    names = [painter.__name__.removeprefix("paint_") for painter, *_ in DEFAULT_LAYERS]
+    print(f"{'profile':<8} {'fill':>9} " + " ".join(f"{f'+{name}':>17}" for name in names))
+    for quality, size in constants.QUALITY_PROFILES.items():
+        screen = FrameBuffer(window, size).surface
+        timings = [time_background(screen, layers, frames) for layers in range(len(names) + 1)]
+        print(
+            f"{quality:<8} {timings[0]:>6.3f} ms "
+            + " ".join(
+                f"{total:>6.3f} ms ({total - previous:+.3f})"
+                for previous, total in zip(timings, timings[1:])
+            )
+        )
+
+    pygame.display.quit()
+
+
+if __name__ == "__main__":
+    run(*(int(argument) for argument in sys.argv[1:2]))
@@ -0,0 +1,182 @@
+"""Checks how the quality governor reacts to load, and what each of its levels costs.
+
+First feeds `QualityGovernor` frame times from a cost model in which every level makes
+frames cheaper by a fixed factor, through three scenarios:
+
+* a moving screen under a load spike: the governor must settle on a level that fits
+  the budget without changing level again, and return to full quality afterwards;
+* a static screen that is expensive to draw: levels that redraw it only now and then
+  look far cheaper than they are per drawn frame, and the governor must stop trying
+  to step up after a few failed upgrades instead of flipping between two levels;
+* a light load: the governor must never leave full quality.
+
+Then renders the game-over and confirm-exit screens at every level, drawing only the
+frames the governor asks for, and prints the mean time per frame. Exits with status 1
+if a scenario fails.
+
+Usage: python -m benchmarks.quality_governor [FRAMES]
+"""
+from __future__ import annotations
+
+import io
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+
+from entities.bird import Bird
+from managers.game_states import GameState, Scene, create_bird_surface, create_screens
+from managers.pipe_manager import PipeManager
+from managers.quality_governor import QualityGovernor
+from managers.render_manager import FrameBuffer
+from managers.score_manager import ScoreManager
+
+# Cost of a drawn frame at each level, relative to full quality
+LEVEL_COST: list[float] = [1.0, 0.8, 0.8, 0.55, 0.3]
+# Cost of a frame a static screen keeps from before
+SKIPPED_FRAME: float = 0.0002
+
+STATES: list[str] = [GameState.GAME_OVER, GameState.CONFIRM_EXIT_GAME_OVER]
+
+
+def simulate(loads: list[tuple[int, float]], static: bool) -> tuple[QualityGovernor, list[int], str]:
+    """Runs the governor against the cost model.
+
+    Args:
+        loads (list[tuple[int, float]]): Frames and full-quality frame time in seconds
+            of each phase.
+        static (bool): Whether the screen is static, so levels may skip frames.
+
+    Returns:
+        tuple[QualityGovernor, list[int], str]: The governor, its level after every
+        frame, and its transition log.
+    """
+    log = io.StringIO()
+    governor = QualityGovernor(output=log)
+    levels = []
+    for frames, seconds in loads:
+        for _ in range(frames):
+            if governor.should_draw("screen", static):
+                cost = seconds * LEVEL_COST[governor.level]
+            else:
+                cost = SKIPPED_FRAME
+            governor.record(cost)
+            levels.append(governor.level)
+    return governor, levels, log.getvalue()
+
+
+def transitions(levels: list[int]) -> int:
+    """Counts level changes.
+
+    Args:
+        levels (list[int]): Level after every frame.
+
+    Returns:
+        int: Number of changes.
+    """
+    return sum(1 for before, after in zip(levels, levels[1:]) if before != after)
+
+
+def check_scenarios(frames: int) -> int:
+    """Runs every scenario and prints what the governor did.
+
+    Args:
+        frames (int): Frames per load phase.
+
+    Returns:
+        int: Number of failed scenarios.
+    """
+    failures = 0
+
+    _, levels, log = simulate([(frames, 0.005), (frames, 0.024), (frames, 0.005)], False)
+    settled = levels[frames + frames // 2 : 2 * frames]
+    cost = 0.024 * LEVEL_COST[settled[-1]] * constants.FPS
+    print(f"load spike: {transitions(levels)} transitions, settled at {cost:.0%} of budget")
+    print(log, end="")
+    if transitions(settled) or cost > 1 or levels[-1] != 0:
+        print("load spike: did not settle within budget and recover")
+        failures += 1
+
+    _, levels, log = simulate([(3 * frames, 0.019)], True)
+    late = transitions(levels[len(levels) // 2 :])
+    print(f"static screen: {transitions(levels)} transitions, {late} in the second half")
+    print(log, end="")
+    if late > 2:
+        print("static screen: the governor keeps flipping between levels")
+        failures += 1
+
+    _, levels, _ = simulate([(3 * frames, 0.007)], False)
+    print(f"light load: {transitions(levels)} transitions")
+    if transitions(levels):
+        print("light load: quality was lowered without need")
+        failures += 1
+    return failures
+
+
+def time_levels(frames: int) -> None:
+    """Prints the mean frame time of the overlay screens at every level.
+
+    Args:
+        frames (int): Frames rendered per measurement.
+
+    Returns:
+        None
+    """
+    pygame.display.init()
+    window = pygame.display.set_mode([constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT])
+
+    bird_surface = create_bird_surface(constants.GREEN)
+    bird = Bird(70, 90, bird_surface)
+    pipe_manager = PipeManager(gap=200, pipe_width=80, speed=4, spawn_distance=300, seed=0)
+    for _ in range(120):
+        pipe_manager.update()
+    score_manager = ScoreManager()
+
+    print(f"{'level':<8} " + " ".join(f"{state:>22}" for state in STATES))
+    for level in constants.GOVERNOR_LEVELS:
+        size = constants.QUALITY_PROFILES[level[1] or constants.DEFAULT_QUALITY]
+        frame_buffer = FrameBuffer(window, size)
+        scene = Scene(
+            frame_buffer, bird, bird_surface, pipe_manager, QualityGovernor([level])
+        )
+        screens = create_screens(scene, score_manager)
+
+        timings = []
+        for state in STATES:
+            screen = screens[state]
+            screen.enter(None)
+            # Warm up fonts, labels and scaled sprites outside the measurement
+            screen.draw(frame_buffer.surface)
+            start = time.perf_counter()
+            for _ in range(frames):
+                # The screen draws only the frames the governor asks for
+                screen.render()
+            timings.append((time.perf_counter() - start) * 1000 / frames)
+            screen.exit(None)
+        print(f"{level[0]:<8} " + " ".join(f"{timing:>19.3f} ms" for timing in timings))
+
+    pygame.display.quit()
+
+
+def run(frames: int = 600) -> int:
+    """Checks the scenarios, then times the levels.
+
+    Args:
+        frames (int, optional): Frames per load phase and per measurement. Defaults
+            to 600.
+
+    Returns:
+        int: Number of failed scenarios.
+    """
+    failures = check_scenarios(frames)
+    time_levels(frames)
+    print(f"{failures} failure(s)")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if run(*(int(argument) for argument in sys.argv[1:2])) else 0)
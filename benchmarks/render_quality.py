@@ -0,0 +1,95 @@
+"""Compares the frame cost of the render quality profiles.
+
+Renders the same gameplay and game-over frames through each profile's framebuffer with
+the game's own screens, including the scale to the window, and prints the mean time
+per frame. Runs headless with SDL's dummy video driver, so the display flip itself is
+not part of the timing.
+
+Usage: python -m benchmarks.render_quality [FRAMES]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+
+from entities.bird import Bird
+from managers.game_states import GameState, Scene, create_bird_surface, create_screens
+from managers.pipe_manager import PipeManager
+from managers.quality_governor import QualityGovernor
+from managers.render_manager import FrameBuffer
+from managers.score_manager import ScoreManager
+from managers.state_machine import State
+
+STATES: list[str] = [
+    GameState.PLAYING,
+    GameState.GAME_OVER,
+    GameState.CONFIRM_EXIT_GAME_OVER,
+]
+
+
+def time_frames(screen: State, frames: int) -> float:
+    """Renders a number of frames of one screen.
+
+    Args:
+        screen (State): The game screen to render, as the game's state machine would.
+        frames (int): Number of frames to render.
+
+    Returns:
+        float: Mean milliseconds per frame.
+    """
+    # Warm up fonts, labels and scaled sprites outside the measurement
+    screen.enter(None)
+    screen.render()
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.render()
+    elapsed = time.perf_counter() - start
+    screen.exit(None)
+    return elapsed * 1000 / frames
+
+
+def run(frames: int = 300) -> None:
+    """Prints the mean frame time of every quality profile and game state.
+
+    Args:
+        frames (int, optional): Frames rendered per measurement. Defaults to 300.
+
+    Returns:
+        None
+    """
+    pygame.display.init()
+    window = pygame.display.set_mode([constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT])
+
+    bird_surface = create_bird_surface(constants.GREEN)
+    bird = Bird(70, 90, bird_surface)
+    pipe_manager = PipeManager(
+        gap=200, pipe_width=80, speed=4, spawn_distance=300, seed=0
+    )
+    for _ in range(120):
+        pipe_manager.update()
+    score_manager = ScoreManager()
+
+    print(f"{'profile':<8} {'size':>9} " + " ".join(f"{state:>22}" for state in STATES))
+    for quality, size in constants.QUALITY_PROFILES.items():
+        scene = Scene(
+            FrameBuffer(window, size), bird, bird_surface, pipe_manager, QualityGovernor()
+        )
+        screens = create_screens(scene, score_manager)
+        timings = [time_frames(screens[state], frames) for state in STATES]
+        print(
+            f"{quality:<8} {size[0]:>4}x{size[1]:<4} "
+            + " ".join(f"{timing:>19.3f} ms" for timing in timings)
+        )
+
+    pygame.display.quit()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
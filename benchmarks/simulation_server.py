@@ -0,0 +1,137 @@
+"""Times the simulation server through its client, as a trainer would drive it.
+
+Starts `main.py --serve` in a separate process and prints steps per second over the
+socket and through shared memory for several batch sizes, next to the in-process
+rate, and the round-trip overhead that each step pays for the socket.
+tests/test_simulation_server.py checks what the server answers.
+
+Usage: python -m benchmarks.simulation_server [FRAMES]
+"""
+from __future__ import annotations
+from typing import Any, Callable
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+
+from managers.simulation_client import SimulationClient
+from managers.simulation_server import VectorEnvironment
+
+BATCH_SIZES: list[int] = [1, 16, 256]
+# Rate of random flaps: often enough to keep birds airborne, rarely enough to crash
+FLAP_RATE: float = 0.08
+
+
+def start_server(path: str, environments: int) -> subprocess.Popen[bytes]:
+    """Starts a server process with shared memory and waits until it listens.
+
+    Args:
+        path (str): Path of the socket.
+        environments (int): Number of environments served.
+
+    Returns:
+        subprocess.Popen[bytes]: The server process.
+    """
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "main.py",
+            "--serve",
+            path,
+            "--envs",
+            str(environments),
+            "--seed",
+            "0",
+            "--shared-memory",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+            return server
+        except OSError:
+            time.sleep(0.05)
+        finally:
+            probe.close()
+    server.kill()
+    raise RuntimeError(f"the server did not start listening on {path}")
+
+
+def time_steps(
+    step: Callable[[np.ndarray], Any], environments: int, frames: int
+) -> float:
+    """Times a step function over seeded random actions.
+
+    Args:
+        step (Callable[[np.ndarray], Any]): Called with the actions of one frame.
+        environments (int): Number of environments.
+        frames (int): Frames to step.
+
+    Returns:
+        float: Steps per second.
+    """
+    actions = np.random.default_rng(0).random((frames, environments)) < FLAP_RATE
+    start = time.perf_counter()
+    for frame in range(frames):
+        step(actions[frame])
+    return frames / (time.perf_counter() - start)
+
+
+def run(frames: int = 2000) -> None:
+    """Times the server in both modes per batch size.
+
+    Args:
+        frames (int, optional): Frames stepped per timing. Defaults to 2000.
+
+    Returns:
+        None
+    """
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "simulation.sock")
+
+    print(
+        f"{'envs':>5} {'in-process':>14} {'socket':>14} {'shared memory':>14} "
+        f"{'overhead':>10}"
+    )
+    for environments in BATCH_SIZES:
+        local = VectorEnvironment(environments, seed=0)
+        local.reset()
+        rewards = np.zeros(environments, dtype=np.float32)
+        dones = np.zeros(environments, dtype=np.uint8)
+        local_rate = time_steps(
+            lambda actions: local.step(actions, rewards, dones), environments, frames
+        )
+
+        server = start_server(path, environments)
+        try:
+            rates = []
+            for shared in (False, True):
+                client = SimulationClient(path, shared)
+                client.reset()
+                rates.append(time_steps(client.step, environments, frames))
+                client.close()
+        finally:
+            server.terminate()
+            server.wait()
+        overhead = (1 / rates[1] - 1 / local_rate) * 1e6
+        print(
+            f"{environments:>5} {local_rate:>10,.0f} /s {rates[0]:>10,.0f} /s "
+            f"{rates[1]:>10,.0f} /s {overhead:>7.1f} us"
+        )
+
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    run(*(int(argument) for argument in sys.argv[1:2]))
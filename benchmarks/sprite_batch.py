@@ -0,0 +1,109 @@
+"""Measures drawing a PLAYING frame's sprites one by one against one atlas batch.
+
+Flies a seeded run with a simple autopilot and, at every quality profile, times the
+pipes and the bird drawn per entity (a `pygame.draw.rect` per pipe, the bird's
+unconverted surface) and queued into a `SpriteBatch` (one `Surface.blits` call from a
+display-format atlas). Runs headless with SDL's dummy video driver, so only the cost of
+drawing into the framebuffer is measured, not presenting it.
+
+Usage: python -m benchmarks.sprite_batch [FRAMES]
+"""
+from __future__ import annotations
+from typing import Any
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants
+
+from entities.bird import Bird
+from managers.atlas_manager import SpriteAtlas, SpriteBatch
+from managers.game_manager import reset_game, step_playing
+from managers.game_states import create_bird_surface
+from managers.pipe_manager import PipeManager
+from managers.render_manager import FrameBuffer
+from managers.score_manager import ScoreManager
+
+
+def fly(frames: int) -> list[tuple[tuple[float, float, float], tuple[Any, ...]]]:
+    """Records bird and pipe snapshots of an autopilot run.
+
+    Args:
+        frames (int): Frames to fly, unless the autopilot crashes earlier.
+
+    Returns:
+        list[tuple[tuple[float, float, float], tuple[Any, ...]]]: Bird state and pipe
+            manager snapshot of every frame.
+    """
+    bird = Bird(70, 90, create_bird_surface(constants.GREEN))
+    pipe_manager = PipeManager(gap=200, pipe_width=80, speed=4, spawn_distance=300, seed=0)
+    score_manager = ScoreManager()
+    reset_game(bird, pipe_manager, score_manager)
+    last_pipe_passed = -1
+
+    snapshots = []
+    for _ in range(frames):
+        next_pair = next(
+            pair for pair in pipe_manager.pipe_pairs if pair.x + 80 >= bird.x
+        )
+        jump = bird.y > next_pair.top_pipe_height + 110 and bird.velocity > 0
+        last_pipe_passed, crashed = step_playing(
+            bird, pipe_manager, score_manager, jump, last_pipe_passed
+        )
+        if crashed:
+            break
+        snapshots.append((bird.get_state(), pipe_manager.get_state()))
+    return snapshots
+
+
+def run(frames: int = 600) -> None:
+    """Prints the mean sprite drawing time per frame for both approaches.
+
+    Args:
+        frames (int, optional): Frames drawn per measurement. Defaults to 600.
+
+    Returns:
+        None
+    """
+    pygame.display.init()
+    window = pygame.display.set_mode([constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT])
+    snapshots = fly(frames)
+
+    bird_surface = create_bird_surface(constants.GREEN)
+    bird = Bird(70, 90, bird_surface)
+    pipe_manager = PipeManager(gap=200, pipe_width=80, speed=4, spawn_distance=300, seed=0)
+
+    print(f"{len(snapshots)} frames")
+    print(f"{'profile':<8} {'per entity':>13} {'batched':>12}")
+    for quality, size in constants.QUALITY_PROFILES.items():
+        screen = FrameBuffer(window, size).surface
+        sprite_batch = SpriteBatch(SpriteAtlas(screen, [bird_surface]))
+
+        timings = []
+        for batched in (False, True):
+            elapsed = 0.0
+            for bird_state, pipe_state in snapshots:
+                bird.set_state(bird_state)
+                pipe_manager.set_state(pipe_state)
+                start = time.perf_counter()
+                if batched:
+                    pipe_manager.queue(sprite_batch)
+                    bird.queue(sprite_batch)
+                    sprite_batch.flush(screen)
+                else:
+                    pipe_manager.draw(screen)
+                    bird.draw(screen)
+                elapsed += time.perf_counter() - start
+            timings.append(elapsed * 1000 / len(snapshots))
+
+        print(f"{quality:<8} {timings[0]:>10.3f} ms {timings[1]:>9.3f} ms")
+
+    pygame.display.quit()
+
+
+if __name__ == "__main__":
+    run(*(int(argument) for argument in sys.argv[1:2]))
@@ -1,16 +1,48 @@
 from typing import List
 
+import os
+
 # FPS Limits
 FPS: int = 60
 
-# Screen width and screen height
+# Screen width and screen height; all game geometry is in these logical units
 SCREEN_WIDTH: int = 800
 SCREEN_HEIGHT: int = 600
 
+# Internal framebuffer size per quality profile, scaled to the window once per frame
+QUALITY_PROFILES: dict[str, tuple[int, int]] = {
+    "high": (800, 600),
+    "medium": (600, 450),
+    "low": (400, 300),
+}
+DEFAULT_QUALITY: str = "high"
+
+# Levels the frame-rate governor steps down through when frames run long, best first:
+# name, framebuffer quality profile (None keeps the chosen one), whether overlays are
+# alpha blended, whether buttons react to hover, and every how many frames a static
+# screen (menus, game over) is drawn again
+GOVERNOR_LEVELS: list[tuple[str, str | None, bool, bool, int]] = [
+    ("full", None, True, True, 1),
+    ("reduced", None, False, False, 1),
+    ("static", None, False, False, 15),
+    ("medium", "medium", False, False, 15),
+    ("low", "low", False, False, 15),
+]
+
 # Define size of pipes
 PIPE_HEIGHT: int = 100
 PIPE_WIDTH: int = 80
 
+# Define size of the bird sprite
+BIRD_SIZE: int = 50
+
+# Bird physics, in pixels per frame
+BIRD_GRAVITY: float = 0.5
+BIRD_JUMP_FORCE: float = -7.0
+
+# Fixed-point physics: positions and speeds in 1/256 pixel steps
+FIXED_POINT_SHIFT: int = 8
+
 # Define size of buttons
 BUTTON_WIDTH: int = 220
 BUTTON_HEIGHT: int = 60
@@ -22,3 +54,16 @@ GREEN: List[int] = [0, 255, 0]
 BLUE: List[int] = [0, 0, 255]
 BLACK: List[int] = [0, 0, 0]
 WHITE: List[int] = [255, 255, 255]
+ORANGE: List[int] = [255, 140, 0]
+
+# Split-screen arcade mode: bird color of each player
+ARCADE_MAX_PLAYERS: int = 4
+ARCADE_COLORS: List[List[int]] = [GREEN, BLUE, RED, ORANGE]
+
+# Directory for persistent player data
+DATA_DIR: str = os.path.join(os.path.expanduser("~"), ".flappy_bird")
+SCORES_PATH: str = os.path.join(DATA_DIR, "scores.db")
+
+# Directory for caches that can be rebuilt at any time
+CACHE_DIR: str = os.path.join(DATA_DIR, "cache")
+FONT_CACHE_PATH: str = os.path.join(CACHE_DIR, "fonts.json")
@@ -1,31 +1,63 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING
 from pygame import sprite
 import pygame
 import constants
 
+from utils.fixed_point import (
+    FIXED_HALF,
+    FIXED_SHIFT,
+    to_fixed,
+    to_logical,
+    to_pixel,
+)
+from utils.scaling import get_scale, scale_point
+
+if TYPE_CHECKING:
+    from managers.atlas_manager import SpriteBatch
+
 
 class Bird(sprite.Sprite):
     """Represents the bird character in the game.
 
     Handles movement, jumping, resetting position, and rendering.
     Inherits from `pygame.sprite.Sprite` to enable collision detection.
+
+    In fixed-point mode the vertical position and velocity are integer subpixels
+    (see `utils.fixed_point`), and the rect is derived from them by rounding.
     """
 
-    def __init__(self: Bird, x: int, y: int, surface: pygame.Surface) -> None:
+    def __init__(
+        self: Bird, x: int, y: int, surface: pygame.Surface, fixed_point: bool = False
+    ) -> None:
         """Initializes a new bird instance.
 
         Args:
             x (int): Initial horizontal position in pixels.
             y (int): Initial vertical position in pixels.
             surface (pygame.Surface): The image surface used to represent the bird.
+            fixed_point (bool, optional): Whether to integrate the physics in fixed
+                point. Defaults to False.
         """
         super().__init__()
+        self.__fixed_point = fixed_point
         self.__x = x
-        self.__y = y
-        self.__velocity = 0.0
-        self.__gravity = 0.5
-        self.__jump_force = -7.0
         self.__surface = surface
+        self.__scaled_surface: pygame.Surface | None = None
+        # Lowest position, computed once: the subtraction would allocate an int per frame
+        floor_y = constants.SCREEN_HEIGHT - surface.get_height()
+        if fixed_point:
+            self.__y = to_fixed(y)
+            self.__velocity = 0
+            self.__gravity = to_fixed(constants.BIRD_GRAVITY)
+            self.__jump_force = to_fixed(constants.BIRD_JUMP_FORCE)
+            self.__floor_y = to_fixed(floor_y)
+        else:
+            self.__y = y
+            self.__velocity = 0.0
+            self.__gravity = constants.BIRD_GRAVITY
+            self.__jump_force = constants.BIRD_JUMP_FORCE
+            self.__floor_y = floor_y
 
         # Set up the sprite's rect for collision detection
         self.rect = self.__surface.get_rect()
@@ -44,15 +76,19 @@ class Bird(sprite.Sprite):
         self.__velocity += self.__gravity
         self.__y += self.__velocity
 
-        if self.__y + self.__surface.get_height() >= constants.SCREEN_HEIGHT:
-            self.__y = constants.SCREEN_HEIGHT - self.__surface.get_height()
-            self.__velocity = 0.0
+        if self.__y >= self.__floor_y:
+            self.__y = self.__floor_y
+            self.__velocity = 0 if self.__fixed_point else 0.0
 
         if self.__y <= 0:
             self.__y = 0
 
         self.rect.x = self.__x
-        self.rect.y = self.__y
+        if self.__fixed_point:
+            # Rounds like `to_pixel`, inlined: the bird is never above the screen
+            self.rect.y = (self.__y + FIXED_HALF) >> FIXED_SHIFT
+        else:
+            self.rect.y = self.__y
 
     def jump(self: Bird) -> None:
         """Makes the bird jump by applying an upward impulse.
@@ -76,21 +112,64 @@ class Bird(sprite.Sprite):
             None
         """
         self.__x = x
-        self.__y = y
-        self.__velocity = 0.0
+        self.__y = to_fixed(y) if self.__fixed_point else y
+        self.__velocity = 0 if self.__fixed_point else 0.0
         self.rect.x = x
         self.rect.y = y
 
     def draw(self: Bird, screen: pygame.Surface) -> None:
-        """Renders the bird on the specified screen surface.
+        """Renders the bird on the specified screen surface, scaled to its resolution.
+
+        The scaled sprite is created once and reused while the resolution stays the same.
+
+        Args:
+            screen (pygame.Surface): The main display surface or framebuffer.
+
+        Returns:
+            None
+        """
+        scale = get_scale(screen)
+        if scale == 1.0:
+            screen.blit(self.__surface, (self.__x, self.y))
+            return
+
+        size = scale_point(self.__surface.get_size(), scale)
+        if self.__scaled_surface is None or self.__scaled_surface.get_size() != size:
+            self.__scaled_surface = pygame.transform.smoothscale(self.__surface, size)
+        screen.blit(self.__scaled_surface, scale_point((self.__x, self.y), scale))
+
+    def queue(self: Bird, batch: SpriteBatch) -> None:
+        """Queues the bird for batched drawing from a sprite atlas.
+
+        Args:
+            batch (SpriteBatch): The frame's batch; its atlas must contain the bird's surface.
+
+        Returns:
+            None
+        """
+        batch.add_sprite(self.__surface, self.__x, self.y)
+
+    def get_state(self: Bird) -> tuple[float, float, float]:
+        """Captures the bird's dynamic state for later restoration.
+
+        Returns:
+            tuple[float, float, float]: The x position, y position and velocity; in
+            fixed-point mode, y and the velocity are fixed-point ints.
+        """
+        return self.__x, self.__y, self.__velocity
+
+    def set_state(self: Bird, state: tuple[float, float, float]) -> None:
+        """Restores a state previously captured with `get_state`.
 
         Args:
-            screen (pygame.Surface): The main display surface to render the bird on.
+            state (tuple[float, float, float]): The x position, y position and velocity.
 
         Returns:
             None
         """
-        screen.blit(self.__surface, [self.__x, self.__y])
+        self.__x, self.__y, self.__velocity = state
+        self.rect.x = self.__x
+        self.rect.y = to_pixel(self.__y) if self.__fixed_point else self.__y
 
     @property
     def x(self: Bird) -> float:
@@ -108,6 +187,8 @@ class Bird(sprite.Sprite):
         Returns:
             float: The y-coordinate in pixels.
         """
+        if self.__fixed_point:
+            return to_logical(self.__y)
         return self.__y
 
     @property
@@ -117,5 +198,15 @@ class Bird(sprite.Sprite):
         Returns:
             float: The velocity in pixels per frame.
         """
+        if self.__fixed_point:
+            return to_logical(self.__velocity)
         return self.__velocity
 
+    @property
+    def fixed_point(self: Bird) -> bool:
+        """Checks whether the bird's physics run in fixed point.
+
+        Returns:
+            bool: True in fixed-point mode.
+        """
+        return self.__fixed_point
@@ -0,0 +1,236 @@
+"""Binary course format for hand-authored levels.
+
+A course file starts with a fixed header, followed by one fixed-size record per pipe
+pair::
+
+    header   magic "FBCR", version (uint16), reserved (uint16, zero) and pair count
+             (uint32)
+    records  gap_top, gap, spacing (uint16 each) per pair
+
+`spacing` is the horizontal distance from the previous pair; for the first pair it is
+measured from the spawn line. Every gap must end within the screen: gap_top + gap is at
+most `constants.SCREEN_HEIGHT`. Files are read through `mmap` and every record is
+checked once when the file is opened, so a corrupt course is rejected before a run
+starts rather than in the middle of one.
+
+Version 1 files also held an index of cumulative distances after the records, which the
+game never read; they are rejected as an unsupported version.
+
+Run `python -m entities.course SOURCE DESTINATION` to convert a JSON or CSV course.
+"""
+from __future__ import annotations
+from typing import Iterable
+
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+
+import constants
+
+COURSE_MAGIC: bytes = b"FBCR"
+COURSE_VERSION: int = 2
+HEADER: struct.Struct = struct.Struct("<4sHHI")
+RECORD: struct.Struct = struct.Struct("<HHH")
+
+
+class Course:
+    """Read-only view of a binary course file backed by a memory map."""
+
+    def __init__(self: Course, path: str | os.PathLike[str]) -> None:
+        """Opens and validates a course file.
+
+        Args:
+            path (str | os.PathLike[str]): Path to the course file.
+
+        Raises:
+            OSError: If the file cannot be opened.
+            ValueError: If the file is not a valid course of a supported version, or
+                if a pair's gap does not end within the screen.
+        """
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < HEADER.size:
+                raise ValueError(f"{path} is too small to be a course file")
+            self.__map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, _, count = HEADER.unpack_from(self.__map)
+            if magic != COURSE_MAGIC or version != COURSE_VERSION:
+                raise ValueError(f"{path} is not a version {COURSE_VERSION} course file")
+            if len(self.__map) < HEADER.size + count * RECORD.size:
+                raise ValueError(f"{path} is truncated")
+            for index in range(count):
+                gap_top, gap, _ = RECORD.unpack_from(
+                    self.__map, HEADER.size + index * RECORD.size
+                )
+                _check_gap(gap_top, gap, f"pair {index} of {os.fspath(path)}")
+        except ValueError:
+            self.__map.close()
+            raise
+
+        self.__count: int = count
+
+    def __len__(self: Course) -> int:
+        """Gets the number of pipe pairs in the course.
+
+        Returns:
+            int: The pair count.
+        """
+        return self.__count
+
+    def __enter__(self: Course) -> Course:
+        """Uses the course as a context manager that closes it on exit.
+
+        Returns:
+            Course: This course.
+        """
+        return self
+
+    def __exit__(self: Course, *exc_info: object) -> None:
+        """Releases the memory map when the `with` block is left.
+
+        Args:
+            *exc_info (object): The exception leaving the block, if any; not
+                suppressed.
+
+        Returns:
+            None
+        """
+        self.close()
+
+    def get_pair(self: Course, index: int) -> tuple[int, int, int]:
+        """Reads one pipe pair record.
+
+        Args:
+            index (int): Zero-based pair index.
+
+        Returns:
+            tuple[int, int, int]: The gap top, gap size and spacing in pixels.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index < self.__count:
+            raise IndexError("course pair index out of range")
+        return RECORD.unpack_from(self.__map, HEADER.size + index * RECORD.size)
+
+    def close(self: Course) -> None:
+        """Releases the memory map.
+
+        Returns:
+            None
+        """
+        self.__map.close()
+
+
+def _check_gap(gap_top: int, gap: int, where: str) -> None:
+    """Checks that a pair's gap ends within the screen.
+
+    Args:
+        gap_top (int): Top of the gap in pixels.
+        gap (int): Height of the gap in pixels.
+        where (str): The pair, as named in the error message.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If the gap ends below the bottom of the screen.
+    """
+    if gap_top + gap > constants.SCREEN_HEIGHT:
+        raise ValueError(
+            f"{where}: gap from {gap_top} to {gap_top + gap} ends below the screen "
+            f"height of {constants.SCREEN_HEIGHT}"
+        )
+
+
+def write_course(
+    path: str | os.PathLike[str], pairs: Iterable[tuple[int, int, int]]
+) -> int:
+    """Writes pipe pairs to a binary course file.
+
+    Records are streamed to disk as they are produced, so arbitrarily long courses can
+    be written without holding them in memory.
+
+    Args:
+        path (str | os.PathLike[str]): Destination path.
+        pairs (Iterable[tuple[int, int, int]]): Gap top, gap size and spacing per pair.
+
+    Returns:
+        int: The number of pairs written.
+
+    Raises:
+        ValueError: If a pair's gap does not end within the screen.
+    """
+    count = 0
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(COURSE_MAGIC, COURSE_VERSION, 0, 0))
+        for gap_top, gap, spacing in pairs:
+            _check_gap(gap_top, gap, f"pair {count}")
+            file.write(RECORD.pack(gap_top, gap, spacing))
+            count += 1
+
+        file.seek(0)
+        file.write(HEADER.pack(COURSE_MAGIC, COURSE_VERSION, 0, count))
+
+    return count
+
+
+def read_course_source(path: str | os.PathLike[str]) -> list[tuple[int, int, int]]:
+    """Reads pipe pairs from a JSON or CSV course description.
+
+    JSON files hold a list (or an object with a "pairs" list) of objects with
+    "gap_top", "gap" and "spacing" keys. CSV files have a header row with those columns.
+
+    Args:
+        path (str | os.PathLike[str]): Source path; the extension selects the parser.
+
+    Returns:
+        list[tuple[int, int, int]]: Gap top, gap size and spacing per pair.
+
+    Raises:
+        ValueError: If a pair's gap does not end within the screen.
+    """
+    with open(path, newline="") as file:
+        if os.fspath(path).lower().endswith(".csv"):
+            rows = list(csv.DictReader(file))
+        else:
+            data = json.load(file)
+            rows = data["pairs"] if isinstance(data, dict) else data
+
+    pairs = [(int(row["gap_top"]), int(row["gap"]), int(row["spacing"])) for row in rows]
+    for number, (gap_top, gap, _) in enumerate(pairs):
+        _check_gap(gap_top, gap, f"pair {number} of {os.fspath(path)}")
+    return pairs
+
+
+def convert_course(
+    source: str | os.PathLike[str], destination: str | os.PathLike[str]
+) -> int:
+    """Converts a JSON or CSV course description into a binary course file.
+
+    Args:
+        source (str | os.PathLike[str]): JSON or CSV input path.
+        destination (str | os.PathLike[str]): Binary output path.
+
+    Returns:
+        int: The number of pairs written.
+
+    Raises:
+        ValueError: If a pair's gap does not end within the screen; nothing is
+            written then.
+    """
+    return write_course(destination, read_course_source(source))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m entities.course SOURCE DESTINATION")
+    try:
+        written = convert_course(sys.argv[1], sys.argv[2])
+    except ValueError as error:
+        sys.exit(f"Cannot convert {sys.argv[1]}: {error}")
+    print(f"Wrote {written} pipe pairs to {sys.argv[2]}")
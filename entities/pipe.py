@@ -1,15 +1,30 @@
 from __future__ import annotations
-from typing import List
+from typing import List, TYPE_CHECKING
 from pygame import sprite
 
 import pygame
 import constants
 
+from utils.fixed_point import (
+    FIXED_HALF,
+    FIXED_SHIFT,
+    to_fixed,
+    to_logical,
+    to_pixel,
+)
+from utils.scaling import get_scale, scale_rect
+
+if TYPE_CHECKING:
+    from managers.atlas_manager import SpriteBatch
+
 
 class Pipe(sprite.Sprite):
     """Represents a single pipe (top or bottom) for collision detection.
 
     Inherits from `pygame.sprite.Sprite`.
+
+    In fixed-point mode the horizontal position and speed are integer subpixels
+    (see `utils.fixed_point`), and the rect is derived from them by rounding.
     """
 
     def __init__(
@@ -20,6 +35,7 @@ class Pipe(sprite.Sprite):
         height: float,
         speed: float,
         color: List[int] = constants.GREEN,
+        fixed_point: bool = False,
     ) -> None:
         """Initializes a new pipe.
 
@@ -30,11 +46,21 @@ class Pipe(sprite.Sprite):
             height (float): Height of the pipe in pixels.
             speed (float): Leftward movement speed in pixels per frame.
             color (List[int], optional): RGB color of the pipe. Defaults to constants.GREEN.
+            fixed_point (bool, optional): Whether to scroll the pipe in fixed point.
+                Defaults to False.
         """
         super().__init__()
-        self.__x = x
+        self.__fixed_point = fixed_point
         self.__speed = speed
         self.__color = color
+        if fixed_point:
+            self.__x = to_fixed(x)
+            self.__step = to_fixed(speed)
+        else:
+            # Kept as a float: moving it then reuses float objects instead of
+            # allocating ints
+            self.__x = float(x)
+            self.__step = speed
 
         self.rect = pygame.Rect(x, y, width, height)
 
@@ -44,19 +70,67 @@ class Pipe(sprite.Sprite):
         Returns:
             None
         """
-        self.__x -= self.__speed
-        self.rect.x = self.__x
+        self.__x -= self.__step
+        if not self.__fixed_point:
+            self.rect.x = self.__x
+        elif self.__x >= 0:
+            # Rounds like `to_pixel`, inlined for the common on-screen case
+            self.rect.x = (self.__x + FIXED_HALF) >> FIXED_SHIFT
+        else:
+            self.rect.x = to_pixel(self.__x)
+
+    def reset(self: Pipe, x: int, y: int, height: float) -> None:
+        """Moves and resizes the pipe so it can be reused for a new pair.
+
+        Args:
+            x (int): New horizontal position in pixels.
+            y (int): New vertical position in pixels.
+            height (float): New height in pixels.
+
+        Returns:
+            None
+        """
+        self.__x = to_fixed(x) if self.__fixed_point else float(x)
+        self.rect.x = to_pixel(self.__x) if self.__fixed_point else self.__x
+        self.rect.y = y
+        self.rect.height = height
 
     def draw(self: Pipe, screen: pygame.Surface) -> None:
-        """Draws the pipe on the given screen.
+        """Draws the pipe on the given screen, scaled to the screen's resolution.
+
+        Args:
+            screen (pygame.Surface): The main display surface or framebuffer.
+
+        Returns:
+            None
+        """
+        scale = get_scale(screen)
+        if scale == 1.0:
+            pygame.draw.rect(screen, self.__color, self.rect)
+        else:
+            pygame.draw.rect(screen, self.__color, scale_rect(self.rect, scale))
+
+    def queue(self: Pipe, batch: SpriteBatch) -> None:
+        """Queues the pipe for batched drawing as a slice of its color's atlas column.
 
         Args:
-            screen (pygame.Surface): The main display surface.
+            batch (SpriteBatch): The frame's batch; its atlas must have the pipe's color.
 
         Returns:
             None
         """
-        pygame.draw.rect(screen, self.__color, self.rect)
+        batch.add_fill(self.rect, self.__color)
+
+    @property
+    def x(self: Pipe) -> float:
+        """Gets the current horizontal position of the pipe.
+
+        Returns:
+            float: The x-coordinate in pixels.
+        """
+        if self.__fixed_point:
+            return to_logical(self.__x)
+        return self.__x
 
     @property
     def speed(self: Pipe) -> float:
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List
+from typing import List, TYPE_CHECKING
 
 import random
 import pygame
@@ -7,6 +7,9 @@ import constants
 
 from entities.pipe import Pipe
 
+if TYPE_CHECKING:
+    from managers.atlas_manager import SpriteBatch
+
 
 class PipePair:
     """Manages a pair of pipes (top and bottom) separated by a vertical gap."""
@@ -18,6 +21,9 @@ class PipePair:
         gap: float,
         speed: float,
         color: List[int] = constants.GREEN,
+        top_pipe_height: int | None = None,
+        index: int = 0,
+        fixed_point: bool = False,
     ) -> None:
         """Initializes a pipe pair with a top and bottom pipe.
 
@@ -27,29 +33,45 @@ class PipePair:
             gap (float): Vertical gap between top and bottom pipes in pixels.
             speed (float): Leftward movement speed in pixels per frame.
             color (List[int], optional): RGB color of the pipes. Defaults to constants.GREEN.
+            top_pipe_height (int | None, optional): Height of the top pipe in pixels.
+                Defaults to None, which picks a random height.
+            index (int, optional): Sequence number of the pair within its course. Defaults to 0.
+            fixed_point (bool, optional): Whether to scroll the pipes in fixed point.
+                Defaults to False.
         """
         self.__x = x
         self.__width = width
         self.__gap = gap
         self.__speed = speed
         self.__color = color
+        self.__index = index
 
-        self.__top_pipe_height = random.randint(
-            constants.PIPE_HEIGHT,
-            constants.SCREEN_HEIGHT - self.__gap - constants.PIPE_HEIGHT,
-        )
+        if top_pipe_height is None:
+            top_pipe_height = random.randint(
+                constants.PIPE_HEIGHT,
+                constants.SCREEN_HEIGHT - self.__gap - constants.PIPE_HEIGHT,
+            )
+        self.__top_pipe_height = top_pipe_height
         self.__bottom_pipe_height = constants.SCREEN_HEIGHT - self.__gap - self.__top_pipe_height
+        self.__gap_bottom = self.__top_pipe_height + self.__gap
 
         self.top_pipe = Pipe(
-            self.__x, 0, self.__width, self.__top_pipe_height, self.__speed, self.__color
+            self.__x,
+            0,
+            self.__width,
+            self.__top_pipe_height,
+            self.__speed,
+            self.__color,
+            fixed_point,
         )
         self.bottom_pipe = Pipe(
             self.__x,
-            self.__top_pipe_height + self.__gap,
+            self.__gap_bottom,
             self.__width,
             self.__bottom_pipe_height,
             self.__speed,
             self.__color,
+            fixed_point,
         )
 
     def update(self: PipePair) -> None:
@@ -61,6 +83,30 @@ class PipePair:
         self.top_pipe.update()
         self.bottom_pipe.update()
 
+    def reset(
+        self: PipePair, x: int, gap: float, top_pipe_height: int, index: int
+    ) -> None:
+        """Reuses the pair for a new position in the course, without allocating sprites.
+
+        Args:
+            x (int): Horizontal position of the pair in pixels.
+            gap (float): Vertical gap between top and bottom pipes in pixels.
+            top_pipe_height (int): Height of the top pipe in pixels.
+            index (int): Sequence number of the pair within its course.
+
+        Returns:
+            None
+        """
+        self.__x = x
+        self.__gap = gap
+        self.__index = index
+        self.__top_pipe_height = top_pipe_height
+        self.__bottom_pipe_height = constants.SCREEN_HEIGHT - gap - top_pipe_height
+        self.__gap_bottom = top_pipe_height + gap
+
+        self.top_pipe.reset(x, 0, top_pipe_height)
+        self.bottom_pipe.reset(x, self.__gap_bottom, self.__bottom_pipe_height)
+
     def draw(self: PipePair, screen: pygame.Surface) -> None:
         """Draws both pipes to the given screen.
 
@@ -73,6 +119,18 @@ class PipePair:
         self.top_pipe.draw(screen)
         self.bottom_pipe.draw(screen)
 
+    def queue(self: PipePair, batch: SpriteBatch) -> None:
+        """Queues both pipes for batched drawing.
+
+        Args:
+            batch (SpriteBatch): The frame's batch.
+
+        Returns:
+            None
+        """
+        self.top_pipe.queue(batch)
+        self.bottom_pipe.queue(batch)
+
     def get_pipes(self: PipePair) -> tuple[Pipe, Pipe]:
         """Gets the top and bottom pipe sprites.
 
@@ -80,3 +138,50 @@ class PipePair:
             tuple[Pipe, Pipe]: The top and bottom pipes.
         """
         return self.top_pipe, self.bottom_pipe
+
+    @property
+    def x(self: PipePair) -> float:
+        """Gets the current horizontal position of the pair.
+
+        Returns:
+            float: The x-coordinate in pixels.
+        """
+        return self.top_pipe.x
+
+    @property
+    def gap(self: PipePair) -> float:
+        """Gets the vertical gap between the top and bottom pipes.
+
+        Returns:
+            float: The gap in pixels.
+        """
+        return self.__gap
+
+    @property
+    def top_pipe_height(self: PipePair) -> int:
+        """Gets the height of the top pipe, i.e. the y-coordinate of the gap.
+
+        Returns:
+            int: The top pipe height in pixels.
+        """
+        return self.__top_pipe_height
+
+    @property
+    def gap_bottom(self: PipePair) -> float:
+        """Gets the y-coordinate of the bottom of the gap, i.e. the top of the bottom pipe.
+
+        Computed once per placement, so reading it every frame allocates nothing.
+
+        Returns:
+            float: The bottom of the gap in pixels.
+        """
+        return self.__gap_bottom
+
+    @property
+    def index(self: PipePair) -> int:
+        """Gets the sequence number of the pair within its course.
+
+        Returns:
+            int: The zero-based pair index.
+        """
+        return self.__index
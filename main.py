@@ -1,446 +1,544 @@
 from __future__ import annotations
+from typing import Callable
 
+import time
+
+_STARTUP_BEGIN: float = time.perf_counter()
+
+import argparse
+import atexit
+import os
 import sys
 import pygame
 
 import constants
-from entities import bird
-from managers.game_manager import check_collisions, reset_game
+from entities.bird import Bird
+from entities.course import Course
+from managers.arcade_manager import ArcadeManager
+from managers.atlas_manager import SpriteAtlas, SpriteBatch
+from managers.background_manager import ParallaxBackground
+from managers.course_validator import CourseValidator
+from managers.frame_profiler import FrameProfiler
+from managers.game_states import (
+    TRANSITIONS,
+    GameState,
+    Scene,
+    create_bird_surface,
+    create_screens,
+)
+from managers.ghost_manager import GhostManager, simulate_trajectories
+from managers.leaderboard_manager import LeaderboardManager
+from managers.menu_manager import fonts, handle_keys_pressed_events
 from managers.pipe_manager import PipeManager
+from managers.quality_governor import QualityGovernor
+from managers.race_manager import RaceManager
+from managers.render_manager import FrameBuffer, dim, split_viewports
+from managers.replay_manager import ReplayRecorder, ReplayWriter
+from managers.rollback_manager import RollbackSession, UdpTransport
 from managers.score_manager import ScoreManager
+from managers.simulation_protocol import MAX_ENVIRONMENTS
+from managers.simulation_server import SimulationServer, VectorEnvironment
+from managers.state_machine import State, StateMachine, StateTimer
+from managers.telemetry_manager import TelemetryManager, load_top_runs, open_telemetry
+from utils.scaling import get_scale, scale_point, scale_rect, to_pixels
 
+_STARTUP_IMPORTED: float = time.perf_counter()
 
-# Game states
-class GameState:
-    MENU = "menu"
-    PLAYING = "playing"
-    GAME_OVER = "game_over"
-    CONFIRM_EXIT_MENU = "confirm_exit_menu"
-    CONFIRM_EXIT_GAME_OVER = "confirm_exit_game_over"
+# Fonts only needed by the game over and confirm screens, created while idle
+# (logical sizes, scaled to the framebuffer)
+DEFERRED_FONTS: list[tuple[str, int]] = [("arial", 55), ("arial", 28), ("arial", 48)]
 
+# Arcade mode: jump key, start hint and score label of each player. Labels differ
+# per player so every score keeps its own cached text
+ARCADE_KEYS: list[int] = [pygame.K_SPACE, pygame.K_UP, pygame.K_w, pygame.K_i]
+ARCADE_HINTS: list[str] = [
+    f"Press {name} to fly" for name in ("SPACE", "UP", "W", "I")
+]
+ARCADE_LABELS: list[str] = [
+    f"P{player + 1}: " for player in range(constants.ARCADE_MAX_PLAYERS)
+]
 
-def draw_score(screen: pygame.Surface, score_manager: ScoreManager) -> None:
-    """
-    Draw the current score in the top left corner.
 
-    Args:
-        screen (pygame.Surface): The main display surface.
-        score_manager (ScoreManager): The score manager containing current score.
-    """
-    # Initialize font module if not already done
-    if not pygame.font.get_init():
-        pygame.font.init()
+def handle_events(events: list[pygame.event.Event]) -> bool:
+    """Return False if a QUIT event is processed."""
+    for event in events:
+        if event.type == pygame.QUIT:
+            return False
+    return True
 
-    font = _get_font("arial", 36)
 
-    if font:
-        score_text = font.render(f"Score: {score_manager.score}", True, constants.BLACK)
-        screen.blit(score_text, (20, 20))
-    else:
-        # Draw simple score indicator if font fails
-        pygame.draw.rect(screen, constants.BLACK, (20, 20, 100, 30))
+def draw_race_window(
+    frame_buffer: FrameBuffer, race: RaceManager, local_player: int
+) -> None:
+    """Render one frame of a network race with both players' scores."""
+    screen = frame_buffer.surface
+    scale = frame_buffer.scale
+    screen.fill(constants.WHITE)
+    race.draw(screen)
+
+    font = fonts.get_font("arial", to_pixels(36, scale))
+    for player, score_manager in enumerate(race.score_managers):
+        name = "You" if player == local_player else "Rival"
+        status = "" if race.is_alive(player) else " (out)"
+        y = 20 + player * 40
+        if font:
+            text = font.render(f"{name}: {score_manager.score}{status}", True, constants.BLACK)
+            screen.blit(text, scale_point((20, y), scale))
+        else:
+            pygame.draw.rect(screen, constants.BLACK, scale_rect((20, y, 100, 30), scale))
+
+    if race.finished and font:
+        scores = [manager.score for manager in race.score_managers]
+        if scores[local_player] == scores[1 - local_player]:
+            msg = "DRAW"
+        elif scores[local_player] > scores[1 - local_player]:
+            msg = "YOU WIN"
+        else:
+            msg = "YOU LOSE"
+        result_text = font.render(msg, True, constants.RED)
+        screen.blit(
+            result_text,
+            result_text.get_rect(
+                center=scale_point(
+                    (constants.SCREEN_WIDTH // 2, constants.SCREEN_HEIGHT // 2), scale
+                )
+            ),
+        )
 
+    frame_buffer.present()
 
-def _get_font(font_name: str, size: int) -> pygame.font.Font | None:
+
+def run_race(
+    frame_buffer: FrameBuffer, clock: pygame.time.Clock, args: argparse.Namespace
+) -> None:
     """
-    Get a font object with fallback options.
+    Run a head-to-head race against a peer on the local network.
 
-    Args:
-        font_name: Name of the font (e.g., "arial") or None for default.
-        size: Font size in pixels.
+    Both peers fly the same seeded course; inputs are exchanged over UDP through a
+    rollback session, so the local bird responds without added input delay.
 
-    Returns:
-        pygame.font.Font object or None if all attempts fail.
+    Args:
+        frame_buffer (FrameBuffer): The framebuffer presented to the window.
+        clock (pygame.time.Clock): The frame clock.
+        args (argparse.Namespace): Parsed command-line arguments.
     """
-    if not pygame.font.get_init():
-        pygame.font.init()
+    local_player: int = args.player - 1
+    peer_host, peer_port = args.peer.rsplit(":", 1)
+
+    colors = [constants.GREEN, constants.BLUE]
+    race = RaceManager(
+        [
+            Bird(70, 90, create_bird_surface(color), args.fixed_point)
+            for color in colors
+        ],
+        PipeManager(
+            gap=200,
+            pipe_width=80,
+            speed=4,
+            spawn_distance=300,
+            seed=0 if args.seed is None else args.seed,
+            fixed_point=args.fixed_point,
+        ),
+        [ScoreManager(), ScoreManager()],
+    )
+    session = RollbackSession(
+        race,
+        local_player,
+        UdpTransport(("0.0.0.0", args.race), (peer_host, int(peer_port))),
+    )
 
-    try:
-        return pygame.font.SysFont(font_name, size)
-    except Exception:
-        pass
-    
-    try:
-        return pygame.font.Font(None, size)
-    except Exception:
-        return None
+    running: bool = True
+    while running:
+        clock.tick(constants.FPS)
 
+        events: list[pygame.event.Event] = pygame.event.get()
+        running = handle_events(events)
 
-def _draw_game_over_overlay(screen: pygame.Surface) -> None:
-    """
-    Draw a semi-transparent overlay to dim the background.
+        jump = handle_keys_pressed_events(pygame.key.get_pressed())
+        session.advance(jump)
 
-    Args:
-        screen (pygame.Surface): The main display surface.
+        draw_race_window(frame_buffer, race, local_player)
 
-    Returns:
-        None
-    """
-    overlay = pygame.Surface((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
-    overlay.set_alpha(128)
-    overlay.fill(constants.BLACK)
-    screen.blit(overlay, (0, 0))
+    session.close()
 
 
-def _draw_game_over_texts(screen: pygame.Surface, score_manager: ScoreManager) -> None:
+def draw_arcade_window(
+    frame_buffer: FrameBuffer,
+    arcade: ArcadeManager,
+    viewports: list[pygame.Surface],
+    sprite_batch: SpriteBatch,
+    backgrounds: list[ParallaxBackground],
+) -> None:
     """
-    Draw game over text, final score, and high score.
+    Render every arcade game into its own viewport and present them all at once.
 
     Args:
-        screen (pygame.Surface): The main display surface.
-        score_manager (ScoreManager): The score manager containing final score.
-
-    Returns:
-        None
+        frame_buffer (FrameBuffer): The framebuffer the viewports belong to.
+        arcade (ArcadeManager): The games, one per viewport.
+        viewports (list[pygame.Surface]): Equally sized subsurfaces of the framebuffer.
+        sprite_batch (SpriteBatch): Batch whose atlas was built for the viewport size.
+        backgrounds (list[ParallaxBackground]): Each player's background, built for
+            the viewport size.
     """
-    font = _get_font("arial", 55)
+    scale = get_scale(viewports[0])
+    for player, viewport in enumerate(viewports):
+        backgrounds[player].draw(viewport)
+        arcade.draw(player, viewport, sprite_batch)
+
+        score_text = fonts.render_counter(
+            "arial",
+            to_pixels(36, scale),
+            ARCADE_LABELS[player],
+            arcade.score_managers[player].score,
+            constants.BLACK,
+        )
+        if score_text:
+            viewport.blit(score_text, scale_point((20, 20), scale))
+
+        if not arcade.is_alive(player):
+            dim(viewport, 128)
+            hint_text = fonts.render_text(
+                "arial",
+                to_pixels(36, scale),
+                ARCADE_HINTS[player],
+                constants.WHITE,
+            )
+            if hint_text:
+                viewport.blit(
+                    hint_text,
+                    hint_text.get_rect(
+                        center=scale_point(
+                            (constants.SCREEN_WIDTH // 2, constants.SCREEN_HEIGHT // 2),
+                            scale,
+                        )
+                    ),
+                )
+
+    frame_buffer.present()
+
+
+def run_arcade(
+    frame_buffer: FrameBuffer, clock: pygame.time.Clock, args: argparse.Namespace
+) -> None:
+    """
+    Run a split-screen arcade session: every player flies their own game in one window.
 
-    if font:
-        center_x = constants.SCREEN_WIDTH // 2
-        center_y = constants.SCREEN_HEIGHT // 2
+    Each player starts and restarts their own runs with their jump key; ESC ends the
+    session. All games share one sprite atlas and font cache, are stepped together and
+    are presented with a single flip per frame.
 
-        game_over_text = font.render("GAME OVER", True, constants.RED)
-        text_rect = game_over_text.get_rect(center=(center_x, center_y - 150))
-        screen.blit(game_over_text, text_rect)
+    Args:
+        frame_buffer (FrameBuffer): The framebuffer presented to the window.
+        clock (pygame.time.Clock): The frame clock.
+        args (argparse.Namespace): Parsed command-line arguments.
+    """
+    players: int = args.arcade
+    keys = ARCADE_KEYS[:players]
+    bird_surfaces = [
+        create_bird_surface(color) for color in constants.ARCADE_COLORS[:players]
+    ]
+    arcade = ArcadeManager(bird_surfaces, seed=args.seed)
+
+    # Viewports all have the same size, so one atlas serves them all
+    viewports = split_viewports(frame_buffer.surface, players)
+    sprite_batch = SpriteBatch(SpriteAtlas(viewports[0], bird_surfaces))
+    backgrounds = [ParallaxBackground(viewports[0]) for _ in range(players)]
+    # The area outside the viewports is never drawn again
+    frame_buffer.surface.fill(constants.BLACK)
 
-        score_text = font.render(
-            f"Final Score: {score_manager.score}", True, constants.WHITE
-        )
-        score_rect = score_text.get_rect(center=(center_x, center_y - 80))
-        screen.blit(score_text, score_rect)
+    running: bool = True
+    while running:
+        clock.tick(constants.FPS)
 
-        high_score_text = font.render(
-            f"High Score: {score_manager.high_score}", True, constants.WHITE
-        )
-        high_score_rect = high_score_text.get_rect(center=(center_x, center_y - 20))
-        screen.blit(high_score_text, high_score_rect)
-    else:
-        center_x = constants.SCREEN_WIDTH // 2
-        center_y = constants.SCREEN_HEIGHT // 2
-        rect_width = 300
-        rect_height = 50
-
-        pygame.draw.rect(
-            screen,
-            constants.RED,
-            (center_x - rect_width // 2, center_y - 200, rect_width, rect_height),
-        )
-        pygame.draw.rect(
-            screen,
-            constants.WHITE,
-            (center_x - rect_width // 2, center_y - 130, rect_width, rect_height),
-        )
-        pygame.draw.rect(
-            screen,
-            constants.WHITE,
-            (center_x - rect_width // 2, center_y - 70, rect_width, rect_height),
-        )
+        events: list[pygame.event.Event] = pygame.event.get()
+        running = handle_events(events)
+        for event in events:
+            if event.type != pygame.KEYDOWN:
+                continue
+            if event.key == pygame.K_ESCAPE:
+                running = False
+            elif event.key in keys:
+                player = keys.index(event.key)
+                if not arcade.is_alive(player):
+                    arcade.restart(player)
 
+        keys_pressed = pygame.key.get_pressed()
+        arcade.step([keys_pressed[key] for key in keys])
+        for player, background in enumerate(backgrounds):
+            if arcade.is_alive(player):
+                background.update(arcade.pipe_managers[player].speed)
 
-def _draw_game_over_buttons(screen: pygame.Surface) -> None:
-    """
-    Draw restart and exit buttons with hover effects.
+        draw_arcade_window(frame_buffer, arcade, viewports, sprite_batch, backgrounds)
 
-    Args:
-        screen (pygame.Surface): The main display surface.
-    """
-    buttons = _get_game_over_button_rects()
-    mouse_pos = pygame.mouse.get_pos()
-
-    for name, rect in buttons.items():
-        is_hover = rect.collidepoint(mouse_pos)
-        base_color = (70, 130, 180)  # steel blue
-        hover_color = (100, 149, 237)  # cornflower blue
-        color = hover_color if is_hover else base_color
-        pygame.draw.rect(screen, color, rect, border_radius=8)
-
-        # Button text
-        button_font = _get_font("arial", 36)
-        if button_font:
-            label = "Restart" if name == "restart" else "Exit"
-            text_surf = button_font.render(label, True, constants.WHITE)
-            text_rect = text_surf.get_rect(center=rect.center)
-            screen.blit(text_surf, text_rect)
-
-
-def draw_game_over_menu(screen: pygame.Surface, score_manager: ScoreManager) -> None:
+
+def run_server(args: argparse.Namespace) -> None:
     """
-    Draw the game over menu with restart and exit options.
+    Serve headless games to an external trainer until interrupted, without a window.
 
     Args:
-        screen (pygame.Surface): The main display surface.
-        score_manager (ScoreManager): The score manager containing final score.
+        args (argparse.Namespace): Parsed command-line arguments.
     """
-    _draw_game_over_overlay(screen)
-    _draw_game_over_texts(screen, score_manager)
-    _draw_game_over_buttons(screen)
+    environment = VectorEnvironment(args.envs, seed=args.seed, rays=args.rays)
+    server = SimulationServer(args.serve, environment, shared=args.shared_memory)
+    print(
+        f"Serving {args.envs} environments on {args.serve}"
+        + (f", shared memory {server.shared_memory_name}" if args.shared_memory else ""),
+        file=sys.stderr,
+    )
+    try:
+        server.run()
+    except OSError as error:
+        sys.exit(f"Cannot serve on {args.serve}: {error}")
 
 
-def handle_game_over_input(keys_pressed: pygame.key.ScancodeWrapper) -> str:
+def _governor_levels(
+    quality: str,
+) -> list[tuple[str, str | None, bool, bool, int]]:
     """
-    Handle input during game over menu.
+    Get the governor levels usable with a quality profile: those that keep it, and
+    those whose framebuffer is smaller.
 
     Args:
-        keys_pressed (pygame.key.ScancodeWrapper): Pressed state of all keys.
+        quality (str): The quality profile chosen at startup.
 
     Returns:
-        str: Action to take - "restart", "exit", or "none"
+        list[tuple[str, str | None, bool, bool, int]]: The levels, best first.
     """
-    if keys_pressed[pygame.K_r]:
-        return "restart"
-    if keys_pressed[pygame.K_RETURN] or keys_pressed[pygame.K_SPACE]:
-        return "restart"
-    if keys_pressed[pygame.K_ESCAPE]:
-        return "exit"
-    return "none"
+    width = constants.QUALITY_PROFILES[quality][0]
+    return [
+        level
+        for level in constants.GOVERNOR_LEVELS
+        if level[1] is None or constants.QUALITY_PROFILES[level[1]][0] < width
+    ]
 
 
-def _get_menu_button_rects() -> dict[str, pygame.Rect]:
+def _print_startup_trace(initialized: float, first_frame: float) -> None:
     """
-    Compute rectangles for main menu buttons.
+    Print how long each startup phase took, measured from the start of `main.py`.
 
-    Returns:
-        dict[str, pygame.Rect]: Mapping of button name to its rectangle.
+    Args:
+        initialized (float): `time.perf_counter()` once the window was created.
+        first_frame (float): `time.perf_counter()` once the first frame was flipped.
     """
-    center_x: int = constants.SCREEN_WIDTH // 2
-    total_height: int = constants.BUTTON_HEIGHT * 2 + constants.BUTTON_SPACING
-    origin_y: int = constants.SCREEN_HEIGHT // 2 - total_height // 2
-    start_button_rect = pygame.Rect(
-        center_x - constants.BUTTON_WIDTH // 2,
-        origin_y,
-        constants.BUTTON_WIDTH,
-        constants.BUTTON_HEIGHT,
+    phases = [
+        ("import", _STARTUP_IMPORTED - _STARTUP_BEGIN),
+        ("init", initialized - _STARTUP_IMPORTED),
+        ("first frame", first_frame - initialized),
+        ("total", first_frame - _STARTUP_BEGIN),
+    ]
+    print(
+        "startup: " + ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in phases),
+        file=sys.stderr,
     )
-    exit_button_rect = pygame.Rect(
-        center_x - constants.BUTTON_WIDTH // 2,
-        origin_y + constants.BUTTON_HEIGHT + constants.BUTTON_SPACING,
-        constants.BUTTON_WIDTH,
-        constants.BUTTON_HEIGHT,
-    )
-    return {"start": start_button_rect, "exit": exit_button_rect}
 
 
-def draw_main_menu(screen: pygame.Surface) -> None:
-    """
-    Draw the main menu UI with 'Start' and 'Exit' buttons.
+def _start_frame_profiler(
+    frame_buffer: FrameBuffer, verbose: bool = True
+) -> FrameProfiler:
     """
-    # Title
-    if not pygame.font.get_init():
-        pygame.font.init()
+    Start tracing allocations of the input, update and render phases of each frame.
 
-    title_font = _get_font("arial", 64)
+    Events and the key state snapshot are read before the input phase. Render gets a
+    budget for what pygame's API allocates on its own: the Rect returned by a drawing
+    call (converted to the framebuffer's scale first, at on-screen coordinates).
 
-    if title_font:
-        title_text = title_font.render("Flappy Bird", True, constants.BLACK)
-        title_rect = title_text.get_rect(
-            center=(constants.SCREEN_WIDTH // 2, constants.SCREEN_HEIGHT // 2 - 140)
-        )
-        screen.blit(title_text, title_rect)
-
-    # Buttons
-    buttons = _get_menu_button_rects()
-    mouse_pos = pygame.mouse.get_pos()
-
-    for name, rect in buttons.items():
-        is_hover = rect.collidepoint(mouse_pos)
-        base_color = (70, 130, 180)  # steel blue
-        hover_color = (100, 149, 237)  # cornflower blue
-        color = hover_color if is_hover else base_color
-        pygame.draw.rect(screen, color, rect, border_radius=8)
-
-        # Button text
-        button_font = _get_font("arial", 36)
-
-        if button_font:
-            label = "Start" if name == "start" else "Exit"
-            text_surf = button_font.render(label, True, constants.WHITE)
-            text_rect = text_surf.get_rect(center=rect.center)
-            screen.blit(text_surf, text_rect)
-
-
-def _get_confirm_exit_button_rects() -> dict[str, pygame.Rect]:
-    center_x: int = constants.SCREEN_WIDTH // 2
-    origin_y: int = constants.SCREEN_HEIGHT // 2 + 30
-    yes_rect = pygame.Rect(
-        center_x - constants.BUTTON_WIDTH - constants.BUTTON_SPACING // 2,
-        origin_y,
-        constants.BUTTON_WIDTH,
-        constants.BUTTON_HEIGHT,
-    )
-    no_rect = pygame.Rect(
-        center_x + constants.BUTTON_SPACING // 2,
-        origin_y,
-        constants.BUTTON_WIDTH,
-        constants.BUTTON_HEIGHT,
-    )
-    return {"yes": yes_rect, "no": no_rect}
-
-
-def draw_confirm_exit(screen: pygame.Surface) -> None:
-    # modal overlay
-    modal = pygame.Surface((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
-    modal.set_alpha(180)
-    modal.fill((0, 0, 0))
-    screen.blit(modal, (0, 0))
-
-    if not pygame.font.get_init():
-        pygame.font.init()
-
-    title_font = _get_font("arial", 48)
-
-    if title_font:
-        msg = "Are you sure you want to exit?"
-        title_text = title_font.render(msg, True, constants.WHITE)
-        title_rect = title_text.get_rect(
-            center=(constants.SCREEN_WIDTH // 2, constants.SCREEN_HEIGHT // 2 - 40)
-        )
-        screen.blit(title_text, title_rect)
-
-    buttons = _get_confirm_exit_button_rects()
-    mouse_pos = pygame.mouse.get_pos()
-    for name, rect in buttons.items():
-        is_hover = rect.collidepoint(mouse_pos)
-        base_color = (178, 34, 34) if name == "yes" else (70, 130, 180)
-        hover_color = (220, 20, 60) if name == "yes" else (100, 149, 237)
-        color = hover_color if is_hover else base_color
-        pygame.draw.rect(screen, color, rect, border_radius=8)
-
-        button_font = _get_font("arial", 36)
-        if button_font:
-            label = "Yes" if name == "yes" else "No"
-            text_surf = button_font.render(label, True, constants.WHITE)
-            text_rect = text_surf.get_rect(center=rect.center)
-            screen.blit(text_surf, text_rect)
-
-
-def handle_main_menu_input(events: list[pygame.event.Event]) -> str:
-    """
-    Handle input for the main menu.
+    Args:
+        frame_buffer (FrameBuffer): The framebuffer frames are drawn into.
+        verbose (bool, optional): Whether to report every frame that allocated.
+            Defaults to True.
 
     Returns:
-        str: "start", "exit", or "none"
-    """
-    buttons = _get_menu_button_rects()
-    for event in events:
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if buttons["start"].collidepoint(event.pos):
-                return "start"
-            if buttons["exit"].collidepoint(event.pos):
-                return "exit"
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                return "start"
-            if event.key == pygame.K_ESCAPE:
-                return "exit"
-    return "none"
-
-
-def _get_game_over_button_rects() -> dict[str, pygame.Rect]:
+        FrameProfiler: The running profiler.
     """
-    Compute rectangles for Game Over buttons (Restart, Exit) with same style as main menu.
-    """
-    center_x: int = constants.SCREEN_WIDTH // 2
-    # Place buttons below the score block
-    origin_y: int = constants.SCREEN_HEIGHT // 2 + 30
-    restart_rect = pygame.Rect(
-        center_x - constants.BUTTON_WIDTH // 2,
-        origin_y,
-        constants.BUTTON_WIDTH,
-        constants.BUTTON_HEIGHT,
+    profiler = FrameProfiler(verbose=verbose)
+    profiler.start()
+
+    scale = frame_buffer.scale
+    calibration = pygame.Rect(
+        constants.SCREEN_WIDTH // 2,
+        constants.SCREEN_HEIGHT // 2,
+        constants.SCREEN_WIDTH // 2,
+        constants.SCREEN_HEIGHT // 2,
     )
-    exit_rect = pygame.Rect(
-        center_x - constants.BUTTON_WIDTH // 2,
-        origin_y + constants.BUTTON_HEIGHT + constants.BUTTON_SPACING,
-        constants.BUTTON_WIDTH,
-        constants.BUTTON_HEIGHT,
+    profiler.set_budget(
+        "render",
+        profiler.measure(
+            lambda: pygame.draw.rect(
+                frame_buffer.surface,
+                constants.WHITE,
+                calibration if scale == 1.0 else scale_rect(calibration, scale),
+            )
+        ),
     )
-    return {"restart": restart_rect, "exit": exit_rect}
+    return profiler
 
 
-def handle_game_over_input_events(events: list[pygame.event.Event]) -> str:
-    """
-    Handle mouse/keyboard events for Game Over menu (clickable buttons).
+def _phase_hook(
+    profiler: FrameProfiler | None, timer: StateTimer | None
+) -> Callable[[str, str], None] | None:
     """
-    buttons = _get_game_over_button_rects()
-    for event in events:
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if buttons["restart"].collidepoint(event.pos):
-                return "restart"
-            if buttons["exit"].collidepoint(event.pos):
-                return "exit"
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_RETURN, pygame.K_SPACE, pygame.K_r):
-                return "restart"
-            if event.key == pygame.K_ESCAPE:
-                return "exit"
-    return "none"
+    Build the phase hook of the game's state machine from the enabled reports.
 
+    Args:
+        profiler (FrameProfiler | None): Traces the phases of PLAYING frames.
+        timer (StateTimer | None): Times the phases of every state.
 
-def handle_confirm_exit_input(events: list[pygame.event.Event]) -> str:
-    """
-    Handle input for the confirm-exit modal.
-    Returns: "yes", "no", or "none"
+    Returns:
+        Callable[[str, str], None] | None: The hook, None if both are disabled.
     """
-    buttons = _get_confirm_exit_button_rects()
-    for event in events:
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if buttons["yes"].collidepoint(event.pos):
-                return "yes"
-            if buttons["no"].collidepoint(event.pos):
-                return "no"
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_y, pygame.K_RETURN):
-                return "yes"
-            if event.key in (pygame.K_n, pygame.K_ESCAPE):
-                return "no"
-    return "none"
-
-
-def draw_window(
-    screen: pygame.Surface,
-    pipe_manager: PipeManager,
-    game_state: str = GameState.PLAYING,
-    score_manager: ScoreManager | None = None,
-) -> None:
-    """Render the current frame based on game state."""
-    screen.fill(constants.WHITE)
-
-    if game_state == GameState.MENU:
-        draw_main_menu(screen)
-    elif game_state == GameState.CONFIRM_EXIT_MENU:
-        draw_main_menu(screen)
-        draw_confirm_exit(screen)
-    else:
-        pipe_manager.draw(screen)
-        bird.draw(screen)
+    if profiler is None and timer is None:
+        return None
 
-        if game_state == GameState.PLAYING and score_manager:
-            draw_score(screen, score_manager)
+    def on_phase(state: str, phase: str) -> None:
+        if timer is not None:
+            timer(state, phase)
+        # Only PLAYING frames are traced: menus render their text every frame
+        if profiler is not None and state == GameState.PLAYING:
+            if phase == "end":
+                profiler.end_frame()
+                return
+            if phase == "input":
+                profiler.begin_frame()
+            profiler.begin_phase(phase)
 
-        if game_state == GameState.GAME_OVER and score_manager:
-            draw_game_over_menu(screen, score_manager)
-        elif game_state == GameState.CONFIRM_EXIT_GAME_OVER and score_manager:
-            draw_game_over_menu(screen, score_manager)
-            draw_confirm_exit(screen)
+    return on_phase
 
-    pygame.display.flip()
 
+def _report_state_timing(timer: StateTimer) -> None:
+    """
+    Print the mean time per frame of every state and phase to stderr.
 
-def handle_events(events: list[pygame.event.Event]) -> bool:
-    """Return False if a QUIT event is processed."""
-    for event in events:
-        if event.type == pygame.QUIT:
-            return False
-    return True
+    Args:
+        timer (StateTimer): The timer fed by the state machine.
+    """
+    print(timer.report(), file=sys.stderr)
 
 
-def handle_keys_pressed_events(keys_pressed: pygame.key.ScancodeWrapper) -> None:
-    """Handle per-frame keyboard state (escape to quit, space to jump)."""
-    if keys_pressed[pygame.K_ESCAPE]:
-        sys.exit(1)
+def _report_allocations(profiler: FrameProfiler) -> None:
+    """
+    Print the allocation summary of all traced frames to stderr and stop tracing.
 
-    if keys_pressed[pygame.K_SPACE]:
-        bird.jump()
+    Args:
+        profiler (FrameProfiler): The running profiler.
+    """
+    profiler.stop()
+    print(profiler.report(), file=sys.stderr)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Minimal Flappy Bird")
+    parser.add_argument(
+        "--race",
+        type=int,
+        metavar="PORT",
+        help="start a two-player network race listening on this UDP port",
+    )
+    parser.add_argument(
+        "--peer", metavar="HOST:PORT", help="address of the other racer"
+    )
+    parser.add_argument(
+        "--player", type=int, choices=[1, 2], default=1, help="player slot in the race"
+    )
+    parser.add_argument(
+        "--seed", type=int, help="seed for the pipe course (races default to 0)"
+    )
+    parser.add_argument(
+        "--arcade",
+        type=int,
+        metavar="N",
+        choices=range(2, constants.ARCADE_MAX_PLAYERS + 1),
+        help="split the window between N local players, each flying their own game",
+    )
+    parser.add_argument(
+        "--serve",
+        metavar="SOCKET",
+        help="serve headless games to a trainer on this Unix socket instead of playing",
+    )
+    parser.add_argument(
+        "--envs", type=int, default=64, help="number of games served with --serve"
+    )
+    parser.add_argument(
+        "--rays",
+        type=int,
+        default=0,
+        help="rays cast in every observation served with --serve",
+    )
+    parser.add_argument(
+        "--shared-memory",
+        action="store_true",
+        help="let --serve clients exchange batches through shared memory",
+    )
+    parser.add_argument(
+        "--course", metavar="PATH", help="fly an authored binary course file"
+    )
+    parser.add_argument(
+        "--gap-policy",
+        choices=["random", "reject", "repair"],
+        default="random",
+        help="how generated gaps unreachable from the previous one are handled "
+        "(at the default gap and spacing, every gap is reachable)",
+    )
+    parser.add_argument(
+        "--telemetry", metavar="PATH", help="record per-run telemetry to this SQLite file"
+    )
+    parser.add_argument(
+        "--ghosts",
+        type=int,
+        metavar="N",
+        help="fly against ghosts of this session's runs and the N best --telemetry runs",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="save a replay of every finished run to this file, replacing the previous one",
+    )
+    parser.add_argument(
+        "--fixed-point",
+        action="store_true",
+        help="integrate bird and pipe physics in integer subpixels, identically everywhere",
+    )
+    parser.add_argument(
+        "--profile", default="default", help="player profile for the leaderboard"
+    )
+    parser.add_argument(
+        "--quality",
+        choices=list(constants.QUALITY_PROFILES),
+        default=constants.DEFAULT_QUALITY,
+        help="internal render resolution, scaled to the window",
+    )
+    parser.add_argument(
+        "--no-governor",
+        action="store_true",
+        help="keep full render quality even when frames take longer than their budget",
+    )
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help="print import, init and first-frame timings to stderr",
+    )
+    parser.add_argument(
+        "--trace-allocations",
+        action="store_true",
+        help="report allocations and GC pauses of every PLAYING frame to stderr",
+    )
+    parser.add_argument(
+        "--state-timing",
+        action="store_true",
+        help="report the mean input, update and render time of every screen to stderr",
+    )
+    parser.add_argument(
+        "--scores",
+        metavar="PATH",
+        default=constants.SCORES_PATH,
+        help="SQLite file holding persistent high scores",
+    )
+    args = parser.parse_args(argv)
+    if args.race is not None and not args.peer:
+        parser.error("--race requires --peer")
+    if not 1 <= args.envs <= MAX_ENVIRONMENTS:
+        parser.error(f"--envs must be between 1 and {MAX_ENVIRONMENTS}")
+    return args
 
 
 def main() -> None:
@@ -451,126 +549,183 @@ def main() -> None:
     then runs the main loop:
     - Cap frame rate to `FPS`.
     - Fetch and handle events (terminate on quit).
-    - Update bird motion and pipe positions.
-    - Handle key states (ESC to exit, SPACE to jump).
-    - Render the current frame.
+    - Run the current screen's input, update and render through the state machine,
+      which follows its actions to the next screen (`TRANSITIONS`).
 
     The loop continues until exit; then the display module is shut down.
+    With `--race`, a two-player network race is run instead, and with `--arcade`, a
+    split-screen session for several local players; with `--course`, pipes are
+    streamed from an authored course file. Unless `--no-governor` is given, render
+    quality is lowered while frames miss their budget. With `--serve`, no window is opened and
+    headless games are served to a trainer instead.
     """
-    pygame.display.init()
-    pygame.font.init()  # Initialize font module
+    args = parse_args()
 
-    running: bool = True
+    if args.serve:
+        run_server(args)
+        return
+
+    # The font module is initialized on first use by the font manager
+    pygame.display.init()
 
     screen: pygame.Surface = pygame.display.set_mode(
         [constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT]
     )
     pygame.display.set_caption("Flappy Bird")
+    frame_buffer: FrameBuffer = FrameBuffer.from_quality(screen, args.quality)
+    startup_initialized: float = time.perf_counter()
 
     clock: pygame.time.Clock = pygame.time.Clock()
 
-    BIRD_SIZE: int = 50
-
-    # Bird surface
-    bird_surface: pygame.Surface = pygame.Surface([BIRD_SIZE, BIRD_SIZE])
-    bird_surface.fill(constants.BLACK)
-    pygame.draw.circle(
-        bird_surface, constants.GREEN, [BIRD_SIZE // 2, BIRD_SIZE // 2], 20
+    if args.race is not None:
+        run_race(frame_buffer, clock, args)
+        pygame.display.quit()
+        return
+
+    if args.arcade is not None:
+        run_arcade(frame_buffer, clock, args)
+        pygame.display.quit()
+        return
+
+    bird_surface: pygame.Surface = create_bird_surface(constants.GREEN)
+    course: Course | None = None
+    if args.course:
+        try:
+            course = Course(args.course)
+        except (OSError, ValueError) as error:
+            sys.exit(f"Cannot fly course {args.course}: {error}")
+    validator: CourseValidator | None = (
+        CourseValidator(gap=200, spacing=300, speed=4, mode=args.gap_policy)
+        if args.gap_policy != "random"
+        else None
     )
-
     pipe_manager: PipeManager = PipeManager(
-        gap=200, pipe_width=80, speed=4, spawn_distance=300
+        gap=200,
+        pipe_width=80,
+        speed=4,
+        spawn_distance=300,
+        seed=args.seed,
+        course=course,
+        validator=validator,
+        fixed_point=args.fixed_point,
     )
 
-    # Initialize ScoreManager
-    score_manager: ScoreManager = ScoreManager()
+    # Initialize ScoreManager with the persistent leaderboard
+    leaderboard: LeaderboardManager = LeaderboardManager(args.scores)
+    atexit.register(leaderboard.close)
+    # Authored courses keep boards apart from generated ones, by resolved file path
+    score_manager: ScoreManager = ScoreManager(
+        leaderboard,
+        args.profile,
+        args.seed,
+        os.path.realpath(args.course) if args.course else None,
+    )
+
+    # Telemetry is flushed on exit, including ESC during play
+    telemetry: TelemetryManager | None = (
+        open_telemetry(args.telemetry) if args.telemetry else None
+    )
+    if telemetry is not None:
+        atexit.register(telemetry.close)
+
+    # Replays are written off the game loop; the last one is saved on exit
+    replay_recorder: ReplayRecorder | None = None
+    replay_writer: ReplayWriter | None = None
+    if args.record:
+        replay_recorder = ReplayRecorder(args.course, args.gap_policy)
+        replay_writer = ReplayWriter(args.record)
+        atexit.register(replay_writer.close)
+
+    # Ghosts replay the best recorded runs, then every run of this session
+    ghost_manager: GhostManager | None = None
+    if args.ghosts is not None:
+        ghost_surface: pygame.Surface = create_bird_surface(constants.BLUE)
+        ghost_surface.set_colorkey(constants.BLACK)
+        ghost_manager = GhostManager(ghost_surface)
+        if args.ghosts > 0 and args.telemetry and os.path.exists(args.telemetry):
+            ghost_manager.extend(
+                simulate_trajectories(
+                    load_top_runs(args.telemetry, args.ghosts),
+                    fixed_point=args.fixed_point,
+                )
+            )
+
+    profiler: FrameProfiler | None = None
+    if args.trace_allocations:
+        profiler = _start_frame_profiler(frame_buffer)
+        atexit.register(_report_allocations, profiler)
+
+    # Long frames make the governor step quality down, and back up once frames have
+    # headroom again. Allocation tracing slows every frame, so it keeps full quality
+    adaptive: bool = not args.no_governor and not args.trace_allocations
+    governor: QualityGovernor = (
+        QualityGovernor(_governor_levels(args.quality)) if adaptive else QualityGovernor()
+    )
 
     # Initialize Bird object
-    global bird
-    bird = bird.Bird(70, 90, bird_surface)
+    bird: Bird = Bird(70, 90, bird_surface, args.fixed_point)
 
-    # Game state
-    game_state = GameState.MENU
+    # Every screen is a state; a frame is one call into the current one
+    scene: Scene = Scene(
+        frame_buffer, bird, bird_surface, pipe_manager, governor, ghost_manager
+    )
+    states: list[State] = list(
+        create_screens(
+            scene, score_manager, telemetry, replay_recorder, replay_writer
+        ).values()
+    )
 
-    # Track last pipe passed for scoring
-    last_pipe_passed = None
+    timer: StateTimer | None = None
+    if args.state_timing:
+        timer = StateTimer()
+        atexit.register(_report_state_timing, timer)
+
+    machine: StateMachine = StateMachine(
+        states, TRANSITIONS, GameState.MENU, _phase_hook(profiler, timer)
+    )
+    machine.start()
+
+    first_frame: bool = True
 
     # Game loop
-    while running:
+    while machine.running:
         # Set the FPS to 60
         clock.tick(constants.FPS)
+        frame_start: float = time.perf_counter()
 
         # Get events
         events: list[pygame.event.Event] = pygame.event.get()
 
         # Handle events
-        running = handle_events(events)
+        if not handle_events(events):
+            machine.stop()
+            break
 
         # Get keys pressed
         keys_pressed: pygame.key.ScancodeWrapper = pygame.key.get_pressed()
 
-        if game_state == GameState.MENU:
-            # Handle input in main menu
-            action = handle_main_menu_input(events)
-            if action == "start":
-                reset_game(bird, pipe_manager, score_manager)
-                game_state = GameState.PLAYING
-                last_pipe_passed = None
-            elif action == "exit":
-                game_state = GameState.CONFIRM_EXIT_MENU
-
-        elif game_state == GameState.CONFIRM_EXIT_MENU:
-            confirm = handle_confirm_exit_input(events)
-            if confirm == "yes":
-                running = False
-            elif confirm == "no":
-                game_state = GameState.MENU
-
-        elif game_state == GameState.PLAYING:
-            # Movement
-            bird.movement()
-
-            pipe_manager.update()
-
-            # Handle keys pressed
-            handle_keys_pressed_events(keys_pressed)
-
-            # Check for scoring (when bird passes a pipe)
-            for pipe_pair in pipe_manager._PipeManager__pipes:
-                if (
-                    pipe_pair.top_pipe.rect.right < bird.rect.left
-                    and pipe_pair != last_pipe_passed
-                ):
-                    score_manager.increment_score()
-                    last_pipe_passed = pipe_pair
-
-            # Check for collisions
-            if check_collisions(bird, pipe_manager):
-                score_manager.update_high_score()
-                game_state = GameState.GAME_OVER
-
-        elif game_state == GameState.GAME_OVER:
-            # Handle input in game over menu (mouse + keyboard)
-            action = handle_game_over_input_events(events)
-            if action == "none":
-                # fallback to continuous key state for convenience
-                action = handle_game_over_input(keys_pressed)
-            if action == "restart":
-                reset_game(bird, pipe_manager, score_manager)
-                game_state = GameState.PLAYING
-                last_pipe_passed = None
-            elif action == "exit":
-                game_state = GameState.CONFIRM_EXIT_GAME_OVER
-
-        elif game_state == GameState.CONFIRM_EXIT_GAME_OVER:
-            confirm = handle_confirm_exit_input(events)
-            if confirm == "yes":
-                running = False
-            elif confirm == "no":
-                game_state = GameState.GAME_OVER
-
-        # Draw window
-        draw_window(screen, pipe_manager, game_state, score_manager)
+        # Input, update and render of the current state
+        machine.frame(events, keys_pressed)
+
+        if first_frame:
+            first_frame = False
+            if args.startup_trace:
+                _print_startup_trace(startup_initialized, time.perf_counter())
+            fonts.defer(
+                [
+                    (name, to_pixels(size, scene.frame_buffer.scale))
+                    for name, size in DEFERRED_FONTS
+                ]
+            )
+        elif machine.state != GameState.PLAYING:
+            fonts.warm_step()
+
+        if adaptive and governor.record(time.perf_counter() - frame_start):
+            size = constants.QUALITY_PROFILES[governor.profile or args.quality]
+            scene.resize(screen, size)
+
+    if course is not None:
+        course.close()
 
     pygame.display.quit()
 
@@ -0,0 +1,147 @@
+from __future__ import annotations
+from typing import Sequence, TYPE_CHECKING
+from entities.bird import Bird
+from managers.game_manager import reset_game, step_playing
+from managers.pipe_manager import PipeManager
+from managers.score_manager import ScoreManager
+
+import pygame
+
+if TYPE_CHECKING:
+    from managers.atlas_manager import SpriteBatch
+
+
+class ArcadeManager:
+    """Runs several independent single-player games side by side, as on a shared cabinet.
+
+    Every player flies their own bird over their own pipe course and restarts on their
+    own. All games are simulated together in one pass per frame and drawn through one
+    shared sprite batch, so the work per frame grows only with the sprites on screen.
+    """
+
+    def __init__(
+        self: ArcadeManager,
+        bird_surfaces: Sequence[pygame.Surface],
+        seed: int | None = None,
+    ) -> None:
+        """Initializes one game per bird surface, each waiting for `restart` to start.
+
+        Args:
+            bird_surfaces (Sequence[pygame.Surface]): One bird sprite per player.
+            seed (int | None, optional): Seed of every player's course; seeded players
+                fly the same pipes. Defaults to None (an independent course each).
+        """
+        self.__birds: list[Bird] = [Bird(70, 90, surface) for surface in bird_surfaces]
+        self.__pipe_managers: list[PipeManager] = [
+            PipeManager(gap=200, pipe_width=80, speed=4, spawn_distance=300, seed=seed)
+            for _ in self.__birds
+        ]
+        self.__score_managers: list[ScoreManager] = [ScoreManager() for _ in self.__birds]
+        self.__alive: list[bool] = [False] * len(self.__birds)
+        self.__last_passed: list[int] = [-1] * len(self.__birds)
+
+    def step(self: ArcadeManager, jumps: Sequence[bool]) -> None:
+        """Advances every game that is still running by one frame.
+
+        Args:
+            jumps (Sequence[bool]): Jump input of each player for this frame.
+
+        Returns:
+            None
+        """
+        alive = self.__alive
+        for player in range(len(alive)):
+            if alive[player]:
+                last_passed, crashed = step_playing(
+                    self.__birds[player],
+                    self.__pipe_managers[player],
+                    self.__score_managers[player],
+                    jumps[player],
+                    self.__last_passed[player],
+                )
+                self.__last_passed[player] = last_passed
+                if crashed:
+                    self.__score_managers[player].update_high_score()
+                    alive[player] = False
+
+    def restart(self: ArcadeManager, player: int) -> None:
+        """Starts a run for one player, leaving the other games untouched.
+
+        Args:
+            player (int): Index of the player.
+
+        Returns:
+            None
+        """
+        reset_game(
+            self.__birds[player],
+            self.__pipe_managers[player],
+            self.__score_managers[player],
+        )
+        self.__alive[player] = True
+        self.__last_passed[player] = -1
+
+    def draw(
+        self: ArcadeManager, player: int, screen: pygame.Surface, batch: SpriteBatch
+    ) -> None:
+        """Draws one player's pipes and bird into their viewport.
+
+        Args:
+            player (int): Index of the player.
+            screen (pygame.Surface): The player's viewport; must have the size of the
+                surface the batch's atlas was built for.
+            batch (SpriteBatch): The batch shared by every viewport.
+
+        Returns:
+            None
+        """
+        self.__pipe_managers[player].queue(batch)
+        self.__birds[player].queue(batch)
+        batch.flush(screen)
+
+    def is_alive(self: ArcadeManager, player: int) -> bool:
+        """Checks whether a player's bird is still flying.
+
+        Args:
+            player (int): Index of the player.
+
+        Returns:
+            bool: True if the player has started a run that has not crashed yet.
+        """
+        return self.__alive[player]
+
+    @property
+    def players(self: ArcadeManager) -> int:
+        """Gets the number of players.
+
+        Returns:
+            int: The number of games.
+        """
+        return len(self.__birds)
+
+    @property
+    def birds(self: ArcadeManager) -> list[Bird]:
+        """Gets the per-player birds.
+
+        Returns:
+            list[Bird]: One bird per player.
+        """
+        return self.__birds
+
+    @property
+    def pipe_managers(self: ArcadeManager) -> list[PipeManager]:
+        """Gets the per-player pipe courses.
+
+        Returns:
+            list[PipeManager]: One pipe manager per player.
+        """
+        return self.__pipe_managers
+
+    @property
+    def score_managers(self: ArcadeManager) -> list[ScoreManager]:
+        """Gets the per-player score managers.
+
+        Returns:
+            list[ScoreManager]: One score manager per player.
+        """
+        return self.__score_managers
@@ -0,0 +1,242 @@
+"""Display-format sprite atlas and batched sprite drawing.
+
+Every sprite a frame needs is scaled to the framebuffer's resolution once and packed
+into a single surface in the framebuffer's pixel format, so blits from it never convert
+pixels. Pipes have no image of their own: each pipe color gets a full-height column in
+the atlas, and a pipe is drawn as the slice of that column matching its size.
+
+A `SpriteBatch` collects the blits of a frame and issues them with a single
+`Surface.blits` call. Its entries are reused from frame to frame, so queuing and
+flushing the sprites of a steady frame allocates nothing but the ints of its coordinates.
+"""
+from __future__ import annotations
+from typing import Any
+
+import pygame
+import constants
+
+from utils.scaling import get_scale, scale_point, to_pixels
+
+
+class SpriteAtlas:
+    """Sprites and pipe columns packed into one surface at the target's scale."""
+
+    def __init__(
+        self: SpriteAtlas,
+        target: pygame.Surface,
+        sprites: list[pygame.Surface],
+        pipe_width: int = constants.PIPE_WIDTH,
+        pipe_colors: list[list[int]] | None = None,
+    ) -> None:
+        """Scales and packs the sprites, then converts the atlas to the target's format.
+
+        Args:
+            target (pygame.Surface): The surface the atlas will be drawn on, usually the
+                framebuffer; its width sets the scale.
+            sprites (list[pygame.Surface]): Sprites at logical size, e.g. the bird.
+            pipe_width (int, optional): Logical width of the pipes.
+                Defaults to constants.PIPE_WIDTH.
+            pipe_colors (list[list[int]] | None, optional): Colors of the pipes.
+                Defaults to [constants.GREEN].
+        """
+        self.__scale: float = get_scale(target)
+        scaled = [self.__scale_sprite(sprite) for sprite in sprites]
+
+        # Scaled pipe edges are rounded separately, so a slice may be a pixel wider
+        column_width = to_pixels(pipe_width, self.__scale) + 1
+        colors = pipe_colors if pipe_colors is not None else [constants.GREEN]
+        width = sum(sprite.get_width() for sprite in scaled) + column_width * len(colors)
+        height = max([target.get_height()] + [sprite.get_height() for sprite in scaled])
+
+        atlas = pygame.Surface((max(width, 1), height))
+        self.__regions: dict[pygame.Surface, pygame.Rect] = {}
+        x = 0
+        for sprite, image in zip(sprites, scaled):
+            self.__regions[sprite] = atlas.blit(image, (x, 0))
+            x += image.get_width()
+
+        self.__columns: dict[tuple[int, ...], pygame.Rect] = {}
+        for color in colors:
+            self.__columns[tuple(color)] = atlas.fill(
+                color, (x, 0, column_width, target.get_height())
+            )
+            x += column_width
+
+        self.__surface: pygame.Surface = atlas.convert(target)
+
+    def __scale_sprite(self: SpriteAtlas, sprite: pygame.Surface) -> pygame.Surface:
+        """Scales a logical sprite to the atlas's resolution.
+
+        Args:
+            sprite (pygame.Surface): The sprite at logical size.
+
+        Returns:
+            pygame.Surface: The sprite at the atlas's scale.
+        """
+        if self.__scale == 1.0:
+            return sprite
+        return pygame.transform.smoothscale(
+            sprite, scale_point(sprite.get_size(), self.__scale)
+        )
+
+    def get_region(self: SpriteAtlas, sprite: pygame.Surface) -> pygame.Rect:
+        """Gets where a sprite was packed.
+
+        Args:
+            sprite (pygame.Surface): A sprite passed to the constructor.
+
+        Returns:
+            pygame.Rect: The sprite's area within the atlas.
+
+        Raises:
+            KeyError: If the sprite is not in the atlas.
+        """
+        return self.__regions[sprite]
+
+    def get_column(self: SpriteAtlas, color: list[int] | tuple[int, ...]) -> pygame.Rect:
+        """Gets the pipe column of a color.
+
+        Args:
+            color (list[int] | tuple[int, ...]): A color passed to the constructor.
+
+        Returns:
+            pygame.Rect: The column's area within the atlas.
+
+        Raises:
+            KeyError: If the color has no column.
+        """
+        return self.__columns[tuple(color)]
+
+    @property
+    def surface(self: SpriteAtlas) -> pygame.Surface:
+        """Gets the atlas surface, in the target's pixel format.
+
+        Returns:
+            pygame.Surface: The atlas.
+        """
+        return self.__surface
+
+    @property
+    def scale(self: SpriteAtlas) -> float:
+        """Gets the number of atlas pixels per logical unit.
+
+        Returns:
+            float: The scale factor of the target the atlas was built for.
+        """
+        return self.__scale
+
+
+class SpriteBatch:
+    """Collects the atlas blits of a frame and draws them with one call."""
+
+    def __init__(self: SpriteBatch, atlas: SpriteAtlas) -> None:
+        """Creates an empty batch drawing from the given atlas.
+
+        Args:
+            atlas (SpriteAtlas): The atlas every queued sprite comes from.
+        """
+        self.__atlas = atlas
+        self.__scale: float = atlas.scale
+        # [atlas surface, destination, area] per blit, reused by later frames
+        self.__entries: list[list[Any]] = []
+        self.__count: int = 0
+        self.__used: int = 0
+
+    def __next_entry(self: SpriteBatch) -> list[Any]:
+        """Gets the next free entry, creating one if the batch has never been this long.
+
+        Returns:
+            list[Any]: The entry.
+        """
+        if self.__count == len(self.__entries):
+            self.__entries.append(
+                [self.__atlas.surface, pygame.Rect(0, 0, 0, 0), pygame.Rect(0, 0, 0, 0)]
+            )
+        entry = self.__entries[self.__count]
+        self.__count += 1
+        return entry
+
+    def add_sprite(self: SpriteBatch, sprite: pygame.Surface, x: float, y: float) -> None:
+        """Queues a sprite at a logical position.
+
+        Args:
+            sprite (pygame.Surface): A sprite packed into the atlas.
+            x (float): Logical x of the sprite's top left corner.
+            y (float): Logical y of the sprite's top left corner.
+
+        Returns:
+            None
+        """
+        entry = self.__next_entry()
+        entry[2].update(self.__atlas.get_region(sprite))
+        destination = entry[1]
+        if self.__scale == 1.0:
+            # Truncated like `Surface.blit` does; Rect attributes would round
+            destination.x = int(x)
+            destination.y = int(y)
+        else:
+            destination.x = round(x * self.__scale)
+            destination.y = round(y * self.__scale)
+
+    def add_fill(
+        self: SpriteBatch, rect: pygame.Rect, color: list[int] | tuple[int, ...]
+    ) -> None:
+        """Queues a solid rectangle, drawn as a slice of the color's pipe column.
+
+        Args:
+            rect (pygame.Rect): The logical rectangle; its edges are rounded like
+                `scale_rect` does.
+            color (list[int] | tuple[int, ...]): A pipe color packed into the atlas.
+
+        Returns:
+            None
+        """
+        entry = self.__next_entry()
+        column = self.__atlas.get_column(color)
+        destination = entry[1]
+        area = entry[2]
+        area.x = column.x
+        area.y = 0
+        if self.__scale == 1.0:
+            destination.x = rect.x
+            destination.y = rect.y
+            area.width = rect.width
+            area.height = rect.height
+            return
+
+        scale = self.__scale
+        left = round(rect.x * scale)
+        top = round(rect.y * scale)
+        destination.x = left
+        destination.y = top
+        area.width = round(rect.right * scale) - left
+        area.height = round(rect.bottom * scale) - top
+
+    def flush(self: SpriteBatch, screen: pygame.Surface) -> None:
+        """Draws every queued sprite in order and empties the batch.
+
+        Args:
+            screen (pygame.Surface): The surface the atlas was built for.
+
+        Returns:
+            None
+        """
+        # Entries beyond this frame's count stay in the list as empty blits, so the
+        # list never shrinks and regrows
+        entries = self.__entries
+        i = self.__count
+        while i < self.__used:
+            entries[i][2].width = 0
+            i += 1
+        self.__used = self.__count
+        self.__count = 0
+        screen.blits(entries, doreturn=False)
+
+    @property
+    def atlas(self: SpriteBatch) -> SpriteAtlas:
+        """Gets the atlas the batch draws from.
+
+        Returns:
+            SpriteAtlas: The atlas.
+        """
+        return self.__atlas
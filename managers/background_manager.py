@@ -0,0 +1,215 @@
+"""Parallax scrolling backgrounds.
+
+Every layer is painted once, at the target's resolution, into a strip as wide as the
+target and converted to the target's pixel format. The strips tile horizontally, so a
+layer scrolled by any distance is drawn with two blits: the strip shifted left, and the
+same strip again right behind it. All layers of a frame go out in one `Surface.blits`
+call whose entries are reused from frame to frame, so drawing neither scales nor
+allocates anything.
+"""
+from __future__ import annotations
+from typing import Any, Callable
+
+import pygame
+import constants
+
+from utils.scaling import get_scale, scale_rect, to_pixels
+
+# Paints a layer into its strip, given the strip's pixels per logical unit. The art must
+# tile: whatever leaves the right edge continues at the left one
+Painter = Callable[[pygame.Surface, float], None]
+
+# Fills the transparent parts of keyed layers
+_COLORKEY: list[int] = [255, 0, 255]
+
+_SKY_TOP: list[int] = [150, 200, 240]
+_SKY_BOTTOM: list[int] = [230, 244, 252]
+_CLOUD: list[int] = [250, 252, 255]
+_HILLS: list[int] = [120, 180, 130]
+_GRASS: list[int] = [90, 160, 60]
+_SOIL: list[int] = [170, 125, 75]
+_SOIL_STRIPE: list[int] = [145, 105, 60]
+
+
+def _tiled(rect: tuple[float, float, float, float]) -> list[tuple[float, ...]]:
+    """Repeats a logical shape one screen width to each side, so it wraps around.
+
+    Args:
+        rect (tuple[float, float, float, float]): The shape's logical bounds.
+
+    Returns:
+        list[tuple[float, ...]]: The bounds shifted left, unchanged and shifted right.
+    """
+    x, y, width, height = rect
+    return [
+        (x + shift, y, width, height)
+        for shift in (-constants.SCREEN_WIDTH, 0, constants.SCREEN_WIDTH)
+    ]
+
+
+def paint_sky(strip: pygame.Surface, scale: float) -> None:
+    """Paints a vertical sky gradient with a few clouds.
+
+    Args:
+        strip (pygame.Surface): The layer's strip.
+        scale (float): Pixels per logical unit.
+
+    Returns:
+        None
+    """
+    width, height = strip.get_size()
+    for row in range(height):
+        blend = row / max(height - 1, 1)
+        color = [
+            round(top + (bottom - top) * blend) for top, bottom in zip(_SKY_TOP, _SKY_BOTTOM)
+        ]
+        pygame.draw.line(strip, color, (0, row), (width - 1, row))
+
+    for cloud in [(60, 60, 140, 40), (330, 120, 180, 50), (620, 40, 120, 35)]:
+        for rect in _tiled(cloud):
+            pygame.draw.ellipse(strip, _CLOUD, scale_rect(rect, scale))
+
+
+def paint_hills(strip: pygame.Surface, scale: float) -> None:
+    """Paints rolling hills on a transparent strip.
+
+    Args:
+        strip (pygame.Surface): The layer's strip.
+        scale (float): Pixels per logical unit.
+
+    Returns:
+        None
+    """
+    strip.fill(_COLORKEY)
+    for hill in [(-60, 40, 360, 280), (220, 90, 300, 240), (470, 20, 420, 320)]:
+        for rect in _tiled(hill):
+            pygame.draw.ellipse(strip, _HILLS, scale_rect(rect, scale))
+
+
+def paint_ground(strip: pygame.Surface, scale: float) -> None:
+    """Paints a strip of grass over striped soil.
+
+    Args:
+        strip (pygame.Surface): The layer's strip.
+        scale (float): Pixels per logical unit.
+
+    Returns:
+        None
+    """
+    strip.fill(_SOIL)
+    for x in range(0, constants.SCREEN_WIDTH, 40):
+        pygame.draw.rect(strip, _SOIL_STRIPE, scale_rect((x, 14, 16, 26), scale))
+    pygame.draw.rect(strip, _GRASS, scale_rect((0, 0, constants.SCREEN_WIDTH, 10), scale))
+
+
+# Painter, logical top, logical height, scroll speed relative to the pipes and whether
+# the strip has transparent parts, back to front
+DEFAULT_LAYERS: list[tuple[Painter, int, int, float, bool]] = [
+    (paint_sky, 0, constants.SCREEN_HEIGHT, 0.1, False),
+    (paint_hills, 380, 180, 0.3, True),
+    (paint_ground, 560, 40, 1.0, False),
+]
+
+
+class ParallaxBackground:
+    """Horizontally scrolling layers, each drawn with at most two blits per frame."""
+
+    def __init__(
+        self: ParallaxBackground,
+        target: pygame.Surface,
+        layers: list[tuple[Painter, int, int, float, bool]] | None = None,
+    ) -> None:
+        """Paints every layer into a strip in the target's resolution and pixel format.
+
+        Args:
+            target (pygame.Surface): The surface the background will be drawn on; its
+                width sets the scale.
+            layers (list[tuple[Painter, int, int, float, bool]] | None, optional):
+                Painter, logical top, logical height, relative speed and transparency
+                of each layer, back to front. The first layer should be opaque and
+                cover the target, as nothing is cleared behind it.
+                Defaults to DEFAULT_LAYERS.
+        """
+        scale = get_scale(target)
+        # Floats, so that scrolling the strips needs no ints beyond the cached small ones
+        self.__width: float = float(target.get_width())
+        self.__distance: float = 0.0
+        # Strip pixels scrolled per logical unit of distance, per layer
+        self.__rates: list[float] = []
+        # [strip, destination] per blit, two per layer
+        self.__entries: list[list[Any]] = []
+
+        for painter, top, height, speed, transparent in (
+            layers if layers is not None else DEFAULT_LAYERS
+        ):
+            strip = pygame.Surface((target.get_width(), to_pixels(height, scale)))
+            painter(strip, scale)
+            strip = strip.convert(target)
+            if transparent:
+                strip.set_colorkey(_COLORKEY, pygame.RLEACCEL)
+
+            y = round(top * scale)
+            self.__rates.append(speed * scale)
+            self.__entries.append([strip, pygame.Rect(0, y, 0, 0)])
+            self.__entries.append([strip, pygame.Rect(target.get_width(), y, 0, 0)])
+
+    def update(self: ParallaxBackground, speed: float) -> None:
+        """Scrolls the background by one frame.
+
+        Args:
+            speed (float): The pipes' speed in logical units per frame, e.g.
+                `PipeManager.speed`.
+
+        Returns:
+            None
+        """
+        self.__distance += speed
+
+    def draw(self: ParallaxBackground, screen: pygame.Surface) -> None:
+        """Draws every layer, covering the whole screen.
+
+        Args:
+            screen (pygame.Surface): The surface the background was built for.
+
+        Returns:
+            None
+        """
+        entries = self.__entries
+        rates = self.__rates
+        width = self.__width
+        i = 0
+        while i < len(rates):
+            offset = self.__distance * rates[i] % width
+            # Whole pixels, so both halves are rounded alike and meet without a seam
+            offset -= offset % 1.0
+            entries[2 * i][1].x = -offset
+            entries[2 * i + 1][1].x = width - offset
+            i += 1
+        screen.blits(entries, doreturn=False)
+
+    @property
+    def distance(self: ParallaxBackground) -> float:
+        """Gets the logical distance the pipes have scrolled the background by.
+
+        Returns:
+            float: The distance in logical units.
+        """
+        return self.__distance
+
+    @distance.setter
+    def distance(self: ParallaxBackground, distance: float) -> None:
+        """Scrolls the background to an absolute position, e.g. when seeking a replay.
+
+        Args:
+            distance (float): The distance in logical units.
+        """
+        self.__distance = float(distance)
+
+    @property
+    def layers(self: ParallaxBackground) -> int:
+        """Gets the number of layers.
+
+        Returns:
+            int: The number of layers.
+        """
+        return len(self.__rates)
@@ -0,0 +1,548 @@
+"""Feasibility checks for consecutive pipe gaps.
+
+The bird's reachable states are tracked on a grid of discrete velocities (every
+velocity the bird can have is the jump force plus a whole number of gravity steps).
+For each velocity the reachable heights are kept as an interval, so the whole
+envelope is two arrays of shape (..., velocities) that NumPy steps one frame at a time
+for many gap pairs at once.
+
+A transition from gap A to gap B is feasible if some state inside gap A when the bird
+first reaches pipe A can survive pipe A, fly the spacing, and survive pipe B. The
+envelope is stepped through pipe A and the spacing; survival through pipe B is then
+looked up in a precomputed grid of states that can cross a gap of that size, which is
+shared by every gap height. The bird's rect rounds its height half up, so inside a
+gap its height ranges from half a pixel above the top edge. The envelope
+over-approximates the exact state set, so a transition reported infeasible is never
+passable (`tests/test_course_validator.py` checks this by exhaustive search), while a
+feasible one is passable up to pixel rounding.
+
+At the game's own gap and spacing (200 and 300 pixels) every transition is feasible,
+so the validator only ever changes courses with tighter settings.
+
+Run `python -m managers.course_validator COURSE` to check an authored course file.
+"""
+from __future__ import annotations
+from typing import Any
+
+import math
+import random
+import sys
+import numpy as np
+import constants
+
+from entities.course import Course
+
+_INF = np.float32(np.inf)
+# How far above a gap's top edge the bird's height may be: its rect rounds half up
+_ROUNDING = np.float32(0.5)
+
+
+class CourseValidator:
+    """Validates and repairs gap sequences for a given set of course and bird parameters.
+
+    Reachability between two gaps is cached per (gap size, gap size, spacing) and
+    previous gap height, so repeated queries while spawning cost a table lookup.
+    """
+
+    def __init__(
+        self: CourseValidator,
+        gap: int = 200,
+        spacing: int = 300,
+        speed: int = 4,
+        pipe_width: int = constants.PIPE_WIDTH,
+        bird_size: int = constants.BIRD_SIZE,
+        mode: str = "repair",
+        max_attempts: int = 8,
+    ) -> None:
+        """Initializes the validator.
+
+        Args:
+            gap (int, optional): Default vertical gap in pixels. Defaults to 200.
+            spacing (int, optional): Default horizontal distance between pairs in pixels.
+                Defaults to 300.
+            speed (int, optional): Pipe speed in pixels per frame. Defaults to 4.
+            pipe_width (int, optional): Pipe width in pixels. Defaults to constants.PIPE_WIDTH.
+            bird_size (int, optional): Bird sprite size in pixels. Defaults to constants.BIRD_SIZE.
+            mode (str, optional): How `next_top` handles an infeasible candidate: "reject"
+                redraws it, "repair" moves it to the nearest feasible height. Defaults to "repair".
+            max_attempts (int, optional): Redraws before "reject" falls back to repairing.
+                Defaults to 8.
+        """
+        if mode not in ("reject", "repair"):
+            raise ValueError(f"unknown mode {mode!r}")
+
+        self.__gap = gap
+        self.__spacing = spacing
+        self.__speed = speed
+        self.__bird_size = bird_size
+        self.__mode = mode
+        self.__max_attempts = max_attempts
+
+        gravity = constants.BIRD_GRAVITY
+        jump_force = constants.BIRD_JUMP_FORCE
+        max_velocity = math.sqrt(2 * gravity * constants.SCREEN_HEIGHT)
+        velocity_count = int((max_velocity - jump_force) / gravity) + 2
+        self.__velocities = (
+            jump_force + gravity * np.arange(velocity_count)
+        ).astype(np.float32)
+        self.__rest_row = int(round(-jump_force / gravity))
+        self.__floor = np.float32(constants.SCREEN_HEIGHT - bird_size)
+
+        # Frames during which a pipe overlaps the bird horizontally: pipes move in
+        # whole steps, so the fewest at any pipe phase, lest a passable transition be
+        # reported infeasible
+        self.__overlap_frames = (pipe_width + bird_size - 1) // speed
+
+        self.__rows: dict[tuple[int, int, int, int], np.ndarray] = {}
+        self.__tables: dict[tuple[int, int, int], np.ndarray] = {}
+        self.__survivor_cache: dict[int, np.ndarray] = {}
+
+    def __step(
+        self: CourseValidator,
+        lo: np.ndarray,
+        hi: np.ndarray,
+        lo_bound: Any = None,
+        hi_bound: Any = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Advances a reachable envelope by one frame.
+
+        Mirrors `Bird.movement` followed by an optional jump: gravity moves every
+        velocity row down one step, heights move by the new velocity, the screen edges
+        clamp, the pipe constraint (if any) is applied, and the jump row collects the
+        hull of every surviving height.
+
+        Args:
+            lo (np.ndarray): Lowest reachable height per velocity row.
+            hi (np.ndarray): Highest reachable height per velocity row.
+            lo_bound (Any, optional): Broadcastable lowest allowed height. Defaults to None.
+            hi_bound (Any, optional): Broadcastable highest allowed height. Defaults to None.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The envelope after the frame.
+        """
+        velocities = self.__velocities
+        new_lo = np.empty_like(lo)
+        new_hi = np.empty_like(hi)
+        new_lo[..., 1:] = lo[..., :-1] + velocities[1:]
+        new_hi[..., 1:] = hi[..., :-1] + velocities[1:]
+        np.minimum(new_lo[..., -1], lo[..., -1] + velocities[-1], out=new_lo[..., -1])
+        np.maximum(new_hi[..., -1], hi[..., -1] + velocities[-1], out=new_hi[..., -1])
+        new_lo[..., 0] = _INF
+        new_hi[..., 0] = -_INF
+
+        # Ceiling clamps the height, the floor also stops the bird
+        np.maximum(new_lo, 0, out=new_lo)
+        np.maximum(new_hi, 0, out=new_hi)
+        landed = (new_hi >= self.__floor).any(axis=-1)
+        np.minimum(new_hi, self.__floor, out=new_hi)
+        rest = self.__rest_row
+        new_lo[..., rest] = np.where(
+            landed, np.minimum(new_lo[..., rest], self.__floor), new_lo[..., rest]
+        )
+        new_hi[..., rest] = np.where(landed, self.__floor, new_hi[..., rest])
+
+        if lo_bound is not None:
+            np.maximum(new_lo, lo_bound, out=new_lo)
+            np.minimum(new_hi, hi_bound, out=new_hi)
+
+        empty = new_lo > new_hi
+        new_lo[empty] = _INF
+        new_hi[empty] = -_INF
+
+        new_lo[..., 0] = new_lo.min(axis=-1)
+        new_hi[..., 0] = new_hi.max(axis=-1)
+        return new_lo, new_hi
+
+    def __reachability(
+        self: CourseValidator,
+        tops_a: np.ndarray,
+        tops_b: np.ndarray,
+        gap_a: int,
+        gap_b: int,
+        spacing: int,
+    ) -> np.ndarray:
+        """Computes transition feasibility for every combination of two gap heights.
+
+        Args:
+            tops_a (np.ndarray): Heights of the first gap.
+            tops_b (np.ndarray): Heights of the second gap.
+            gap_a (int): Size of the first gap in pixels.
+            gap_b (int): Size of the second gap in pixels.
+            spacing (int): Horizontal distance between the pairs in pixels.
+
+        Returns:
+            np.ndarray: Boolean array of shape (len(tops_a), len(tops_b)).
+        """
+        overlap = self.__overlap_frames
+        arrival = max(1, round(spacing / self.__speed))
+        size = self.__bird_size
+        count = len(self.__velocities)
+
+        edge_a = tops_a.astype(np.float32)[:, None, None]
+        top_a = edge_a - _ROUNDING
+        bottom_a = edge_a + (gap_a - size)
+
+        # Any height inside gap A, at any velocity, when pipe A reaches the bird
+        lo = np.repeat(top_a, count, axis=-1)
+        hi = np.repeat(bottom_a, count, axis=-1)
+
+        for frame in range(1, arrival):
+            if frame < overlap:
+                lo, hi = self.__step(lo, hi, top_a, bottom_a)
+            else:
+                lo, hi = self.__step(lo, hi)
+
+        if arrival < overlap:
+            return self.__step_through(lo, hi, top_a, bottom_a, tops_b, gap_b, arrival)
+
+        # Gaps touching the top or bottom edge let the screen clamp hold the bird in
+        # place, which the survivor grid does not model
+        edge = (tops_b <= 0) | (tops_b + gap_b >= constants.SCREEN_HEIGHT)
+        feasible = self.__lookup_survivors(lo[:, 0, :], hi[:, 0, :], tops_b, gap_b)
+        if edge.any():
+            feasible[:, edge] = self.__step_through(
+                lo, hi, top_a, bottom_a, tops_b[edge], gap_b, arrival
+            )
+        return feasible
+
+    def __step_through(
+        self: CourseValidator,
+        lo: np.ndarray,
+        hi: np.ndarray,
+        top_a: np.ndarray,
+        bottom_a: np.ndarray,
+        tops_b: np.ndarray,
+        gap_b: int,
+        arrival: int,
+    ) -> np.ndarray:
+        """Steps envelopes frame by frame through the second pipe.
+
+        Used when the survivor grid does not apply: pipes close enough to overlap the
+        bird at the same time, or gaps touching the screen edges.
+
+        Args:
+            lo (np.ndarray): Lowest heights when the second pipe arrives, shape (tops_a, 1, velocities).
+            hi (np.ndarray): Highest heights when the second pipe arrives, same shape.
+            top_a (np.ndarray): Top edges of the first gap, shape (tops_a, 1, 1).
+            bottom_a (np.ndarray): Lowest allowed heights in the first gap, same shape.
+            tops_b (np.ndarray): Heights of the second gap.
+            gap_b (int): Size of the second gap in pixels.
+            arrival (int): Frame at which the second pipe reaches the bird.
+
+        Returns:
+            np.ndarray: Boolean array of shape (len(lo), len(tops_b)).
+        """
+        overlap = self.__overlap_frames
+        edge_b = tops_b.astype(np.float32)[None, :, None]
+        top_b = edge_b - _ROUNDING
+        bottom_b = edge_b + (gap_b - self.__bird_size)
+
+        shape = (lo.shape[0], len(tops_b), lo.shape[-1])
+        lo = np.broadcast_to(lo, shape).copy()
+        hi = np.broadcast_to(hi, shape).copy()
+        for frame in range(arrival, arrival + overlap):
+            if frame < overlap:
+                lo, hi = self.__step(
+                    lo, hi, np.maximum(top_a, top_b), np.minimum(bottom_a, bottom_b)
+                )
+            else:
+                lo, hi = self.__step(lo, hi, top_b, bottom_b)
+
+        return (lo <= hi).any(axis=-1)
+
+    def __survivors(self: CourseValidator, gap: int) -> np.ndarray:
+        """Computes which states can fly through a pipe of the given gap size.
+
+        Inside a gap the screen edges never clamp the bird, so survival depends only on
+        the height relative to the gap's top edge. States live on a half-pixel grid
+        (every height and velocity is a multiple of half a pixel), covering relative
+        heights from -SCREEN_HEIGHT to SCREEN_HEIGHT; the survivable ones start half a
+        pixel above the edge. Cached per gap size.
+
+        Args:
+            gap (int): Size of the gap in pixels.
+
+        Returns:
+            np.ndarray: Prefix sums of shape (velocities, cells + 1) over the boolean
+            survivor grid, for counting survivors inside any height interval.
+        """
+        prefix = self.__survivor_cache.get(gap)
+        if prefix is not None:
+            return prefix
+
+        count = len(self.__velocities)
+        offset = 2 * constants.SCREEN_HEIGHT
+        cells = 2 * offset + 1
+        low = offset - int(2 * _ROUNDING)
+        span = 2 * (gap - self.__bird_size) + 1 + int(2 * _ROUNDING)
+        shifts = (2 * self.__velocities).astype(np.int64)
+
+        alive = np.ones((count, cells), dtype=bool)
+        for _ in range(self.__overlap_frames):
+            # After moving, a state survives if it either keeps falling or jumps
+            after = alive | alive[0]
+            alive = np.zeros_like(alive)
+            for row in range(count):
+                moved = min(row + 1, count - 1)
+                start = low - shifts[moved]
+                alive[row, start:start + span] = after[moved, low:low + span]
+
+        prefix = np.zeros((count, cells + 1), dtype=np.int32)
+        np.cumsum(alive, axis=1, out=prefix[:, 1:])
+        self.__survivor_cache[gap] = prefix
+        return prefix
+
+    def __lookup_survivors(
+        self: CourseValidator,
+        lo: np.ndarray,
+        hi: np.ndarray,
+        tops_b: np.ndarray,
+        gap_b: int,
+    ) -> np.ndarray:
+        """Checks which envelopes contain a state able to fly through each next gap.
+
+        Args:
+            lo (np.ndarray): Lowest height per velocity row, shape (tops_a, velocities).
+            hi (np.ndarray): Highest height per velocity row, shape (tops_a, velocities).
+            tops_b (np.ndarray): Heights of the next gap.
+            gap_b (int): Size of the next gap in pixels.
+
+        Returns:
+            np.ndarray: Boolean array of shape (len(lo), len(tops_b)).
+        """
+        prefix = self.__survivors(gap_b)
+        offset = 2 * constants.SCREEN_HEIGHT
+        last = prefix.shape[1] - 2
+
+        reachable = (lo <= hi)[:, None, :]
+        relative = 2 * tops_b.astype(np.float32)[None, :, None]
+        first = np.clip(2 * lo[:, None, :] - relative + offset, 0, last + 1)
+        final = np.clip(2 * hi[:, None, :] - relative + offset, -1, last)
+        first = np.where(reachable, first, last + 1).astype(np.int32)
+        final = np.where(reachable, final, -1).astype(np.int32)
+
+        rows = np.arange(prefix.shape[0])
+        survivors = prefix[rows, final + 1] - prefix[rows, np.minimum(first, final + 1)]
+        return (survivors > 0).any(axis=-1)
+
+    def transition_row(
+        self: CourseValidator,
+        top_a: int,
+        gap_a: int | None = None,
+        gap_b: int | None = None,
+        spacing: int | None = None,
+    ) -> np.ndarray:
+        """Gets which heights of the next gap are reachable from a given gap.
+
+        Args:
+            top_a (int): Height of the current gap's top edge in pixels.
+            gap_a (int | None, optional): Size of the current gap. Defaults to the validator's gap.
+            gap_b (int | None, optional): Size of the next gap. Defaults to the validator's gap.
+            spacing (int | None, optional): Distance to the next pair. Defaults to the
+                validator's spacing.
+
+        Returns:
+            np.ndarray: Boolean array indexed by the next gap's top height, from 0 to
+            `SCREEN_HEIGHT - gap_b`. Cached; must not be modified.
+        """
+        gap_a = self.__gap if gap_a is None else gap_a
+        gap_b = self.__gap if gap_b is None else gap_b
+        spacing = self.__spacing if spacing is None else spacing
+
+        table = self.__tables.get((gap_a, gap_b, spacing))
+        if table is not None and 0 <= top_a < len(table):
+            return table[top_a]
+
+        key = (top_a, gap_a, gap_b, spacing)
+        row = self.__rows.get(key)
+        if row is None:
+            tops_b = np.arange(constants.SCREEN_HEIGHT - gap_b + 1)
+            row = self.__reachability(
+                np.array([top_a]), tops_b, gap_a, gap_b, spacing
+            )[0]
+            self.__rows[key] = row
+        return row
+
+    def transition_table(
+        self: CourseValidator,
+        gap_a: int | None = None,
+        gap_b: int | None = None,
+        spacing: int | None = None,
+        chunk_size: int = 32,
+    ) -> np.ndarray:
+        """Gets the full reachability table between every pair of gap heights.
+
+        Computed once per (gap_a, gap_b, spacing) in vectorized chunks, then cached.
+
+        Args:
+            gap_a (int | None, optional): Size of the first gap. Defaults to the validator's gap.
+            gap_b (int | None, optional): Size of the second gap. Defaults to the validator's gap.
+            spacing (int | None, optional): Distance between the pairs. Defaults to the
+                validator's spacing.
+            chunk_size (int, optional): First-gap heights processed per batch, bounding
+                peak memory. Defaults to 32.
+
+        Returns:
+            np.ndarray: Boolean array indexed by [top_a, top_b]. Cached; must not be modified.
+        """
+        gap_a = self.__gap if gap_a is None else gap_a
+        gap_b = self.__gap if gap_b is None else gap_b
+        spacing = self.__spacing if spacing is None else spacing
+
+        key = (gap_a, gap_b, spacing)
+        table = self.__tables.get(key)
+        if table is None:
+            tops_a = np.arange(constants.SCREEN_HEIGHT - gap_a + 1)
+            tops_b = np.arange(constants.SCREEN_HEIGHT - gap_b + 1)
+            table = np.empty((len(tops_a), len(tops_b)), dtype=bool)
+            for start in range(0, len(tops_a), chunk_size):
+                chunk = tops_a[start:start + chunk_size]
+                table[start:start + len(chunk)] = self.__reachability(
+                    chunk, tops_b, gap_a, gap_b, spacing
+                )
+            self.__tables[key] = table
+        return table
+
+    def is_feasible(
+        self: CourseValidator,
+        top_a: int,
+        top_b: int,
+        gap_a: int | None = None,
+        gap_b: int | None = None,
+        spacing: int | None = None,
+    ) -> bool:
+        """Checks whether the bird can fly from one gap through the next.
+
+        Args:
+            top_a (int): Top edge of the current gap in pixels.
+            top_b (int): Top edge of the next gap in pixels.
+            gap_a (int | None, optional): Size of the current gap. Defaults to the validator's gap.
+            gap_b (int | None, optional): Size of the next gap. Defaults to the validator's gap.
+            spacing (int | None, optional): Distance to the next pair. Defaults to the
+                validator's spacing.
+
+        Returns:
+            bool: True if the transition is passable.
+        """
+        row = self.transition_row(top_a, gap_a, gap_b, spacing)
+        return 0 <= top_b < len(row) and bool(row[top_b])
+
+    def next_top(
+        self: CourseValidator, previous_top: int | None, rng: random.Random
+    ) -> int:
+        """Draws the next gap height for a generated course, avoiding infeasible gaps.
+
+        Candidates are drawn exactly like `PipePair` does. Depending on the mode, an
+        infeasible candidate is redrawn or moved to the nearest feasible height.
+
+        Args:
+            previous_top (int | None): Top edge of the previous gap, or None for the first pair.
+            rng (random.Random): Random generator of the course.
+
+        Returns:
+            int: Top edge of the next gap in pixels.
+        """
+        low = constants.PIPE_HEIGHT
+        high = constants.SCREEN_HEIGHT - self.__gap - constants.PIPE_HEIGHT
+        candidate = rng.randint(low, high)
+        if previous_top is None:
+            return candidate
+
+        row = self.transition_row(previous_top)
+        if self.__mode == "reject":
+            for _ in range(self.__max_attempts):
+                if row[candidate]:
+                    return candidate
+                candidate = rng.randint(low, high)
+
+        if row[candidate]:
+            return candidate
+
+        feasible = np.flatnonzero(row[low:high + 1]) + low
+        if len(feasible) == 0:
+            return candidate
+        return int(feasible[np.abs(feasible - candidate).argmin()])
+
+    def find_infeasible(
+        self: CourseValidator,
+        tops: Any,
+        gaps: Any = None,
+        spacings: Any = None,
+    ) -> np.ndarray:
+        """Finds every infeasible transition in a sequence of gaps.
+
+        Args:
+            tops (Any): Top edge of each gap, in course order.
+            gaps (Any, optional): Size of each gap. Defaults to the validator's gap.
+            spacings (Any, optional): Distance of each pair from the previous one.
+                Defaults to the validator's spacing.
+
+        Returns:
+            np.ndarray: Indices i for which gap i cannot be followed by gap i + 1.
+        """
+        tops = np.asarray(tops, dtype=np.int64)
+        if len(tops) < 2:
+            return np.empty(0, dtype=np.int64)
+
+        if gaps is None and spacings is None:
+            table = self.transition_table()
+            return np.flatnonzero(~table[tops[:-1], tops[1:]])
+
+        gaps = np.full(len(tops), self.__gap) if gaps is None else np.asarray(gaps)
+        spacings = (
+            np.full(len(tops), self.__spacing) if spacings is None else np.asarray(spacings)
+        )
+        infeasible = [
+            i
+            for i in range(len(tops) - 1)
+            if not self.is_feasible(
+                int(tops[i]),
+                int(tops[i + 1]),
+                int(gaps[i]),
+                int(gaps[i + 1]),
+                int(spacings[i + 1]),
+            )
+        ]
+        return np.array(infeasible, dtype=np.int64)
+
+    def count_infeasible(self: CourseValidator, tops: Any) -> np.ndarray:
+        """Counts infeasible transitions for many generated courses at once.
+
+        Args:
+            tops (Any): Array of shape (courses, pairs) of gap top edges, all using the
+                validator's gap and spacing.
+
+        Returns:
+            np.ndarray: Number of infeasible transitions per course.
+        """
+        tops = np.asarray(tops, dtype=np.int64)
+        table = self.transition_table()
+        return (~table[tops[:, :-1], tops[:, 1:]]).sum(axis=1)
+
+
+def validate_course(course: Course, speed: int = 4) -> np.ndarray:
+    """Finds every infeasible transition of an authored course.
+
+    Args:
+        course (Course): The course to check.
+        speed (int, optional): Pipe speed in pixels per frame. Defaults to 4.
+
+    Returns:
+        np.ndarray: Indices i for which pair i cannot be followed by pair i + 1.
+    """
+    records = np.array([course.get_pair(i) for i in range(len(course))], dtype=np.int64)
+    if len(records) == 0:
+        return np.empty(0, dtype=np.int64)
+    validator = CourseValidator(speed=speed)
+    return validator.find_infeasible(records[:, 0], records[:, 1], records[:, 2])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m managers.course_validator COURSE")
+    with Course(sys.argv[1]) as checked_course:
+        bad_transitions = validate_course(checked_course)
+    for index in bad_transitions:
+        print(f"pair {index} -> {index + 1} is unreachable")
+    print(f"{len(bad_transitions)} infeasible transition(s)")
+    sys.exit(1 if len(bad_transitions) else 0)
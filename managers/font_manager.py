@@ -0,0 +1,256 @@
+from __future__ import annotations
+from typing import Any
+
+import json
+import os
+import sys
+import pygame
+import constants
+
+
+def _font_directories() -> list[str]:
+    """Lists the platform's system font directories that exist.
+
+    Returns:
+        list[str]: Absolute paths of the font directories.
+    """
+    home = os.path.expanduser("~")
+    if sys.platform == "win32":
+        candidates = [os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts")]
+    elif sys.platform == "darwin":
+        candidates = [
+            "/Library/Fonts",
+            "/System/Library/Fonts",
+            os.path.join(home, "Library", "Fonts"),
+        ]
+    else:
+        candidates = [
+            "/usr/share/fonts",
+            "/usr/local/share/fonts",
+            os.path.join(home, ".fonts"),
+            os.path.join(home, ".local", "share", "fonts"),
+        ]
+    return [directory for directory in candidates if os.path.isdir(directory)]
+
+
+def _mtime(path: str) -> float | None:
+    """Gets a file's modification time.
+
+    Args:
+        path (str): Path to the file or directory.
+
+    Returns:
+        float | None: The modification time, or None if the path does not exist.
+    """
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+class FontManager:
+    """Resolves and caches fonts without repeating the system font scan.
+
+    `pygame.font.SysFont` enumerates every installed font the first time it is called,
+    which is slow on some systems. Resolved font paths are stored on disk together with
+    the font file's modification time (or, when no font matched, the font directories'
+    modification times), so later sessions skip the scan while the fonts are unchanged.
+    Font objects are kept in memory per name and size.
+    """
+
+    def __init__(self: FontManager, cache_path: str = constants.FONT_CACHE_PATH) -> None:
+        """Loads the on-disk resolution cache.
+
+        Args:
+            cache_path (str, optional): Path of the JSON cache file.
+                Defaults to constants.FONT_CACHE_PATH.
+        """
+        self.__cache_path = cache_path
+        self.__resolved: dict[str, dict[str, Any]] = {}
+        self.__fonts: dict[tuple[str, int], pygame.font.Font | None] = {}
+        self.__texts: dict[tuple[str, int, str, tuple[int, ...]], pygame.Surface] = {}
+        self.__counters: dict[tuple[str, int, str, tuple[int, ...]], list[Any]] = {}
+        self.__pending: list[tuple[str, int]] = []
+
+        try:
+            with open(cache_path) as file:
+                self.__resolved = json.load(file)
+        except (OSError, ValueError):
+            self.__resolved = {}
+
+    def __is_fresh(self: FontManager, entry: dict[str, Any]) -> bool:
+        """Checks whether a cached resolution still matches the files on disk.
+
+        Args:
+            entry (dict[str, Any]): The cached resolution.
+
+        Returns:
+            bool: True if the cached path can be used without rescanning.
+        """
+        path = entry.get("path")
+        if path:
+            return _mtime(path) == entry.get("mtime")
+        return entry.get("directories") == {
+            directory: _mtime(directory) for directory in _font_directories()
+        }
+
+    def __save(self: FontManager) -> None:
+        """Writes the resolution cache, ignoring failures.
+
+        Returns:
+            None
+        """
+        try:
+            os.makedirs(os.path.dirname(self.__cache_path), exist_ok=True)
+            with open(self.__cache_path, "w") as file:
+                json.dump(self.__resolved, file)
+        except OSError:
+            pass
+
+    def resolve(self: FontManager, font_name: str) -> str | None:
+        """Finds the file of a system font, scanning the system fonts only on a cache miss.
+
+        Args:
+            font_name (str): Name of the font, e.g. "arial".
+
+        Returns:
+            str | None: Path of the font file, or None to use pygame's default font.
+        """
+        entry = self.__resolved.get(font_name)
+        if entry is not None and self.__is_fresh(entry):
+            return entry.get("path")
+
+        path = pygame.font.match_font(font_name)
+        if path:
+            entry = {"path": path, "mtime": _mtime(path)}
+        else:
+            entry = {
+                "path": None,
+                "directories": {
+                    directory: _mtime(directory) for directory in _font_directories()
+                },
+            }
+        self.__resolved[font_name] = entry
+        self.__save()
+        return path
+
+    def get_font(self: FontManager, font_name: str, size: int) -> pygame.font.Font | None:
+        """Gets a font object, creating it on first use.
+
+        Args:
+            font_name (str): Name of the font, e.g. "arial".
+            size (int): Font size in pixels.
+
+        Returns:
+            pygame.font.Font | None: The font, or None if no font could be loaded.
+        """
+        key = (font_name, size)
+        if key in self.__fonts:
+            return self.__fonts[key]
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+
+        font: pygame.font.Font | None = None
+        try:
+            font = pygame.font.Font(self.resolve(font_name), size)
+        except Exception:
+            pass
+
+        if font is None:
+            try:
+                font = pygame.font.Font(None, size)
+            except Exception:
+                font = None
+
+        self.__fonts[key] = font
+        return font
+
+    def render_text(
+        self: FontManager,
+        font_name: str,
+        size: int,
+        text: str,
+        color: list[int] | tuple[int, ...],
+    ) -> pygame.Surface | None:
+        """Renders a static label once and returns the cached surface afterwards.
+
+        Only use this for text from a small fixed set (titles, button labels); every
+        distinct string stays cached.
+
+        Args:
+            font_name (str): Name of the font, e.g. "arial".
+            size (int): Font size in pixels.
+            text (str): The label.
+            color (list[int] | tuple[int, ...]): RGB color of the text.
+
+        Returns:
+            pygame.Surface | None: The rendered label, or None if no font could be loaded.
+        """
+        key = (font_name, size, text, tuple(color))
+        surface = self.__texts.get(key)
+        if surface is None:
+            font = self.get_font(font_name, size)
+            if font is None:
+                return None
+            surface = font.render(text, True, color)
+            self.__texts[key] = surface
+        return surface
+
+    def render_counter(
+        self: FontManager,
+        font_name: str,
+        size: int,
+        label: str,
+        value: int,
+        color: list[int] | tuple[int, ...],
+    ) -> pygame.Surface | None:
+        """Renders a label followed by a changing number, e.g. a score.
+
+        The text is only formatted and rendered again when the number changes, so
+        drawing an unchanged counter allocates nothing.
+
+        Args:
+            font_name (str): Name of the font, e.g. "arial".
+            size (int): Font size in pixels.
+            label (str): Text in front of the number, e.g. "Score: ".
+            value (int): The number.
+            color (list[int] | tuple[int, ...]): RGB color of the text.
+
+        Returns:
+            pygame.Surface | None: The rendered text, or None if no font could be loaded.
+        """
+        key = (font_name, size, label, tuple(color))
+        counter = self.__counters.get(key)
+        if counter is not None and counter[0] == value:
+            return counter[1]
+
+        font = self.get_font(font_name, size)
+        if font is None:
+            return None
+        surface = font.render(f"{label}{value}", True, color)
+        self.__counters[key] = [value, surface]
+        return surface
+
+    def defer(self: FontManager, fonts: list[tuple[str, int]]) -> None:
+        """Queues fonts to be created later by `warm_step`, unless needed sooner.
+
+        Args:
+            fonts (list[tuple[str, int]]): Font names and sizes.
+
+        Returns:
+            None
+        """
+        self.__pending.extend(fonts)
+
+    def warm_step(self: FontManager) -> None:
+        """Creates at most one deferred font; call once per frame while idle.
+
+        Returns:
+            None
+        """
+        while self.__pending:
+            key = self.__pending.pop(0)
+            if key not in self.__fonts:
+                self.get_font(*key)
+                return
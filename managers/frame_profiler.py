@@ -0,0 +1,263 @@
+"""Per-frame allocation and garbage collection tracing.
+
+`FrameProfiler` splits every frame into named phases (e.g. input, update, render) and
+records, per phase:
+
+* transient bytes: how far traced memory rose above its level when the phase began,
+  which also catches objects that were created and freed again within the phase;
+* retained bytes: how much more memory was held when the phase ended;
+* garbage collections that ran during the phase and how long they paused the game.
+
+A phase may be given a budget of transient bytes for allocations it cannot avoid, such
+as the Rect every pygame drawing call returns; frames above it count as allocating.
+
+Allocations are measured with `tracemalloc`, which slows the game down noticeably, so
+this is a diagnostic mode only. The cost of the measurement itself is calibrated when
+tracing starts and subtracted.
+"""
+from __future__ import annotations
+from typing import Any, Callable, TextIO
+
+import gc
+import sys
+import time
+import tracemalloc
+
+
+class FrameProfiler:
+    """Measures allocations and GC pauses per frame and per phase."""
+
+    def __init__(
+        self: FrameProfiler, output: TextIO | None = None, verbose: bool = True
+    ) -> None:
+        """Creates an idle profiler; call `start` to begin tracing.
+
+        Args:
+            output (TextIO | None, optional): Stream for reports. Defaults to stderr.
+            verbose (bool, optional): Whether to report every frame that allocated or
+                collected garbage. Defaults to True.
+        """
+        self.__output = output
+        self.__verbose = verbose
+        self.__budgets: dict[str, int] = {}
+        self.__overhead: int = 0
+        self.__frame: int = 0
+
+        self.__phase: str | None = None
+        self.__base: int = 0
+        self.__gc_phase: str | None = None
+        self.__gc_started: float = 0.0
+
+        # Current frame, per phase: transient bytes, retained bytes, collections, GC seconds
+        self.__current: dict[str, list[Any]] = {}
+        # All frames, per phase: frames, allocating frames, transient bytes,
+        # max transient bytes, retained bytes, collections, GC seconds, max GC seconds
+        self.__totals: dict[str, list[Any]] = {}
+
+    def start(self: FrameProfiler) -> None:
+        """Starts tracing allocations and garbage collections.
+
+        Returns:
+            None
+        """
+        tracemalloc.start()
+        gc.callbacks.append(self.__on_gc)
+        self.__overhead = 0
+        self.__overhead = self.measure(lambda: None)
+
+    def stop(self: FrameProfiler) -> None:
+        """Stops tracing.
+
+        Returns:
+            None
+        """
+        if self.__on_gc in gc.callbacks:
+            gc.callbacks.remove(self.__on_gc)
+        tracemalloc.stop()
+
+    def measure(self: FrameProfiler, function: Callable[[], Any], repeat: int = 8) -> int:
+        """Measures the transient allocation of a call, e.g. to calibrate a budget.
+
+        Args:
+            function (Callable[[], Any]): The call to measure.
+            repeat (int, optional): Number of calls; the first one only warms up.
+                Defaults to 8.
+
+        Returns:
+            int: Transient bytes of the cheapest call.
+        """
+        samples = []
+        for _ in range(repeat):
+            self.__begin_sample()
+            function()
+            samples.append(self.__end_sample()[0])
+        return min(samples[1:] or samples)
+
+    def set_budget(self: FrameProfiler, phase: str, transient_bytes: int) -> None:
+        """Allows a phase some transient allocation before it counts as allocating.
+
+        Args:
+            phase (str): Name of the phase.
+            transient_bytes (int): Transient bytes tolerated per frame.
+
+        Returns:
+            None
+        """
+        self.__budgets[phase] = transient_bytes
+
+    def get_budget(self: FrameProfiler, phase: str) -> int:
+        """Gets the transient allocation a phase is allowed.
+
+        Args:
+            phase (str): Name of the phase.
+
+        Returns:
+            int: Transient bytes tolerated per frame, 0 if no budget was set.
+        """
+        return self.__budgets.get(phase, 0)
+
+    def __on_gc(self: FrameProfiler, event: str, info: dict[str, Any]) -> None:
+        """Garbage collector callback: times each collection against the running phase.
+
+        Args:
+            event (str): "start" or "stop".
+            info (dict[str, Any]): Details from the collector (unused).
+
+        Returns:
+            None
+        """
+        if event == "start":
+            self.__gc_phase = self.__phase
+            self.__gc_started = time.perf_counter()
+        elif self.__gc_phase is not None:
+            measurement = self.__current[self.__gc_phase]
+            measurement[2] += 1
+            measurement[3] += time.perf_counter() - self.__gc_started
+
+    def __begin_sample(self: FrameProfiler) -> None:
+        """Starts measuring allocations from the current level of traced memory.
+
+        Returns:
+            None
+        """
+        # Reset the peak only after reading the base: reading allocates the result
+        self.__base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def __end_sample(self: FrameProfiler) -> tuple[int, int]:
+        """Measures the allocations since `__begin_sample`.
+
+        Reading the traced memory allocates a few objects itself; phases and `measure`
+        both sample the same way, so that cost is the calibrated overhead.
+
+        Returns:
+            tuple[int, int]: Transient bytes and retained bytes.
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        return max(peak - self.__base - self.__overhead, 0), current - self.__base
+
+    def __close_phase(self: FrameProfiler) -> None:
+        """Records the allocations of the running phase, if any.
+
+        Returns:
+            None
+        """
+        if self.__phase is None:
+            return
+        measurement = self.__current[self.__phase]
+        measurement[0], measurement[1] = self.__end_sample()
+        self.__phase = None
+
+    def begin_frame(self: FrameProfiler) -> None:
+        """Starts a new frame.
+
+        Returns:
+            None
+        """
+        self.__frame += 1
+        self.__current = {}
+
+    def begin_phase(self: FrameProfiler, name: str) -> None:
+        """Ends the running phase and starts measuring the next one.
+
+        Args:
+            name (str): Name of the phase, e.g. "update".
+
+        Returns:
+            None
+        """
+        self.__close_phase()
+        self.__current[name] = [0, 0, 0, 0.0]
+        self.__phase = name
+        self.__begin_sample()
+
+    def end_frame(self: FrameProfiler) -> bool:
+        """Ends the running phase and adds the frame to the totals.
+
+        Returns:
+            bool: True if any phase allocated beyond its budget, retained memory or
+            collected garbage.
+        """
+        self.__close_phase()
+        noteworthy = False
+        for name, (transient, retained, collections, gc_seconds) in self.__current.items():
+            allocated = transient > self.__budgets.get(name, 0) or retained > 0
+            totals = self.__totals.setdefault(name, [0, 0, 0, 0, 0, 0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += allocated
+            totals[2] += transient
+            totals[3] = max(totals[3], transient)
+            totals[4] += retained
+            totals[5] += collections
+            totals[6] += gc_seconds
+            totals[7] = max(totals[7], gc_seconds)
+            noteworthy = noteworthy or allocated or collections > 0
+
+        if self.__verbose and noteworthy:
+            print(
+                f"frame {self.__frame}: {self.describe_frame()}",
+                file=self.__output or sys.stderr,
+            )
+        return noteworthy
+
+    def describe_frame(self: FrameProfiler) -> str:
+        """Describes the phases of the last frame.
+
+        Returns:
+            str: Transient and retained bytes and GC pauses of each phase.
+        """
+        parts = []
+        for name, (transient, retained, collections, gc_seconds) in self.__current.items():
+            part = f"{name} {transient} B transient {retained:+d} B retained"
+            if collections:
+                part += f" {collections} gc {gc_seconds * 1000:.2f} ms"
+            parts.append(part)
+        return ", ".join(parts)
+
+    def report(self: FrameProfiler) -> str:
+        """Summarizes every phase over all frames.
+
+        Returns:
+            str: One line per phase.
+        """
+        lines = []
+        for name, totals in self.__totals.items():
+            frames, allocating, transient, max_transient, retained = totals[:5]
+            collections, gc_seconds, max_gc_seconds = totals[5:]
+            lines.append(
+                f"{name}: {allocating}/{frames} frames allocated, "
+                f"{transient / frames:.0f} B/frame transient (max {max_transient} B, "
+                f"budget {self.__budgets.get(name, 0)} B), {retained:+d} B retained, "
+                f"{collections} gc pauses {gc_seconds * 1000:.2f} ms "
+                f"(max {max_gc_seconds * 1000:.2f} ms)"
+            )
+        return "\n".join(lines)
+
+    @property
+    def last_frame(self: FrameProfiler) -> dict[str, tuple[int, int]]:
+        """Gets the transient and retained bytes of each phase of the last frame.
+
+        Returns:
+            dict[str, tuple[int, int]]: Phase name -> (transient bytes, retained bytes).
+        """
+        return {name: (values[0], values[1]) for name, values in self.__current.items()}
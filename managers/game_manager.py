@@ -2,7 +2,6 @@ from __future__ import annotations
 from entities.bird import Bird
 from managers.pipe_manager import PipeManager
 from managers.score_manager import ScoreManager
-import pygame
 
 
 def check_collisions(bird: Bird, pipe_manager: PipeManager) -> bool:
@@ -15,11 +14,87 @@ def check_collisions(bird: Bird, pipe_manager: PipeManager) -> bool:
     Returns:
         bool: True if the bird collides with any pipe, False otherwise.
     """
-    pipe_sprites = pipe_manager.get_all_pipe_sprites()
-    return (
-        pygame.sprite.spritecollideany(bird, pygame.sprite.Group(pipe_sprites))
-        is not None
+    # Indexed loop: PLAYING frames may not allocate (tests/test_frame_allocations.py)
+    # and a `for` loop allocates an iterator
+    bird_rect = bird.rect
+    pipe_pairs = pipe_manager.pipe_pairs
+    i = 0
+    while i < len(pipe_pairs):
+        pipe_pair = pipe_pairs[i]
+        if bird_rect.colliderect(pipe_pair.top_pipe.rect) or bird_rect.colliderect(
+            pipe_pair.bottom_pipe.rect
+        ):
+            return True
+        i += 1
+    return False
+
+
+def update_score(
+    bird: Bird,
+    pipe_manager: PipeManager,
+    score_manager: ScoreManager,
+    last_passed_index: int,
+) -> int:
+    """Awards a point for every pipe pair the bird has fully passed since the last call.
+
+    Args:
+        bird (Bird): The bird whose progress is scored.
+        pipe_manager (PipeManager): The manager containing all active pipes.
+        score_manager (ScoreManager): The manager receiving the points.
+        last_passed_index (int): Index of the last pair already scored, or -1 if none.
+
+    Returns:
+        int: The index of the last scored pair after this update.
+    """
+    # Indexed loop, and the pair's float position rather than `rect.right`, so that
+    # a frame allocates neither an iterator nor ints beyond the small-int cache
+    bird_left = bird.rect.left
+    pipe_pairs = pipe_manager.pipe_pairs
+    i = 0
+    while i < len(pipe_pairs):
+        pipe_pair = pipe_pairs[i]
+        if (
+            pipe_pair.index > last_passed_index
+            and pipe_pair.x + pipe_pair.top_pipe.rect.width < bird_left
+        ):
+            score_manager.increment_score()
+            last_passed_index = pipe_pair.index
+        i += 1
+    return last_passed_index
+
+
+def step_playing(
+    bird: Bird,
+    pipe_manager: PipeManager,
+    score_manager: ScoreManager,
+    jump: bool,
+    last_passed_index: int,
+) -> tuple[int, bool]:
+    """Advances a single-player run by one frame without touching the display.
+
+    Mirrors the order of the interactive loop: the bird moves, the pipes scroll,
+    the jump input is applied, then scoring and collisions are evaluated.
+
+    Args:
+        bird (Bird): The bird being flown.
+        pipe_manager (PipeManager): The manager containing all active pipes.
+        score_manager (ScoreManager): The manager tracking the run's score.
+        jump (bool): Whether the jump input is held this frame.
+        last_passed_index (int): Index of the last pair already scored, or -1 if none.
+
+    Returns:
+        tuple[int, bool]: The updated last scored pair index, and whether the bird crashed.
+    """
+    bird.movement()
+    pipe_manager.update()
+
+    if jump:
+        bird.jump()
+
+    last_passed_index = update_score(
+        bird, pipe_manager, score_manager, last_passed_index
     )
+    return last_passed_index, check_collisions(bird, pipe_manager)
 
 
 def reset_game(
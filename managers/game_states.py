@@ -0,0 +1,553 @@
+"""The game's screens: the main menu, a run, the game over screen and the exit dialogs.
+
+Each screen is a `State` of the game's `StateMachine`, and `TRANSITIONS` is their
+transition table. Screens draw into a shared `Scene`, which holds the framebuffer, the
+play field and the quality governor deciding which frames are drawn.
+"""
+from __future__ import annotations
+
+import pygame
+import constants
+
+from entities.bird import Bird
+from managers.atlas_manager import SpriteAtlas, SpriteBatch
+from managers.background_manager import ParallaxBackground
+from managers.game_manager import reset_game, step_playing
+from managers.ghost_manager import GhostManager
+from managers.menu_manager import (
+    draw_confirm_exit_dialog,
+    draw_game_over_menu,
+    draw_main_menu,
+    draw_score,
+    get_confirm_exit_button_rects,
+    get_game_over_button_rects,
+    get_menu_button_rects,
+    handle_confirm_exit_input,
+    handle_game_over_input,
+    handle_game_over_input_events,
+    handle_keys_pressed_events,
+    handle_main_menu_input,
+)
+from managers.pipe_manager import PipeManager
+from managers.quality_governor import QualityGovernor
+from managers.render_manager import FrameBuffer, dim
+from managers.replay_manager import ReplayRecorder, ReplayWriter
+from managers.score_manager import ScoreManager
+from managers.state_machine import State
+from managers.telemetry_manager import TelemetryManager
+
+
+class GameState:
+    """Names of the game's screens."""
+
+    MENU = "menu"
+    PLAYING = "playing"
+    GAME_OVER = "game_over"
+    CONFIRM_EXIT_MENU = "confirm_exit_menu"
+    CONFIRM_EXIT_GAME_OVER = "confirm_exit_game_over"
+
+
+# Next state of every action a screen can take; None ends the game
+TRANSITIONS: dict[tuple[str, str], str | None] = {
+    (GameState.MENU, "start"): GameState.PLAYING,
+    (GameState.MENU, "exit"): GameState.CONFIRM_EXIT_MENU,
+    (GameState.CONFIRM_EXIT_MENU, "yes"): None,
+    (GameState.CONFIRM_EXIT_MENU, "no"): GameState.MENU,
+    (GameState.PLAYING, "crash"): GameState.GAME_OVER,
+    (GameState.GAME_OVER, "restart"): GameState.PLAYING,
+    (GameState.GAME_OVER, "exit"): GameState.CONFIRM_EXIT_GAME_OVER,
+    (GameState.CONFIRM_EXIT_GAME_OVER, "yes"): None,
+    (GameState.CONFIRM_EXIT_GAME_OVER, "no"): GameState.GAME_OVER,
+}
+
+
+def draw_play_field(
+    screen: pygame.Surface,
+    bird: Bird,
+    pipe_manager: PipeManager,
+    ghost_manager: GhostManager | None = None,
+    sprite_batch: SpriteBatch | None = None,
+) -> None:
+    """Draw the pipes, the ghosts and the bird over the background.
+
+    With a sprite batch, pipes and the bird are blitted from its atlas in batches
+    instead of being drawn one by one.
+
+    Args:
+        screen (pygame.Surface): The framebuffer's surface.
+        bird (Bird): The player's bird.
+        pipe_manager (PipeManager): The pipes of the course.
+        ghost_manager (GhostManager | None, optional): Ghosts flown against.
+            Defaults to None.
+        sprite_batch (SpriteBatch | None, optional): Batch of the framebuffer's
+            atlas. Defaults to None.
+    """
+    if sprite_batch is not None:
+        # Ghosts fly between the pipes and the bird, so they split the batch
+        pipe_manager.queue(sprite_batch)
+        if ghost_manager is not None:
+            sprite_batch.flush(screen)
+            ghost_manager.draw(screen)
+        bird.queue(sprite_batch)
+        sprite_batch.flush(screen)
+    else:
+        pipe_manager.draw(screen)
+        if ghost_manager is not None:
+            ghost_manager.draw(screen)
+        bird.draw(screen)
+
+
+def create_bird_surface(color: list[int]) -> pygame.Surface:
+    """Build the square bird sprite with a colored disc in the middle.
+
+    Args:
+        color (list[int]): RGB color of the disc.
+
+    Returns:
+        pygame.Surface: The bird surface.
+    """
+    bird_surface: pygame.Surface = pygame.Surface([constants.BIRD_SIZE, constants.BIRD_SIZE])
+    bird_surface.fill(constants.BLACK)
+    pygame.draw.circle(
+        bird_surface,
+        color,
+        [constants.BIRD_SIZE // 2, constants.BIRD_SIZE // 2],
+        20,
+    )
+    return bird_surface
+
+
+class Scene:
+    """The framebuffer and play field that the game's screens draw into and over."""
+
+    def __init__(
+        self: Scene,
+        frame_buffer: FrameBuffer,
+        bird: Bird,
+        bird_surface: pygame.Surface,
+        pipe_manager: PipeManager,
+        governor: QualityGovernor,
+        ghost_manager: GhostManager | None = None,
+    ) -> None:
+        """Create the scene's sprite batch and background for a framebuffer.
+
+        Args:
+            frame_buffer (FrameBuffer): The framebuffer frames are drawn into.
+            bird (Bird): The player's bird.
+            bird_surface (pygame.Surface): The bird's sprite, packed into the atlas.
+            pipe_manager (PipeManager): The pipes of the course.
+            governor (QualityGovernor): Decides which frames are drawn, and with
+                which effects.
+            ghost_manager (GhostManager | None, optional): Ghosts flown against.
+                Defaults to None.
+        """
+        self.__frame_buffer = frame_buffer
+        self.__bird = bird
+        self.__bird_surface = bird_surface
+        self.__pipe_manager = pipe_manager
+        self.__governor = governor
+        self.__ghost_manager = ghost_manager
+        # Bird surface, packed with the pipes into an atlas in the framebuffer's format
+        self.__sprite_batch = SpriteBatch(SpriteAtlas(frame_buffer.surface, [bird_surface]))
+        self.__background = ParallaxBackground(frame_buffer.surface)
+
+    def resize(self: Scene, window: pygame.Surface, size: tuple[int, int]) -> None:
+        """Switch to a framebuffer of another size, if it differs from the current one.
+
+        Args:
+            window (pygame.Surface): The display surface frames are presented to.
+            size (tuple[int, int]): Size of the framebuffer in pixels.
+        """
+        if self.__frame_buffer.surface.get_size() == size:
+            return
+        # Everything drawn at the framebuffer's scale is rebuilt for the new one
+        self.__frame_buffer = FrameBuffer(window, size)
+        self.__sprite_batch = SpriteBatch(
+            SpriteAtlas(self.__frame_buffer.surface, [self.__bird_surface])
+        )
+        distance = self.__background.distance
+        self.__background = ParallaxBackground(self.__frame_buffer.surface)
+        self.__background.distance = distance
+
+    def draw(self: Scene, screen: pygame.Surface, field: bool = True) -> None:
+        """Draw the background and, with the field, the pipes, ghosts and bird.
+
+        Args:
+            screen (pygame.Surface): The framebuffer's surface.
+            field (bool, optional): Whether to draw the play field. Defaults to True.
+        """
+        self.__background.draw(screen)
+        if field:
+            draw_play_field(
+                screen,
+                self.__bird,
+                self.__pipe_manager,
+                self.__ghost_manager,
+                self.__sprite_batch,
+            )
+
+    @property
+    def frame_buffer(self: Scene) -> FrameBuffer:
+        """Get the framebuffer frames are drawn into.
+
+        Returns:
+            FrameBuffer: The current framebuffer.
+        """
+        return self.__frame_buffer
+
+    @property
+    def background(self: Scene) -> ParallaxBackground:
+        """Get the scrolling background.
+
+        Returns:
+            ParallaxBackground: The background of the current framebuffer.
+        """
+        return self.__background
+
+    @property
+    def bird(self: Scene) -> Bird:
+        """Get the player's bird.
+
+        Returns:
+            Bird: The bird.
+        """
+        return self.__bird
+
+    @property
+    def pipe_manager(self: Scene) -> PipeManager:
+        """Get the pipes of the course.
+
+        Returns:
+            PipeManager: The pipe manager.
+        """
+        return self.__pipe_manager
+
+    @property
+    def governor(self: Scene) -> QualityGovernor:
+        """Get the governor deciding which frames are drawn, and with which effects.
+
+        Returns:
+            QualityGovernor: The governor.
+        """
+        return self.__governor
+
+    @property
+    def ghost_manager(self: Scene) -> GhostManager | None:
+        """Get the ghosts flown against, if any.
+
+        Returns:
+            GhostManager | None: The ghost manager.
+        """
+        return self.__ghost_manager
+
+
+class _Screen(State):
+    """A game state drawn into the scene's framebuffer."""
+
+    def __init__(self: _Screen, name: str, scene: Scene, static: bool = False) -> None:
+        """Create a screen.
+
+        Args:
+            name (str): A `GameState`.
+            scene (Scene): The scene the screen is drawn over.
+            static (bool, optional): Whether nothing on it moves by itself. Defaults
+                to False.
+        """
+        super().__init__(name, static)
+        self.__scene = scene
+
+    def render(self: _Screen) -> None:
+        """Draw the screen and present it, unless the governor keeps the last frame.
+        """
+        if self.__scene.governor.should_draw(self.name, self.static):
+            frame_buffer = self.__scene.frame_buffer
+            self.draw(frame_buffer.surface)
+            frame_buffer.present()
+
+    def draw(self: _Screen, screen: pygame.Surface) -> None:
+        """Draw the screen into the framebuffer; by default, the scene's play field.
+
+        Args:
+            screen (pygame.Surface): The framebuffer's surface.
+        """
+        self.__scene.draw(screen)
+
+    @property
+    def scene(self: _Screen) -> Scene:
+        """Get the scene the screen is drawn over.
+
+        Returns:
+            Scene: The scene.
+        """
+        return self.__scene
+
+
+class MenuState(_Screen):
+    """The main menu, with its Start and Exit buttons."""
+
+    def __init__(self: MenuState, scene: Scene) -> None:
+        """Create the main menu.
+
+        Args:
+            scene (Scene): The scene the menu is drawn over.
+        """
+        super().__init__(GameState.MENU, scene, static=True)
+        self.__buttons: dict[str, pygame.Rect] | None = None
+
+    def enter(self: MenuState, previous: str | None) -> None:
+        """Lay out the buttons."""
+        self.__buttons = get_menu_button_rects()
+
+    def exit(self: MenuState, following: str | None) -> None:
+        """Drop the button layout."""
+        self.__buttons = None
+
+    def handle_input(
+        self: MenuState,
+        events: list[pygame.event.Event],
+        keys_pressed: pygame.key.ScancodeWrapper,
+    ) -> str | None:
+        """Start on Enter, Space or a click on Start; ask before exiting on Esc or Exit."""
+        action = handle_main_menu_input(events, self.__buttons)
+        return None if action == "none" else action
+
+    def draw(self: MenuState, screen: pygame.Surface) -> None:
+        """Draw the background and the menu."""
+        self.scene.draw(screen, field=False)
+        draw_main_menu(screen, self.__buttons, self.scene.governor.hover_effects)
+
+
+class PlayingState(_Screen):
+    """A run: the bird flies until it crashes or the course ends."""
+
+    def __init__(
+        self: PlayingState,
+        scene: Scene,
+        score_manager: ScoreManager,
+        telemetry: TelemetryManager | None = None,
+        replay_recorder: ReplayRecorder | None = None,
+        replay_writer: ReplayWriter | None = None,
+    ) -> None:
+        """Create the playing state.
+
+        Args:
+            scene (Scene): The scene flown through.
+            score_manager (ScoreManager): Scores of the runs.
+            telemetry (TelemetryManager | None, optional): Records every run. Defaults
+                to None.
+            replay_recorder (ReplayRecorder | None, optional): Records the inputs of
+                every run. Defaults to None.
+            replay_writer (ReplayWriter | None, optional): Saves the replay of every
+                finished run. Defaults to None.
+        """
+        super().__init__(GameState.PLAYING, scene)
+        self.__score_manager = score_manager
+        self.__telemetry = telemetry
+        self.__replay_recorder = replay_recorder
+        self.__replay_writer = replay_writer
+        # Index of the last pipe pair passed for scoring, and the frame's jump input
+        self.__last_pipe_passed = -1
+        self.__jump = False
+
+    def enter(self: PlayingState, previous: str | None) -> None:
+        """Start a new run.
+
+        Args:
+            previous (str | None): The state left.
+        """
+        pipe_manager = self.scene.pipe_manager
+        reset_game(self.scene.bird, pipe_manager, self.__score_manager)
+        self.__last_pipe_passed = -1
+        if self.__telemetry is not None:
+            self.__telemetry.start_run()
+        if self.scene.ghost_manager is not None:
+            self.scene.ghost_manager.start_run()
+        if self.__replay_recorder is not None:
+            self.__replay_recorder.start_run(pipe_manager)
+
+    def handle_input(
+        self: PlayingState,
+        events: list[pygame.event.Event],
+        keys_pressed: pygame.key.ScancodeWrapper,
+    ) -> str | None:
+        """Read the jump key; Esc quits at once."""
+        self.__jump = handle_keys_pressed_events(keys_pressed)
+        return None
+
+    def update(self: PlayingState) -> str | None:
+        """Move the bird and pipes, score passed pipes and end the run on a collision.
+
+        Returns:
+            str | None: "crash" once the run is over.
+        """
+        scene = self.scene
+        bird = scene.bird
+        pipe_manager = scene.pipe_manager
+        jump = self.__jump
+        self.__last_pipe_passed, crashed = step_playing(
+            bird, pipe_manager, self.__score_manager, jump, self.__last_pipe_passed
+        )
+        scene.background.update(pipe_manager.speed)
+        if self.__telemetry is not None:
+            self.__telemetry.record_frame(jump)
+        if scene.ghost_manager is not None:
+            scene.ghost_manager.step(bird.x, bird.y)
+        if self.__replay_recorder is not None:
+            self.__replay_recorder.record_frame(jump)
+
+        if not crashed and not pipe_manager.finished:
+            return None
+        self.__score_manager.update_high_score()
+        if self.__telemetry is not None:
+            self.__telemetry.record_death(
+                bird.x, bird.y, self.__last_pipe_passed + 1, self.__score_manager.score
+            )
+        if scene.ghost_manager is not None:
+            scene.ghost_manager.end_run()
+        if self.__replay_recorder is not None and self.__replay_writer is not None:
+            self.__replay_writer.save(self.__replay_recorder.finish())
+        return "crash"
+
+    def draw(self: PlayingState, screen: pygame.Surface) -> None:
+        """Draw the play field and the score."""
+        self.scene.draw(screen)
+        draw_score(screen, self.__score_manager)
+
+
+class GameOverState(_Screen):
+    """The game over screen, with the scores and the Restart and Exit buttons."""
+
+    def __init__(self: GameOverState, scene: Scene, score_manager: ScoreManager) -> None:
+        """Create the game over screen.
+
+        Args:
+            scene (Scene): The scene of the finished run.
+            score_manager (ScoreManager): Scores of the runs.
+        """
+        super().__init__(GameState.GAME_OVER, scene, static=True)
+        self.__score_manager = score_manager
+        self.__buttons: dict[str, pygame.Rect] | None = None
+
+    def enter(self: GameOverState, previous: str | None) -> None:
+        """Lay out the buttons."""
+        self.__buttons = get_game_over_button_rects()
+
+    def exit(self: GameOverState, following: str | None) -> None:
+        """Drop the button layout."""
+        self.__buttons = None
+
+    def handle_input(
+        self: GameOverState,
+        events: list[pygame.event.Event],
+        keys_pressed: pygame.key.ScancodeWrapper,
+    ) -> str | None:
+        """Restart or ask before exiting, by click, key press or held key."""
+        action = handle_game_over_input_events(events, self.__buttons)
+        if action == "none":
+            # fallback to continuous key state for convenience
+            action = handle_game_over_input(keys_pressed)
+        return None if action == "none" else action
+
+    def draw(self: GameOverState, screen: pygame.Surface) -> None:
+        """Draw the finished run under the scores and buttons."""
+        governor = self.scene.governor
+        self.scene.draw(screen)
+        draw_game_over_menu(
+            screen,
+            self.__score_manager,
+            self.__buttons,
+            governor.hover_effects,
+            governor.blended_overlays,
+        )
+
+
+class ConfirmExitState(_Screen):
+    """The confirm-exit dialog, over the screen it was opened from."""
+
+    def __init__(
+        self: ConfirmExitState, name: str, backdrop: _Screen, scene: Scene
+    ) -> None:
+        """Create a confirm-exit dialog.
+
+        Args:
+            name (str): A `GameState`.
+            backdrop (_Screen): The screen shown, dimmed, behind the dialog.
+            scene (Scene): The scene the backdrop is drawn over.
+        """
+        super().__init__(name, scene, static=True)
+        self.__backdrop = backdrop
+        self.__buttons: dict[str, pygame.Rect] | None = None
+        # The dimmed backdrop, and the governor level it was drawn at
+        self.__cached: pygame.Surface | None = None
+        self.__cached_level = 0
+
+    def enter(self: ConfirmExitState, previous: str | None) -> None:
+        """Lay out the buttons; the backdrop is drawn with the first frame."""
+        self.__buttons = get_confirm_exit_button_rects()
+
+    def exit(self: ConfirmExitState, following: str | None) -> None:
+        """Drop the button layout and the cached backdrop."""
+        self.__buttons = None
+        self.__cached = None
+
+    def handle_input(
+        self: ConfirmExitState,
+        events: list[pygame.event.Event],
+        keys_pressed: pygame.key.ScancodeWrapper,
+    ) -> str | None:
+        """Answer "yes" or "no" by click or key press."""
+        confirm = handle_confirm_exit_input(events, self.__buttons)
+        return None if confirm == "none" else confirm
+
+    def draw(self: ConfirmExitState, screen: pygame.Surface) -> None:
+        """Draw the dimmed backdrop and the dialog over it."""
+        # Nothing behind the dialog moves: it is drawn and dimmed once, then copied.
+        # Its buttons keep the hover they had when the dialog opened
+        governor = self.scene.governor
+        cached = self.__cached
+        if (
+            cached is None
+            or cached.get_size() != screen.get_size()
+            or self.__cached_level != governor.level
+        ):
+            self.__backdrop.draw(screen)
+            dim(screen, 180, governor.blended_overlays)
+            self.__cached = screen.copy()
+            self.__cached_level = governor.level
+        else:
+            screen.blit(cached, (0, 0))
+        draw_confirm_exit_dialog(screen, self.__buttons, governor.hover_effects)
+
+
+def create_screens(
+    scene: Scene,
+    score_manager: ScoreManager,
+    telemetry: TelemetryManager | None = None,
+    replay_recorder: ReplayRecorder | None = None,
+    replay_writer: ReplayWriter | None = None,
+) -> dict[str, State]:
+    """Create every screen of the game over a scene, for a `StateMachine` on `TRANSITIONS`.
+
+    Args:
+        scene (Scene): The scene the screens are drawn over.
+        score_manager (ScoreManager): Scores of the runs.
+        telemetry (TelemetryManager | None, optional): Records every run. Defaults to
+            None.
+        replay_recorder (ReplayRecorder | None, optional): Records the inputs of every
+            run. Defaults to None.
+        replay_writer (ReplayWriter | None, optional): Saves the replay of every
+            finished run. Defaults to None.
+
+    Returns:
+        dict[str, State]: Every screen, by its `GameState`.
+    """
+    menu = MenuState(scene)
+    game_over = GameOverState(scene, score_manager)
+    screens: list[State] = [
+        menu,
+        PlayingState(scene, score_manager, telemetry, replay_recorder, replay_writer),
+        game_over,
+        ConfirmExitState(GameState.CONFIRM_EXIT_MENU, menu, scene),
+        ConfirmExitState(GameState.CONFIRM_EXIT_GAME_OVER, game_over, scene),
+    ]
+    return {screen.name: screen for screen in screens}
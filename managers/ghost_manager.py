@@ -0,0 +1,278 @@
+"""Translucent ghost birds replaying earlier runs.
+
+Every ghost trajectory is a run of rows in one int16 position array, indexed by the
+frame since the run started. Drawing gathers the rows of the current frame with NumPy,
+culls ghosts that have ended or are off screen, and blits the rest in a single
+`Surface.blits` call with one shared sprite. The sprite is converted once to per-pixel
+alpha and cropped to its visible pixels: SDL blends that format far faster than a
+colorkeyed surface with surface alpha.
+"""
+from __future__ import annotations
+
+import itertools
+import numpy as np
+import pygame
+import constants
+
+from utils.fixed_point import FIXED_HALF, FIXED_SHIFT, to_fixed
+from utils.scaling import get_scale, scale_point
+
+
+def simulate_trajectories(
+    runs: list[tuple[np.ndarray, int]],
+    x: int = 70,
+    y: int = 90,
+    fixed_point: bool = False,
+) -> list[np.ndarray]:
+    """Replays recorded jump timings through the bird physics, all runs at once.
+
+    Mirrors `Bird.movement` and `Bird.jump` as applied by `step_playing`: on frame `n`
+    (counted from 1) the bird moves, then jumps if `n` is one of the run's jump frames.
+    In fixed-point mode heights and velocities are int32 subpixels, like a fixed-point
+    `Bird`; rows are rounded the same way in both modes.
+
+    Args:
+        runs (list[tuple[np.ndarray, int]]): Jump frames and length of each run,
+            as returned by `load_top_runs`.
+        x (int, optional): Horizontal start position. Defaults to 70.
+        y (int, optional): Vertical start position. Defaults to 90.
+        fixed_point (bool, optional): Whether to integrate in fixed point.
+            Defaults to False.
+
+    Returns:
+        list[np.ndarray]: One int16 array of shape (frames, 2) per run; row `n - 1` is
+        the bird's position after frame `n`.
+    """
+    if not runs:
+        return []
+
+    lengths = np.array([frames for _, frames in runs], dtype=np.int64)
+    longest = int(lengths.max())
+    jumps = np.zeros((longest + 1, len(runs)), dtype=bool)
+    for column, (jump_frames, frames) in enumerate(runs):
+        jumps[jump_frames[(jump_frames > 0) & (jump_frames <= frames)], column] = True
+
+    rows = np.empty((longest, len(runs)), dtype=np.int16)
+    if fixed_point:
+        _integrate_fixed(rows, jumps, y)
+    else:
+        floor = float(constants.SCREEN_HEIGHT - constants.BIRD_SIZE)
+        heights = np.full(len(runs), float(y))
+        velocities = np.zeros(len(runs))
+        landed = np.empty(len(runs), dtype=bool)
+        # Ufuncs writing into preallocated arrays: masked assignment is far slower
+        for frame in range(1, longest + 1):
+            velocities += constants.BIRD_GRAVITY
+            heights += velocities
+            np.greater_equal(heights, floor, out=landed)
+            np.clip(heights, 0.0, floor, out=heights)
+            np.putmask(velocities, landed, 0.0)
+            np.rint(heights, out=rows[frame - 1], casting="unsafe")
+            np.putmask(velocities, jumps[frame], constants.BIRD_JUMP_FORCE)
+
+    trajectories = []
+    for column, frames in enumerate(lengths.tolist()):
+        trajectory = np.empty((frames, 2), dtype=np.int16)
+        trajectory[:, 0] = x
+        trajectory[:, 1] = rows[:frames, column]
+        trajectories.append(trajectory)
+    return trajectories
+
+
+def _integrate_fixed(rows: np.ndarray, jumps: np.ndarray, y: int) -> None:
+    """Fills the rows of `simulate_trajectories` with fixed-point integer physics.
+
+    Args:
+        rows (np.ndarray): Output heights in pixels, of shape (frames, runs).
+        jumps (np.ndarray): Jump flags of shape (frames + 1, runs).
+        y (int): Vertical start position.
+
+    Returns:
+        None
+    """
+    gravity = to_fixed(constants.BIRD_GRAVITY)
+    jump_force = to_fixed(constants.BIRD_JUMP_FORCE)
+    floor = to_fixed(constants.SCREEN_HEIGHT - constants.BIRD_SIZE)
+
+    heights = np.full(rows.shape[1], to_fixed(y), dtype=np.int32)
+    velocities = np.zeros(rows.shape[1], dtype=np.int32)
+    landed = np.empty(rows.shape[1], dtype=bool)
+    pixels = np.empty_like(heights)
+    for frame in range(1, rows.shape[0] + 1):
+        velocities += gravity
+        heights += velocities
+        np.greater_equal(heights, floor, out=landed)
+        np.clip(heights, 0, floor, out=heights)
+        np.putmask(velocities, landed, 0)
+
+        # Nearest pixel with halves to even, like `np.rint` on the float path: adding
+        # just under half, plus one for odd pixels, carries exactly when rounding up
+        np.right_shift(heights, FIXED_SHIFT, out=pixels)
+        pixels &= 1
+        pixels += heights
+        pixels += FIXED_HALF - 1
+        np.right_shift(pixels, FIXED_SHIFT, out=rows[frame - 1], casting="unsafe")
+        np.putmask(velocities, jumps[frame], jump_force)
+
+
+class GhostManager:
+    """Replays stored trajectories as ghosts and records the live run as a new one."""
+
+    def __init__(
+        self: GhostManager,
+        surface: pygame.Surface,
+        alpha: int = 96,
+        recording_capacity: int = 4096,
+    ) -> None:
+        """Creates an empty ghost set.
+
+        Args:
+            surface (pygame.Surface): Ghost sprite in logical size; colorkeyed pixels
+                stay transparent.
+            alpha (int, optional): Opacity of the ghosts, 0-255. Defaults to 96.
+            recording_capacity (int, optional): Frames preallocated for recording the
+                live run; the buffer doubles when full. Defaults to 4096.
+        """
+        self.__surface = surface
+        self.__alpha = alpha
+        self.__sprite: pygame.Surface | None = None
+        self.__sprite_size: tuple[int, int] = (0, 0)
+        self.__sprite_offset = np.zeros(2, dtype=np.int32)
+
+        # Trajectory i occupies rows starts[i] to starts[i] + lengths[i] of positions
+        self.__positions = np.zeros((0, 2), dtype=np.int16)
+        self.__starts = np.zeros(0, dtype=np.int64)
+        self.__lengths = np.zeros(0, dtype=np.int64)
+
+        self.__recording = np.zeros((recording_capacity, 2), dtype=np.int16)
+        self.__frame: int = 0
+
+    def extend(self: GhostManager, trajectories: list[np.ndarray]) -> None:
+        """Adds ghosts.
+
+        Args:
+            trajectories (list[np.ndarray]): Positions of shape (frames, 2) per ghost.
+
+        Returns:
+            None
+        """
+        trajectories = [trajectory for trajectory in trajectories if len(trajectory)]
+        if not trajectories:
+            return
+
+        lengths = np.array([len(trajectory) for trajectory in trajectories], dtype=np.int64)
+        starts = len(self.__positions) + np.cumsum(lengths) - lengths
+        self.__positions = np.concatenate(
+            [self.__positions] + [trajectory.astype(np.int16) for trajectory in trajectories]
+        )
+        self.__starts = np.concatenate([self.__starts, starts])
+        self.__lengths = np.concatenate([self.__lengths, lengths])
+
+    def start_run(self: GhostManager) -> None:
+        """Rewinds every ghost and starts recording a new live run.
+
+        Returns:
+            None
+        """
+        self.__frame = 0
+
+    def step(self: GhostManager, x: float, y: float) -> None:
+        """Records the live bird after a simulated frame and advances the ghosts.
+
+        Args:
+            x (float): Horizontal position of the live bird.
+            y (float): Vertical position of the live bird.
+
+        Returns:
+            None
+        """
+        if self.__frame == len(self.__recording):
+            self.__recording = np.concatenate(
+                [self.__recording, np.zeros_like(self.__recording)]
+            )
+        self.__recording[self.__frame, 0] = round(x)
+        self.__recording[self.__frame, 1] = round(y)
+        self.__frame += 1
+
+    def end_run(self: GhostManager) -> None:
+        """Adds the recorded live run as a ghost for the following runs.
+
+        Returns:
+            None
+        """
+        self.extend([self.__recording[:self.__frame].copy()])
+
+    def __get_sprite(self: GhostManager, scale: float) -> pygame.Surface:
+        """Gets the translucent ghost sprite for a resolution, creating it on first use.
+
+        Also sets the offset of the cropped sprite from the ghost's position.
+
+        Args:
+            scale (float): Pixels per logical unit of the screen.
+
+        Returns:
+            pygame.Surface: The cropped sprite with per-pixel alpha.
+        """
+        size = scale_point(self.__surface.get_size(), scale)
+        if self.__sprite is None or self.__sprite_size != size:
+            sprite = self.__surface
+            if sprite.get_size() != size:
+                sprite = pygame.transform.scale(sprite, size)
+            sprite = sprite.convert_alpha()
+            sprite.fill(
+                (255, 255, 255, self.__alpha), special_flags=pygame.BLEND_RGBA_MULT
+            )
+            visible = sprite.get_bounding_rect()
+            self.__sprite = sprite.subsurface(visible).copy()
+            self.__sprite_size = size
+            self.__sprite_offset[:] = visible.topleft
+        return self.__sprite
+
+    def draw(self: GhostManager, screen: pygame.Surface) -> None:
+        """Draws every ghost that is still flying and on screen.
+
+        Args:
+            screen (pygame.Surface): The main display surface or framebuffer.
+
+        Returns:
+            None
+        """
+        if not len(self.__lengths):
+            return
+
+        scale = get_scale(screen)
+        sprite = self.__get_sprite(scale)
+        index = max(self.__frame - 1, 0)
+
+        positions = self.__positions[self.__starts[self.__lengths > index] + index]
+        if scale != 1.0:
+            positions = np.rint(positions * scale).astype(np.int32)
+        positions = positions + self.__sprite_offset
+
+        width, height = sprite.get_size()
+        screen_width, screen_height = screen.get_size()
+        x = positions[:, 0]
+        y = positions[:, 1]
+        visible = (x > -width) & (x < screen_width) & (y > -height) & (y < screen_height)
+
+        screen.blits(
+            zip(itertools.repeat(sprite), positions[visible].tolist()), doreturn=False
+        )
+
+    @property
+    def count(self: GhostManager) -> int:
+        """Gets the number of stored ghosts.
+
+        Returns:
+            int: The number of trajectories.
+        """
+        return len(self.__lengths)
+
+    @property
+    def frame(self: GhostManager) -> int:
+        """Gets the number of frames recorded in the current run.
+
+        Returns:
+            int: Frames since `start_run`.
+        """
+        return self.__frame
@@ -0,0 +1,173 @@
+from __future__ import annotations
+from typing import Any
+
+import os
+import threading
+import time
+
+from managers.sqlite_writer import SQLiteWriter
+
+LEADERBOARD_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS scores (
+    profile TEXT NOT NULL,
+    seed INTEGER,
+    score INTEGER NOT NULL,
+    achieved_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_board ON scores (profile, seed, score DESC);
+"""
+
+# Schema changes since the first release, applied once per database in order
+LEADERBOARD_MIGRATIONS: list[str] = [
+    # Authored courses get boards of their own: NULL for generated courses
+    """
+    ALTER TABLE scores ADD COLUMN course TEXT;
+    DROP INDEX scores_by_board;
+    CREATE INDEX scores_by_board ON scores (profile, seed, course, score DESC);
+    """,
+]
+
+_INSERT_SCORE: str = (
+    "INSERT INTO scores (profile, seed, score, achieved_at, course) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_SELECT_TOP: str = (
+    "SELECT score FROM scores WHERE profile = ? AND seed IS ? AND course IS ? "
+    "ORDER BY score DESC LIMIT ?"
+)
+
+
+class LeaderboardManager:
+    """Persistent top-N scores per profile, course seed and authored course.
+
+    Scores are written by a background `SQLiteWriter`, and every board is mirrored in an
+    in-memory cache that is updated immediately on submit. Reading a board for the
+    game-over screen therefore never touches the disk.
+    """
+
+    def __init__(self: LeaderboardManager, path: str, size: int = 5) -> None:
+        """Opens the score database in the background.
+
+        Args:
+            path (str): Path of the SQLite database; its directory is created if needed.
+            size (int, optional): Number of scores kept per board. Defaults to 5.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.__writer = SQLiteWriter(
+            path, LEADERBOARD_SCHEMA, migrations=LEADERBOARD_MIGRATIONS
+        )
+        self.__size = size
+        self.__boards: dict[tuple[str, int | None, str | None], list[int]] = {}
+        self.__lock = threading.Lock()
+
+    def load(
+        self: LeaderboardManager,
+        profile: str,
+        seed: int | None,
+        course: str | None = None,
+    ) -> None:
+        """Starts loading a board from disk; its cache fills in when the read completes.
+
+        Args:
+            profile (str): Player profile name.
+            seed (int | None): Course seed, or None for random courses.
+            course (str | None, optional): Authored course, or None for generated
+                courses. Defaults to None.
+
+        Returns:
+            None
+        """
+        key = (profile, seed, course)
+        with self.__lock:
+            self.__boards.setdefault(key, [])
+
+        def merge(rows: list[tuple[Any, ...]]) -> None:
+            with self.__lock:
+                board = self.__boards[key]
+                board.extend(row[0] for row in rows)
+                board.sort(reverse=True)
+                del board[self.__size:]
+
+        self.__writer.query(_SELECT_TOP, (profile, seed, course, self.__size), merge)
+
+    def submit(
+        self: LeaderboardManager,
+        profile: str,
+        seed: int | None,
+        score: int,
+        course: str | None = None,
+    ) -> None:
+        """Records a finished run without waiting for the disk.
+
+        The cache is updated at once. Should the writer have fallen too far behind, the
+        score is dropped from the database rather than stall the frame.
+
+        Args:
+            profile (str): Player profile name.
+            seed (int | None): Course seed, or None for random courses.
+            score (int): Final score of the run.
+            course (str | None, optional): Authored course, or None for generated
+                courses. Defaults to None.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            board = self.__boards.setdefault((profile, seed, course), [])
+            board.append(score)
+            board.sort(reverse=True)
+            del board[self.__size:]
+
+        self.__writer.submit(_INSERT_SCORE, [(profile, seed, score, time.time(), course)])
+
+    def top_scores(
+        self: LeaderboardManager,
+        profile: str,
+        seed: int | None,
+        course: str | None = None,
+    ) -> list[int]:
+        """Gets the cached best scores of a board.
+
+        Args:
+            profile (str): Player profile name.
+            seed (int | None): Course seed, or None for random courses.
+            course (str | None, optional): Authored course, or None for generated
+                courses. Defaults to None.
+
+        Returns:
+            list[int]: Up to `size` scores, best first.
+        """
+        with self.__lock:
+            return list(self.__boards.get((profile, seed, course), ()))
+
+    def high_score(
+        self: LeaderboardManager,
+        profile: str,
+        seed: int | None,
+        course: str | None = None,
+    ) -> int:
+        """Gets the cached best score of a board.
+
+        Args:
+            profile (str): Player profile name.
+            seed (int | None): Course seed, or None for random courses.
+            course (str | None, optional): Authored course, or None for generated
+                courses. Defaults to None.
+
+        Returns:
+            int: The best score, or 0 if the board is empty.
+        """
+        with self.__lock:
+            board = self.__boards.get((profile, seed, course))
+            return board[0] if board else 0
+
+    def close(self: LeaderboardManager) -> None:
+        """Commits pending scores and stops the writer thread.
+
+        Returns:
+            None
+        """
+        self.__writer.close()
@@ -0,0 +1,512 @@
+"""Menus and text overlays drawn by the game's screens, and their input handling.
+
+Button layouts are in logical pixels and scaled to the framebuffer when drawn, so the
+screens compute them once and pass them back in. Hover highlights and blended overlays
+can be turned off, as the quality governor does under load.
+"""
+from __future__ import annotations
+
+import sys
+
+import pygame
+import constants
+
+from managers.font_manager import FontManager
+from managers.render_manager import dim
+from managers.score_manager import ScoreManager
+from utils.scaling import get_scale, scale_point, scale_rect, to_pixels
+
+# Fonts and static labels shared by every screen
+fonts: FontManager = FontManager()
+
+
+def draw_score(screen: pygame.Surface, score_manager: ScoreManager) -> None:
+    """Draw the current score in the top left corner.
+
+    Args:
+        screen (pygame.Surface): The main display surface.
+        score_manager (ScoreManager): The score manager containing current score.
+    """
+    # Initialize font module if not already done
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+    scale = get_scale(screen)
+    # Re-rendered only when the score changes, so a frame allocates no text
+    score_text = fonts.render_counter(
+        "arial", to_pixels(36, scale), "Score: ", score_manager.score, constants.BLACK
+    )
+
+    if score_text:
+        screen.blit(score_text, scale_point((20, 20), scale))
+    else:
+        # Draw simple score indicator if font fails
+        pygame.draw.rect(screen, constants.BLACK, scale_rect((20, 20, 100, 30), scale))
+
+
+def _get_font(font_name: str, size: int) -> pygame.font.Font | None:
+    """Get a font object with fallback options.
+
+    Fonts are created once and reused; the system font lookup is cached on disk.
+
+    Args:
+        font_name: Name of the font (e.g., "arial") or None for default.
+        size: Font size in pixels.
+
+    Returns:
+        pygame.font.Font object or None if all attempts fail.
+    """
+    return fonts.get_font(font_name, size)
+
+
+def _draw_game_over_overlay(screen: pygame.Surface, blended: bool = True) -> None:
+    """Draw a semi-transparent overlay to dim the background.
+
+    Args:
+        screen (pygame.Surface): The main display surface.
+        blended (bool, optional): Whether to alpha blend the overlay rather than
+            multiply by it. Defaults to True.
+
+    Returns:
+        None
+    """
+    dim(screen, 128, blended)
+
+
+def _draw_game_over_texts(screen: pygame.Surface, score_manager: ScoreManager) -> None:
+    """Draw game over text, final score, and high score.
+
+    Args:
+        screen (pygame.Surface): The main display surface.
+        score_manager (ScoreManager): The score manager containing final score.
+
+    Returns:
+        None
+    """
+    scale = get_scale(screen)
+    font_size = to_pixels(55, scale)
+    font = _get_font("arial", font_size)
+
+    if font:
+        center_x = constants.SCREEN_WIDTH // 2
+        center_y = constants.SCREEN_HEIGHT // 2
+
+        game_over_text = fonts.render_text("arial", font_size, "GAME OVER", constants.RED)
+        text_rect = game_over_text.get_rect(
+            center=scale_point((center_x, center_y - 150), scale)
+        )
+        screen.blit(game_over_text, text_rect)
+
+        score_text = fonts.render_counter(
+            "arial", font_size, "Final Score: ", score_manager.score, constants.WHITE
+        )
+        score_rect = score_text.get_rect(center=scale_point((center_x, center_y - 80), scale))
+        screen.blit(score_text, score_rect)
+
+        high_score_text = fonts.render_counter(
+            "arial", font_size, "High Score: ", score_manager.high_score, constants.WHITE
+        )
+        high_score_rect = high_score_text.get_rect(
+            center=scale_point((center_x, center_y - 20), scale)
+        )
+        screen.blit(high_score_text, high_score_rect)
+
+        _draw_leaderboard(screen, score_manager.top_scores)
+    else:
+        center_x = constants.SCREEN_WIDTH // 2
+        center_y = constants.SCREEN_HEIGHT // 2
+        rect_width = 300
+        rect_height = 50
+
+        pygame.draw.rect(
+            screen,
+            constants.RED,
+            scale_rect(
+                (center_x - rect_width // 2, center_y - 200, rect_width, rect_height), scale
+            ),
+        )
+        pygame.draw.rect(
+            screen,
+            constants.WHITE,
+            scale_rect(
+                (center_x - rect_width // 2, center_y - 130, rect_width, rect_height), scale
+            ),
+        )
+        pygame.draw.rect(
+            screen,
+            constants.WHITE,
+            scale_rect(
+                (center_x - rect_width // 2, center_y - 70, rect_width, rect_height), scale
+            ),
+        )
+
+
+def _draw_leaderboard(screen: pygame.Surface, top_scores: list[int]) -> None:
+    """Draw the cached leaderboard in the right-hand column of the game over screen.
+
+    Args:
+        screen (pygame.Surface): The main display surface.
+        top_scores (list[int]): Best persisted scores, best first.
+
+    Returns:
+        None
+    """
+    scale = get_scale(screen)
+    font_size = to_pixels(28, scale)
+    font = _get_font("arial", font_size)
+    if not font or not top_scores:
+        return
+
+    column_x = constants.SCREEN_WIDTH - 90
+    row_y = constants.SCREEN_HEIGHT // 2 - 150
+    header = fonts.render_text("arial", font_size, "Top Scores", constants.WHITE)
+    screen.blit(header, header.get_rect(center=scale_point((column_x, row_y), scale)))
+
+    for rank, score in enumerate(top_scores, start=1):
+        # Rendered again only when the score at this rank changes
+        row_text = fonts.render_counter(
+            "arial", font_size, f"{rank}. ", score, constants.WHITE
+        )
+        screen.blit(
+            row_text,
+            row_text.get_rect(center=scale_point((column_x, row_y + rank * 34), scale)),
+        )
+
+
+def _draw_game_over_buttons(
+    screen: pygame.Surface,
+    buttons: dict[str, pygame.Rect] | None = None,
+    hover: bool = True,
+) -> None:
+    """Draw restart and exit buttons with hover effects.
+
+    Args:
+        screen (pygame.Surface): The main display surface.
+        buttons (dict[str, pygame.Rect] | None, optional): Cached button rectangles.
+            Defaults to None (computed).
+        hover (bool, optional): Whether to highlight the button under the mouse.
+            Defaults to True.
+    """
+    buttons = buttons or get_game_over_button_rects()
+    # Without hover effects the mouse is not even queried
+    mouse_pos = pygame.mouse.get_pos() if hover else None
+    scale = get_scale(screen)
+    font_size = to_pixels(36, scale)
+
+    for name, rect in buttons.items():
+        is_hover = mouse_pos is not None and rect.collidepoint(mouse_pos)
+        base_color = (70, 130, 180)  # steel blue
+        hover_color = (100, 149, 237)  # cornflower blue
+        color = hover_color if is_hover else base_color
+        button_rect = scale_rect(rect, scale)
+        pygame.draw.rect(screen, color, button_rect, border_radius=to_pixels(8, scale))
+
+        # Button text
+        button_font = _get_font("arial", font_size)
+        if button_font:
+            label = "Restart" if name == "restart" else "Exit"
+            text_surf = fonts.render_text("arial", font_size, label, constants.WHITE)
+            text_rect = text_surf.get_rect(center=button_rect.center)
+            screen.blit(text_surf, text_rect)
+
+
+def draw_game_over_menu(
+    screen: pygame.Surface,
+    score_manager: ScoreManager,
+    buttons: dict[str, pygame.Rect] | None = None,
+    hover: bool = True,
+    blended: bool = True,
+) -> None:
+    """Draw the game over menu with restart and exit options.
+
+    Args:
+        screen (pygame.Surface): The main display surface.
+        score_manager (ScoreManager): The score manager containing final score.
+        buttons (dict[str, pygame.Rect] | None, optional): Cached button rectangles.
+            Defaults to None (computed).
+        hover (bool, optional): Whether to highlight the button under the mouse.
+            Defaults to True.
+        blended (bool, optional): Whether to alpha blend the overlay rather than
+            multiply by it. Defaults to True.
+    """
+    _draw_game_over_overlay(screen, blended)
+    _draw_game_over_texts(screen, score_manager)
+    _draw_game_over_buttons(screen, buttons, hover)
+
+
+def handle_game_over_input(keys_pressed: pygame.key.ScancodeWrapper) -> str:
+    """Handle input during game over menu.
+
+    Args:
+        keys_pressed (pygame.key.ScancodeWrapper): Pressed state of all keys.
+
+    Returns:
+        str: Action to take - "restart", "exit", or "none"
+    """
+    if keys_pressed[pygame.K_r]:
+        return "restart"
+    if keys_pressed[pygame.K_RETURN] or keys_pressed[pygame.K_SPACE]:
+        return "restart"
+    if keys_pressed[pygame.K_ESCAPE]:
+        return "exit"
+    return "none"
+
+
+def get_menu_button_rects() -> dict[str, pygame.Rect]:
+    """Compute rectangles for main menu buttons.
+
+    Returns:
+        dict[str, pygame.Rect]: Mapping of button name to its rectangle.
+    """
+    center_x: int = constants.SCREEN_WIDTH // 2
+    total_height: int = constants.BUTTON_HEIGHT * 2 + constants.BUTTON_SPACING
+    origin_y: int = constants.SCREEN_HEIGHT // 2 - total_height // 2
+    start_button_rect = pygame.Rect(
+        center_x - constants.BUTTON_WIDTH // 2,
+        origin_y,
+        constants.BUTTON_WIDTH,
+        constants.BUTTON_HEIGHT,
+    )
+    exit_button_rect = pygame.Rect(
+        center_x - constants.BUTTON_WIDTH // 2,
+        origin_y + constants.BUTTON_HEIGHT + constants.BUTTON_SPACING,
+        constants.BUTTON_WIDTH,
+        constants.BUTTON_HEIGHT,
+    )
+    return {"start": start_button_rect, "exit": exit_button_rect}
+
+
+def draw_main_menu(
+    screen: pygame.Surface,
+    buttons: dict[str, pygame.Rect] | None = None,
+    hover: bool = True,
+) -> None:
+    """Draw the main menu UI with 'Start' and 'Exit' buttons.
+
+    Args:
+        screen (pygame.Surface): The main display surface.
+        buttons (dict[str, pygame.Rect] | None, optional): Cached button rectangles.
+            Defaults to None (computed).
+        hover (bool, optional): Whether to highlight the button under the mouse.
+            Defaults to True.
+    """
+    # Title
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+    scale = get_scale(screen)
+    title_size = to_pixels(64, scale)
+    title_font = _get_font("arial", title_size)
+
+    if title_font:
+        title_text = fonts.render_text("arial", title_size, "Flappy Bird", constants.BLACK)
+        title_rect = title_text.get_rect(
+            center=scale_point(
+                (constants.SCREEN_WIDTH // 2, constants.SCREEN_HEIGHT // 2 - 140), scale
+            )
+        )
+        screen.blit(title_text, title_rect)
+
+    # Buttons
+    buttons = buttons or get_menu_button_rects()
+    # Without hover effects the mouse is not even queried
+    mouse_pos = pygame.mouse.get_pos() if hover else None
+    font_size = to_pixels(36, scale)
+
+    for name, rect in buttons.items():
+        is_hover = mouse_pos is not None and rect.collidepoint(mouse_pos)
+        base_color = (70, 130, 180)  # steel blue
+        hover_color = (100, 149, 237)  # cornflower blue
+        color = hover_color if is_hover else base_color
+        button_rect = scale_rect(rect, scale)
+        pygame.draw.rect(screen, color, button_rect, border_radius=to_pixels(8, scale))
+
+        # Button text
+        button_font = _get_font("arial", font_size)
+
+        if button_font:
+            label = "Start" if name == "start" else "Exit"
+            text_surf = fonts.render_text("arial", font_size, label, constants.WHITE)
+            text_rect = text_surf.get_rect(center=button_rect.center)
+            screen.blit(text_surf, text_rect)
+
+
+def get_confirm_exit_button_rects() -> dict[str, pygame.Rect]:
+    center_x: int = constants.SCREEN_WIDTH // 2
+    origin_y: int = constants.SCREEN_HEIGHT // 2 + 30
+    yes_rect = pygame.Rect(
+        center_x - constants.BUTTON_WIDTH - constants.BUTTON_SPACING // 2,
+        origin_y,
+        constants.BUTTON_WIDTH,
+        constants.BUTTON_HEIGHT,
+    )
+    no_rect = pygame.Rect(
+        center_x + constants.BUTTON_SPACING // 2,
+        origin_y,
+        constants.BUTTON_WIDTH,
+        constants.BUTTON_HEIGHT,
+    )
+    return {"yes": yes_rect, "no": no_rect}
+
+
+def draw_confirm_exit_dialog(
+    screen: pygame.Surface,
+    buttons: dict[str, pygame.Rect] | None = None,
+    hover: bool = True,
+) -> None:
+    """Draw the confirm-exit question and its Yes and No buttons.
+
+    Args:
+        screen (pygame.Surface): The main display surface, already dimmed.
+        buttons (dict[str, pygame.Rect] | None, optional): Cached button rectangles.
+            Defaults to None (computed).
+        hover (bool, optional): Whether to highlight the button under the mouse.
+            Defaults to True.
+    """
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+    scale = get_scale(screen)
+    title_size = to_pixels(48, scale)
+    title_font = _get_font("arial", title_size)
+
+    if title_font:
+        msg = "Are you sure you want to exit?"
+        title_text = fonts.render_text("arial", title_size, msg, constants.WHITE)
+        title_rect = title_text.get_rect(
+            center=scale_point(
+                (constants.SCREEN_WIDTH // 2, constants.SCREEN_HEIGHT // 2 - 40), scale
+            )
+        )
+        screen.blit(title_text, title_rect)
+
+    buttons = buttons or get_confirm_exit_button_rects()
+    # Without hover effects the mouse is not even queried
+    mouse_pos = pygame.mouse.get_pos() if hover else None
+    font_size = to_pixels(36, scale)
+    for name, rect in buttons.items():
+        is_hover = mouse_pos is not None and rect.collidepoint(mouse_pos)
+        base_color = (178, 34, 34) if name == "yes" else (70, 130, 180)
+        hover_color = (220, 20, 60) if name == "yes" else (100, 149, 237)
+        color = hover_color if is_hover else base_color
+        button_rect = scale_rect(rect, scale)
+        pygame.draw.rect(screen, color, button_rect, border_radius=to_pixels(8, scale))
+
+        button_font = _get_font("arial", font_size)
+        if button_font:
+            label = "Yes" if name == "yes" else "No"
+            text_surf = fonts.render_text("arial", font_size, label, constants.WHITE)
+            text_rect = text_surf.get_rect(center=button_rect.center)
+            screen.blit(text_surf, text_rect)
+
+
+def handle_main_menu_input(
+    events: list[pygame.event.Event], buttons: dict[str, pygame.Rect] | None = None
+) -> str:
+    """Handle input for the main menu.
+
+    Args:
+        events (list[pygame.event.Event]): Events of the frame.
+        buttons (dict[str, pygame.Rect] | None, optional): Cached button rectangles.
+            Defaults to None (computed).
+
+    Returns:
+        str: "start", "exit", or "none"
+    """
+    buttons = buttons or get_menu_button_rects()
+    for event in events:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if buttons["start"].collidepoint(event.pos):
+                return "start"
+            if buttons["exit"].collidepoint(event.pos):
+                return "exit"
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+                return "start"
+            if event.key == pygame.K_ESCAPE:
+                return "exit"
+    return "none"
+
+
+def get_game_over_button_rects() -> dict[str, pygame.Rect]:
+    """Compute rectangles for Game Over buttons (Restart, Exit) with same style as main menu.
+    """
+    center_x: int = constants.SCREEN_WIDTH // 2
+    # Place buttons below the score block
+    origin_y: int = constants.SCREEN_HEIGHT // 2 + 30
+    restart_rect = pygame.Rect(
+        center_x - constants.BUTTON_WIDTH // 2,
+        origin_y,
+        constants.BUTTON_WIDTH,
+        constants.BUTTON_HEIGHT,
+    )
+    exit_rect = pygame.Rect(
+        center_x - constants.BUTTON_WIDTH // 2,
+        origin_y + constants.BUTTON_HEIGHT + constants.BUTTON_SPACING,
+        constants.BUTTON_WIDTH,
+        constants.BUTTON_HEIGHT,
+    )
+    return {"restart": restart_rect, "exit": exit_rect}
+
+
+def handle_game_over_input_events(
+    events: list[pygame.event.Event], buttons: dict[str, pygame.Rect] | None = None
+) -> str:
+    """Handle mouse/keyboard events for Game Over menu (clickable buttons).
+
+    Args:
+        events (list[pygame.event.Event]): Events of the frame.
+        buttons (dict[str, pygame.Rect] | None, optional): Cached button rectangles.
+            Defaults to None (computed).
+
+    Returns:
+        str: "restart", "exit", or "none"
+    """
+    buttons = buttons or get_game_over_button_rects()
+    for event in events:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if buttons["restart"].collidepoint(event.pos):
+                return "restart"
+            if buttons["exit"].collidepoint(event.pos):
+                return "exit"
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_RETURN, pygame.K_SPACE, pygame.K_r):
+                return "restart"
+            if event.key == pygame.K_ESCAPE:
+                return "exit"
+    return "none"
+
+
+def handle_keys_pressed_events(keys_pressed: pygame.key.ScancodeWrapper) -> bool:
+    """Handle per-frame keyboard state (escape to quit); return True if space (jump) is held."""
+    if keys_pressed[pygame.K_ESCAPE]:
+        sys.exit(1)
+
+    return bool(keys_pressed[pygame.K_SPACE])
+
+
+def handle_confirm_exit_input(
+    events: list[pygame.event.Event], buttons: dict[str, pygame.Rect] | None = None
+) -> str:
+    """Handle input for the confirm-exit modal.
+
+    Args:
+        events (list[pygame.event.Event]): Events of the frame.
+        buttons (dict[str, pygame.Rect] | None, optional): Cached button rectangles.
+            Defaults to None (computed).
+
+    Returns: "yes", "no", or "none"
+    """
+    buttons = buttons or get_confirm_exit_button_rects()
+    for event in events:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if buttons["yes"].collidepoint(event.pos):
+                return "yes"
+            if buttons["no"].collidepoint(event.pos):
+                return "no"
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_y, pygame.K_RETURN):
+                return "yes"
+            if event.key in (pygame.K_n, pygame.K_ESCAPE):
+                return "no"
+    return "none"
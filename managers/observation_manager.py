@@ -0,0 +1,313 @@
+"""Fixed-length observations of a running game, for bots and learning agents.
+
+An `Observer` writes what an agent needs to know each tick into a caller-provided
+float32 buffer: the bird's height and velocity, the next two gaps and the pipes' speed,
+optionally followed by the distances of a fan of rays cast from the bird against the
+pipes, the ceiling and the floor. Pairs are found with `PipeManager.get_next_pair`,
+and every intermediate NumPy array is preallocated, so observing allocates nothing.
+
+All values are in logical units: pixels, and pixels per frame.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+import constants
+
+if TYPE_CHECKING:
+    from entities.bird import Bird
+    from entities.pipe_pair import PipePair
+    from managers.pipe_manager import PipeManager
+
+# Layout of the features in front of the ray distances. A gap that does not exist
+# (the end of an authored course) is reported a screen width ahead and fully open
+FEATURE_NAMES: list[str] = [
+    "bird_y",
+    "bird_velocity",
+    "gap_distance",
+    "gap_top",
+    "gap_bottom",
+    "next_gap_distance",
+    "next_gap_top",
+    "next_gap_bottom",
+    "speed",
+]
+
+# Extent of the ceiling and floor boxes the rays can hit, far beyond any ray
+_FAR: float = 1e6
+
+
+class Observer:
+    """Encodes one bird's view of its course as a float32 feature vector."""
+
+    def __init__(
+        self: Observer,
+        bird: Bird,
+        pipe_manager: PipeManager,
+        rays: int = 0,
+        ray_length: float = constants.SCREEN_WIDTH / 2,
+        ray_spread: float = 120.0,
+        max_pairs: int = 4,
+    ) -> None:
+        """Creates an observer and preallocates everything ray casting needs.
+
+        Args:
+            bird (Bird): The observed bird.
+            pipe_manager (PipeManager): The bird's pipes.
+            rays (int, optional): Number of rays, 0 to cast none. Defaults to 0.
+            ray_length (float, optional): Distance reported by rays that hit nothing.
+                Defaults to half the screen width.
+            ray_spread (float, optional): Angle in degrees between the first and the
+                last ray, centered on the flight direction. Defaults to 120.
+            max_pairs (int, optional): Pairs ahead of the bird the rays are cast
+                against; more pairs than fit on screen never matter. Defaults to 4.
+        """
+        self.__bird = bird
+        self.__pipe_manager = pipe_manager
+        self.__rays = rays
+        self.__ray_length = float(ray_length)
+        self.__max_pairs = max_pairs
+        self.__size = len(FEATURE_NAMES) + rays
+
+        bird_width, bird_height = bird.rect.size
+        self.__half_width: float = bird_width / 2
+        self.__half_height: float = bird_height / 2
+        # Reported for a missing gap, as floats so writing them allocates nothing
+        self.__far_distance: float = float(constants.SCREEN_WIDTH)
+        self.__open_top: float = 0.0
+        self.__open_bottom: float = float(constants.SCREEN_HEIGHT)
+
+        if rays:
+            self.__init_rays(ray_spread)
+
+    def __init_rays(self: Observer, ray_spread: float) -> None:
+        """Preallocates the ray directions, the box edges and every scratch array.
+
+        Boxes are stored as four edge arrays, two boxes per pair followed by the
+        ceiling and the floor; rows of missing pairs are moved far off screen. Every
+        per-ray array is laid out as (box, ray), so each NumPy call below works on
+        contiguous arrays of the same shape: broadcasting or reducing would have NumPy
+        allocate iterator buffers on every call.
+
+        Args:
+            ray_spread (float): Angle in degrees between the first and the last ray.
+
+        Returns:
+            None
+        """
+        rays = self.__rays
+        boxes = 2 * self.__max_pairs + 2
+        spread = ray_spread if rays > 1 else 0.0
+        angles = np.radians(np.linspace(-spread / 2, spread / 2, rays))
+        directions = np.stack([np.cos(angles), np.sin(angles)])
+        # A ray parallel to a box edge gets a huge finite inverse instead of infinity,
+        # which would turn into NaN for a ray starting exactly on that edge
+        directions[np.abs(directions) < 1e-9] = 1e-9
+        self.__inverse_x = np.tile(1.0 / directions[0], (boxes, 1))
+        self.__inverse_y = np.tile(1.0 / directions[1], (boxes, 1))
+
+        # Edges relative to the ray origin, rewritten every observation
+        self.__left = np.full(boxes, _FAR)
+        self.__top = np.full(boxes, _FAR)
+        self.__right = np.full(boxes, _FAR)
+        self.__bottom = np.full(boxes, _FAR)
+        # Read-only views repeating each box's edge for every ray
+        self.__edges = [
+            np.broadcast_to(edge[:, None], (boxes, rays))
+            for edge in (self.__left, self.__right, self.__top, self.__bottom)
+        ]
+
+        self.__t_left = np.empty((boxes, rays))
+        self.__t_right = np.empty((boxes, rays))
+        self.__t_top = np.empty((boxes, rays))
+        self.__t_bottom = np.empty((boxes, rays))
+        self.__enter = np.empty((boxes, rays))
+        self.__exit = np.empty((boxes, rays))
+        self.__missed = np.empty((boxes, rays), dtype=bool)
+        # 0-d arrays: a Python float operand would be converted on every call
+        self.__zero = np.array(0.0)
+        self.__length = np.array(self.__ray_length)
+
+        # Minimum over boxes as a tree of halving row blocks, views made once
+        self.__folds = []
+        remaining = boxes
+        while remaining > 1:
+            half = remaining // 2
+            self.__folds.append(
+                (self.__enter[:half], self.__enter[remaining - half : remaining])
+            )
+            remaining -= half
+        self.__hits = self.__enter[0]
+        # The rays' part of the last buffer observed into, kept while it is reused
+        self.__buffer: np.ndarray | None = None
+        self.__buffer_rays: np.ndarray | None = None
+
+    def create_buffer(self: Observer) -> np.ndarray:
+        """Allocates a buffer for `observe`, once, before the first tick.
+
+        Returns:
+            np.ndarray: A zeroed float32 array of `size` features.
+        """
+        return np.zeros(self.__size, dtype=np.float32)
+
+    def observe(self: Observer, out: np.ndarray) -> np.ndarray:
+        """Writes the current observation into a buffer.
+
+        Args:
+            out (np.ndarray): A float32 array of at least `size` elements, e.g. from
+                `create_buffer` or a row of a batch.
+
+        Returns:
+            np.ndarray: The same buffer.
+        """
+        bird = self.__bird
+        pipe_manager = self.__pipe_manager
+        out[0] = bird.y
+        out[1] = bird.velocity
+        self.__write_gap(out, 2, pipe_manager.get_next_pair(bird.x))
+        self.__write_gap(out, 5, pipe_manager.get_next_pair(bird.x, 1))
+        out[8] = pipe_manager.speed
+
+        if self.__rays:
+            self.__cast_rays(out)
+        return out
+
+    def __write_gap(
+        self: Observer, out: np.ndarray, start: int, pair: PipePair | None
+    ) -> None:
+        """Writes the distance to a pair and the top and bottom of its gap.
+
+        Args:
+            out (np.ndarray): The observation buffer.
+            start (int): Position of the pair's first feature.
+            pair (PipePair | None): The pair, or None if there is none.
+
+        Returns:
+            None
+        """
+        if pair is None:
+            out[start] = self.__far_distance
+            out[start + 1] = self.__open_top
+            out[start + 2] = self.__open_bottom
+            return
+        out[start] = pair.x - self.__bird.x
+        out[start + 1] = pair.top_pipe_height
+        out[start + 2] = pair.gap_bottom
+
+    def __cast_rays(self: Observer, out: np.ndarray) -> None:
+        """Writes the distance each ray travels before hitting a box.
+
+        Every ray is tested against every box at once with the slab method: a ray hits
+        a box if the interval in which it is between both pairs of box edges is not
+        empty and does not end behind its origin.
+
+        Args:
+            out (np.ndarray): The observation buffer; the rays follow the features.
+
+        Returns:
+            None
+        """
+        bird = self.__bird
+        pipe_manager = self.__pipe_manager
+        origin_x = bird.x + self.__half_width
+        origin_y = bird.y + self.__half_height
+        left = self.__left
+        top = self.__top
+        right = self.__right
+        bottom = self.__bottom
+
+        # Indexed loop writing edges in place: no iterator and no temporary arrays
+        pair_slot = 0
+        while pair_slot < self.__max_pairs:
+            pair = pipe_manager.get_next_pair(bird.x, pair_slot)
+            upper = 2 * pair_slot
+            lower = upper + 1
+            if pair is None:
+                left[upper] = _FAR
+                left[lower] = _FAR
+                right[upper] = _FAR
+                right[lower] = _FAR
+            else:
+                pair_left = pair.x - origin_x
+                pair_right = pair_left + pair.top_pipe.rect.width
+                left[upper] = pair_left
+                left[lower] = pair_left
+                right[upper] = pair_right
+                right[lower] = pair_right
+                top[upper] = -_FAR
+                bottom[upper] = pair.top_pipe_height - origin_y
+                top[lower] = pair.gap_bottom - origin_y
+                bottom[lower] = _FAR
+            pair_slot += 1
+        ceiling = 2 * self.__max_pairs
+        floor = ceiling + 1
+        left[ceiling] = -_FAR
+        left[floor] = -_FAR
+        right[ceiling] = _FAR
+        right[floor] = _FAR
+        top[ceiling] = -_FAR
+        bottom[ceiling] = -origin_y
+        top[floor] = constants.SCREEN_HEIGHT - origin_y
+        bottom[floor] = _FAR
+
+        # Ray parameters at which each box's edges are crossed
+        edges = self.__edges
+        t_left = self.__t_left
+        t_right = self.__t_right
+        t_top = self.__t_top
+        t_bottom = self.__t_bottom
+        np.copyto(t_left, edges[0])
+        np.copyto(t_right, edges[1])
+        np.copyto(t_top, edges[2])
+        np.copyto(t_bottom, edges[3])
+        np.multiply(t_left, self.__inverse_x, out=t_left)
+        np.multiply(t_right, self.__inverse_x, out=t_right)
+        np.multiply(t_top, self.__inverse_y, out=t_top)
+        np.multiply(t_bottom, self.__inverse_y, out=t_bottom)
+
+        enter = self.__enter
+        exit_ = self.__exit
+        np.maximum(
+            np.minimum(t_left, t_right, out=enter),
+            np.minimum(t_top, t_bottom, out=exit_),
+            out=enter,
+        )
+        np.minimum(
+            np.maximum(t_left, t_right, out=t_left),
+            np.maximum(t_top, t_bottom, out=t_top),
+            out=exit_,
+        )
+        # A ray starting inside a box hits it at distance 0
+        np.maximum(enter, self.__zero, out=enter)
+        np.less(exit_, enter, out=self.__missed)
+        np.putmask(enter, self.__missed, self.__length)
+
+        folds = self.__folds
+        fold = 0
+        while fold < len(folds):
+            kept, folded = folds[fold]
+            np.minimum(kept, folded, out=kept)
+            fold += 1
+        np.minimum(self.__hits, self.__length, out=self.__hits)
+        if out is not self.__buffer:
+            self.__buffer = out
+            self.__buffer_rays = out[len(FEATURE_NAMES) : self.__size]
+        np.copyto(self.__buffer_rays, self.__hits)
+
+    @property
+    def size(self: Observer) -> int:
+        """Gets the number of values an observation holds.
+
+        Returns:
+            int: The features plus one distance per ray.
+        """
+        return self.__size
+
+    @property
+    def rays(self: Observer) -> int:
+        """Gets the number of rays cast per observation.
+
+        Returns:
+            int: The number of rays.
+        """
+        return self.__rays
@@ -1,20 +1,38 @@
 from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+from entities.course import Course
 from entities.pipe_pair import PipePair
-from entities.pipe import Pipe
+from collections import deque
 
+import random
 import constants
 import pygame
 
+if TYPE_CHECKING:
+    from managers.atlas_manager import SpriteBatch
+    from managers.course_validator import CourseValidator
+
 
 class PipeManager:
     """Manages the lifecycle of multiple pipe pairs, including spawning, updating, drawing, and removal.
 
     Responsible for keeping pipe spacing consistent, respawning new pipes when needed,
     and providing all individual pipe sprites for collision detection.
+
+    Pipes are either generated randomly or streamed from an authored `Course`; in the
+    latter case each pair is read only once it approaches the spawn line.
     """
 
     def __init__(
-        self: PipeManager, gap: int, pipe_width: int, speed: int, spawn_distance: int
+        self: PipeManager,
+        gap: int,
+        pipe_width: int,
+        speed: int,
+        spawn_distance: int,
+        seed: int | None = None,
+        course: Course | None = None,
+        validator: CourseValidator | None = None,
+        fixed_point: bool = False,
     ) -> None:
         """Initializes the PipeManager with initial pipe pairs.
 
@@ -23,8 +41,19 @@ class PipeManager:
             pipe_width (int): Width of each pipe in pixels.
             speed (int): Leftward movement speed in pixels per frame.
             spawn_distance (int): Horizontal distance between consecutive pipe pairs in pixels.
+            seed (int | None, optional): Seed for the course's gap positions. Managers sharing
+                a seed produce identical courses. Defaults to None (unseeded).
+            course (Course | None, optional): Authored course to stream pairs from instead
+                of generating them. Defaults to None.
+            validator (CourseValidator | None, optional): Validator used to reject or repair
+                generated gaps that cannot be reached from the previous one. Defaults to None.
+            fixed_point (bool, optional): Whether to scroll the pipes in fixed point.
+                Defaults to False.
         """
         self.__pipes: list[PipePair] = []
+        # Pairs that left the screen, reused by later spawns instead of allocating new ones.
+        # A deque keeps its storage when emptied, unlike a list that frees and regrows it
+        self.__spare_pairs: deque[PipePair] = deque()
         self.__gap: int = gap
         self.__pipe_width: int = pipe_width
         self.__speed: int = speed
@@ -33,47 +62,150 @@ class PipeManager:
             int(self.__spawn_distance / self.__speed) if self.__speed > 0 else 60
         )
         self.__frames_since_last_spawn: int = 0
+        self.__seed: int | None = seed
+        self.__rng: random.Random = random.Random(seed)
+        self.__next_index: int = 0
+        self.__course: Course | None = course
+        self.__next_spawn_x: float = 0
+        self.__validator: CourseValidator | None = validator
+        self.__fixed_point: bool = fixed_point
+        # Sequence index of the pair `get_next_pair` returned last
+        self.__cursor: int = 0
+
+        self.__spawn_initial_pipes()
+
+    def __make_pipe_pair(
+        self: PipeManager, x: int, gap: int, top_pipe_height: int, index: int
+    ) -> PipePair:
+        """Gets a pipe pair at the given position, reusing a spare pair if there is one.
+
+        Args:
+            x (int): Horizontal position of the pair in pixels.
+            gap (int): Vertical gap between top and bottom pipes in pixels.
+            top_pipe_height (int): Height of the top pipe in pixels.
+            index (int): Sequence number of the pair within its course.
+
+        Returns:
+            PipePair: The pair, not yet added to the active pipes.
+        """
+        if self.__spare_pairs:
+            pipe_pair = self.__spare_pairs.pop()
+            pipe_pair.reset(x, gap, top_pipe_height, index)
+            return pipe_pair
+        return PipePair(
+            x,
+            self.__pipe_width,
+            gap,
+            self.__speed,
+            top_pipe_height=top_pipe_height,
+            index=index,
+            fixed_point=self.__fixed_point,
+        )
+
+    def __clear_pipes(self: PipeManager) -> None:
+        """Removes every active pair, keeping them for reuse.
 
+        Returns:
+            None
+        """
+        self.__spare_pairs.extend(self.__pipes)
+        self.__pipes.clear()
+
+    def __spawn_pipe_pair(self: PipeManager, x: int) -> None:
+        """Appends a new pipe pair at the given position using the course's random generator.
+
+        Args:
+            x (int): Horizontal position of the new pair in pixels.
+
+        Returns:
+            None
+        """
+        if self.__validator is not None:
+            previous_top = self.__pipes[-1].top_pipe_height if self.__pipes else None
+            top_pipe_height: int = self.__validator.next_top(previous_top, self.__rng)
+        else:
+            top_pipe_height = self.__rng.randint(
+                constants.PIPE_HEIGHT,
+                constants.SCREEN_HEIGHT - self.__gap - constants.PIPE_HEIGHT,
+            )
+        self.__pipes.append(
+            self.__make_pipe_pair(x, self.__gap, top_pipe_height, self.__next_index)
+        )
+        self.__next_index += 1
+
+    def __stream_course_pairs(self: PipeManager) -> None:
+        """Spawns every authored pair that has reached the spawn line.
+
+        Returns:
+            None
+        """
+        course = self.__course
+        spawn_x: int = constants.SCREEN_WIDTH + 100
+        while self.__next_index < len(course) and self.__next_spawn_x <= spawn_x:
+            gap_top, gap, _ = course.get_pair(self.__next_index)
+            self.__pipes.append(
+                self.__make_pipe_pair(self.__next_spawn_x, gap, gap_top, self.__next_index)
+            )
+            self.__next_index += 1
+            if self.__next_index < len(course):
+                self.__next_spawn_x += course.get_pair(self.__next_index)[2]
+
+    def __spawn_initial_pipes(self: PipeManager) -> None:
+        """Spawns the pipe pairs that are queued off-screen when a run starts.
+
+        Returns:
+            None
+        """
         start_x: int = constants.SCREEN_WIDTH + 100
+        if self.__course is not None:
+            if len(self.__course):
+                self.__next_spawn_x = start_x + self.__course.get_pair(0)[2]
+                self.__stream_course_pairs()
+            return
+
         initial_count: int = 3
         for i in range(initial_count):
-            self.__pipes.append(
-                PipePair(
-                    start_x + i * self.__spawn_distance,
-                    self.__pipe_width,
-                    self.__gap,
-                    self.__speed,
-                )
-            )
+            self.__spawn_pipe_pair(start_x + i * self.__spawn_distance)
 
     def update(self: PipeManager) -> None:
         """Updates all active pipe pairs, handles spawning new pipes, and removes off-screen pipes.
 
-        Moves each pipe pair leftward, spawns new pairs at fixed intervals,
-        and removes any pipes that have completely exited the screen.
+        Moves each pipe pair leftward, spawns new pairs at fixed intervals (or streams
+        the next authored pairs as they reach the spawn line), and removes any pipes
+        that have completely exited the screen.
 
         Returns:
             None
         """
-        for pipe in self.__pipes:
-            pipe.update()
+        # Indexed loops here, in draw and in queue, as in `check_collisions`: all three
+        # run every PLAYING frame
+        pipes = self.__pipes
+        i = 0
+        while i < len(pipes):
+            pipes[i].update()
+            i += 1
+
+        if self.__course is not None:
+            self.__next_spawn_x -= self.__speed
+            self.__stream_course_pairs()
+        else:
+            self.__frames_since_last_spawn += 1
 
-        self.__frames_since_last_spawn += 1
         if (
-            self.__frames_since_last_spawn >= self.__spawn_interval_frames
+            self.__course is None
+            and self.__frames_since_last_spawn >= self.__spawn_interval_frames
             and self.__pipes
         ):
             last_x: int = self.__pipes[-1].top_pipe.rect.x
             new_x: int = max(
                 last_x + self.__spawn_distance, constants.SCREEN_WIDTH + 100
             )
-            self.__pipes.append(
-                PipePair(new_x, self.__pipe_width, self.__gap, self.__speed)
-            )
+            self.__spawn_pipe_pair(new_x)
             self.__frames_since_last_spawn = 0
 
-        while self.__pipes and self.__pipes[0].top_pipe.rect.right < 0:
-            self.__pipes.pop(0)
+        # Compares float positions: reading Rect edges beyond 256 would allocate ints
+        while self.__pipes and self.__pipes[0].x + self.__pipe_width < 0:
+            self.__spare_pairs.append(self.__pipes.pop(0))
 
     def draw(self: PipeManager, screen: pygame.Surface) -> None:
         """Draws all active pipe pairs onto the given screen surface.
@@ -84,44 +216,162 @@ class PipeManager:
         Returns:
             None
         """
-        for pipe in self.__pipes:
-            pipe.draw(screen)
+        pipes = self.__pipes
+        i = 0
+        while i < len(pipes):
+            pipes[i].draw(screen)
+            i += 1
 
-    def get_all_pipe_sprites(self: PipeManager) -> list[Pipe]:
-        """Returns a list of all individual pipe sprites for collision detection.
+    def queue(self: PipeManager, batch: SpriteBatch) -> None:
+        """Queues all active pipe pairs for batched drawing.
+
+        Args:
+            batch (SpriteBatch): The frame's batch.
 
         Returns:
-            list[Pipe]: A list containing all top and bottom pipe sprites.
+            None
+        """
+        pipes = self.__pipes
+        i = 0
+        while i < len(pipes):
+            pipes[i].queue(batch)
+            i += 1
+
+    def get_next_pair(
+        self: PipeManager, x: float, offset: int = 0
+    ) -> PipePair | None:
+        """Gets the first pair whose right edge has not passed x, or a pair after it.
+
+        A cursor remembers the pair found by the previous call. Pairs only scroll left,
+        so for the bird's fixed x the cursor moves at most one pair per frame, and a
+        call inspects one or two pairs instead of scanning all of them. It allocates
+        nothing.
+
+        Args:
+            x (float): Horizontal position in pixels, usually the bird's left edge.
+            offset (int, optional): Number of pairs to skip after the next one, e.g. 1
+                for the pair after it. Defaults to 0.
+
+        Returns:
+            PipePair | None: The pair, or None if there are not that many pairs ahead.
+        """
+        pipes = self.__pipes
+        if not pipes:
+            return None
+
+        # Pair indices are consecutive, so the cursor maps to a list position; it falls
+        # outside the list after a reset or a restored state
+        position = self.__cursor - pipes[0].index
+        if position < 0 or position > len(pipes):
+            position = 0
+        while position > 0 and pipes[position - 1].x + self.__pipe_width >= x:
+            position -= 1
+        while position < len(pipes) and pipes[position].x + self.__pipe_width < x:
+            position += 1
+        if position < len(pipes):
+            self.__cursor = pipes[position].index
+
+        position += offset
+        if position < len(pipes):
+            return pipes[position]
+        return None
+
+    def get_state(self: PipeManager) -> tuple[Any, ...]:
+        """Captures the course's dynamic state for later restoration.
+
+        The snapshot holds only plain values (pair positions, gap heights, counters and
+        the random generator state), so taking one every frame is cheap.
+
+        Returns:
+            tuple[Any, ...]: An opaque snapshot to pass to `set_state`.
         """
-        all_sprites: list[Pipe] = []
+        return (
+            tuple(
+                (pair.x, pair.top_pipe_height, pair.gap, pair.index)
+                for pair in self.__pipes
+            ),
+            self.__frames_since_last_spawn,
+            self.__next_index,
+            self.__next_spawn_x,
+            self.__rng.getstate(),
+        )
 
-        for pipe_pair in self.__pipes:
-            top_pipe, bottom_pipe = pipe_pair.get_pipes()
-            all_sprites.append(top_pipe)
-            all_sprites.append(bottom_pipe)
+    def set_state(self: PipeManager, state: tuple[Any, ...]) -> None:
+        """Restores a snapshot previously captured with `get_state`.
 
-        return all_sprites
+        Args:
+            state (tuple[Any, ...]): The snapshot to restore.
+
+        Returns:
+            None
+        """
+        (
+            pairs,
+            self.__frames_since_last_spawn,
+            self.__next_index,
+            self.__next_spawn_x,
+            rng_state,
+        ) = state
+        self.__rng.setstate(rng_state)
+        self.__clear_pipes()
+        for x, top_pipe_height, gap, index in pairs:
+            self.__pipes.append(self.__make_pipe_pair(x, gap, top_pipe_height, index))
 
     def reset(self: PipeManager) -> None:
         """Resets the pipe manager to its initial state.
 
         Clears all current pipes, resets frame counters, and spawns initial pipe pairs.
+        A seeded manager replays the same course after every reset.
 
         Returns:
             None
         """
-        self.__pipes.clear()
+        self.__clear_pipes()
         self.__frames_since_last_spawn = 0
+        self.__next_index = 0
+        self.__rng.seed(self.__seed)
 
-        start_x: int = constants.SCREEN_WIDTH + 100
-        initial_count: int = 3
+        self.__spawn_initial_pipes()
 
-        for i in range(initial_count):
-            self.__pipes.append(
-                PipePair(
-                    start_x + i * self.__spawn_distance,
-                    self.__pipe_width,
-                    self.__gap,
-                    self.__speed,
-                )
-            )
+    @property
+    def pipe_pairs(self: PipeManager) -> list[PipePair]:
+        """Gets the active pipe pairs, ordered from left to right.
+
+        The returned list is owned by the manager and must not be modified.
+
+        Returns:
+            list[PipePair]: The active pipe pairs.
+        """
+        return self.__pipes
+
+    @property
+    def finished(self: PipeManager) -> bool:
+        """Checks whether an authored course has run out of pipes.
+
+        Returns:
+            bool: True once every pair of the course has spawned and left the screen;
+            always False for generated courses.
+        """
+        return (
+            self.__course is not None
+            and self.__next_index >= len(self.__course)
+            and not self.__pipes
+        )
+
+    @property
+    def speed(self: PipeManager) -> int:
+        """Gets the leftward movement speed of the pipes.
+
+        Returns:
+            int: Speed in pixels per frame.
+        """
+        return self.__speed
+
+    @property
+    def seed(self: PipeManager) -> int | None:
+        """Gets the seed the course is generated from.
+
+        Returns:
+            int | None: The seed, or None for an unseeded course.
+        """
+        return self.__seed
@@ -0,0 +1,202 @@
+"""Adaptive render quality that holds the target frame rate under load.
+
+`QualityGovernor` keeps a rolling window of frame times. When their mean leaves too
+little of the frame budget, it steps down one quality level: cheaper overlays, no
+hover effects, static screens redrawn only now and then, then a smaller framebuffer.
+When frames have plenty of headroom again, it steps back up one level.
+
+Two thresholds give the hysteresis. The window is also cleared after every transition,
+so each decision is based only on frames of the current level. An upgrade that
+immediately has to be undone doubles the time before the next one is tried, so a load
+right at a level's edge does not flip between two levels. Every transition is logged.
+"""
+from __future__ import annotations
+from typing import TextIO
+
+import sys
+import constants
+
+
+class QualityGovernor:
+    """Steps render quality down and up to keep frames within their budget."""
+
+    def __init__(
+        self: QualityGovernor,
+        levels: list[tuple[str, str | None, bool, bool, int]] | None = None,
+        window: int = 30,
+        budget: float = 1 / constants.FPS,
+        downgrade_load: float = 0.9,
+        upgrade_load: float = 0.5,
+        max_hold: int = 32,
+        output: TextIO | None = None,
+    ) -> None:
+        """Creates a governor at the first, best level.
+
+        Args:
+            levels (list[tuple[str, str | None, bool, bool, int]] | None, optional):
+                Levels as in `constants.GOVERNOR_LEVELS`, best first. Defaults to those.
+            window (int, optional): Frames averaged per decision. Defaults to 30.
+            budget (float, optional): Seconds a frame may take. Defaults to one frame
+                at `constants.FPS`.
+            downgrade_load (float, optional): Share of the budget a window's mean
+                frame time must exceed to step down. Defaults to 0.9.
+            upgrade_load (float, optional): Share of the budget a window's mean frame
+                time must stay under to step up. Defaults to 0.5.
+            max_hold (int, optional): Most windows to wait before trying an upgrade
+                again after upgrades failed. Defaults to 32.
+            output (TextIO | None, optional): Where transitions are logged. Defaults to
+                standard error.
+        """
+        self.__levels = list(constants.GOVERNOR_LEVELS if levels is None else levels)
+        self.__level = 0
+        self.__budget = budget
+        self.__downgrade_load = downgrade_load
+        self.__upgrade_load = upgrade_load
+        self.__max_hold = max_hold
+        self.__output = output
+
+        # Ring of the latest frame times and their running sum
+        self.__samples: list[float] = [0.0] * window
+        self.__count = 0
+        self.__next = 0
+        self.__total = 0.0
+
+        self.__frame = 0
+        self.__changed_frame = 0
+        self.__upgraded = False
+        # Windows a level must run with headroom before stepping up
+        self.__hold = 1
+        # Screen drawn last and frames until a static screen is drawn again
+        self.__static_screen: str | None = None
+        self.__static_wait = 0
+
+    def record(self: QualityGovernor, seconds: float) -> bool:
+        """Adds the time of a finished frame and changes level if it is due.
+
+        Args:
+            seconds (float): Time the frame took, excluding the frame-rate wait.
+
+        Returns:
+            bool: True if the level changed.
+        """
+        self.__frame += 1
+        samples = self.__samples
+        self.__total += seconds - samples[self.__next]
+        samples[self.__next] = seconds
+        self.__next = (self.__next + 1) % len(samples)
+        if self.__count < len(samples):
+            self.__count += 1
+            if self.__count < len(samples):
+                return False
+
+        load = self.__total / len(samples) / self.__budget
+        if load > self.__downgrade_load and self.__level < len(self.__levels) - 1:
+            # The level just upgraded to cannot hold the budget: wait longer next time
+            if self.__upgraded:
+                self.__hold = min(self.__hold * 2, self.__max_hold)
+            self.__change(self.__level + 1, load)
+            self.__upgraded = False
+            return True
+
+        held = self.__frame - self.__changed_frame >= self.__hold * len(samples)
+        if load < self.__upgrade_load and self.__level > 0 and held:
+            self.__change(self.__level - 1, load)
+            self.__upgraded = True
+            return True
+
+        # A level that held the budget for a whole hold period has proved itself
+        if self.__upgraded and held:
+            self.__upgraded = False
+        return False
+
+    def should_draw(self: QualityGovernor, screen: str, static: bool) -> bool:
+        """Decides whether a frame has to be drawn, or can keep the previous one.
+
+        Moving screens are drawn every frame. A static screen is drawn when it first
+        shows and then at the current level's interval; in between, the framebuffer
+        still holds the last frame drawn.
+
+        Args:
+            screen (str): Identifies what is shown, e.g. the game state.
+            static (bool): Whether nothing on the screen moves by itself.
+
+        Returns:
+            bool: True if the frame must be drawn.
+        """
+        if not static or screen != self.__static_screen or self.__static_wait <= 1:
+            self.__static_screen = screen if static else None
+            self.__static_wait = self.__levels[self.__level][4]
+            return True
+        self.__static_wait -= 1
+        return False
+
+    def __change(self: QualityGovernor, level: int, load: float) -> None:
+        """Switches to another level, logs it and starts a new window.
+
+        Args:
+            level (int): Index of the new level.
+            load (float): Mean frame time of the last window, as a share of the budget.
+
+        Returns:
+            None
+        """
+        print(
+            f"quality: {self.__levels[self.__level][0]} -> {self.__levels[level][0]} "
+            f"at frame {self.__frame}, mean frame "
+            f"{load * self.__budget * 1000:.1f} ms ({load:.0%} of budget)",
+            file=self.__output or sys.stderr,
+        )
+        self.__level = level
+        self.__changed_frame = self.__frame
+        self.__count = 0
+        self.__total = 0.0
+        self.__samples[:] = [0.0] * len(self.__samples)
+        self.__next = 0
+        # Redraw at once: the new level may draw differently or into a new framebuffer
+        self.__static_screen = None
+
+    @property
+    def level(self: QualityGovernor) -> int:
+        """Gets the index of the current level, 0 being the best.
+
+        Returns:
+            int: The current level.
+        """
+        return self.__level
+
+    @property
+    def name(self: QualityGovernor) -> str:
+        """Gets the name of the current level.
+
+        Returns:
+            str: The level's name.
+        """
+        return self.__levels[self.__level][0]
+
+    @property
+    def profile(self: QualityGovernor) -> str | None:
+        """Gets the framebuffer quality profile of the current level.
+
+        Returns:
+            str | None: A key of `constants.QUALITY_PROFILES`, or None to keep the
+            profile chosen at startup.
+        """
+        return self.__levels[self.__level][1]
+
+    @property
+    def blended_overlays(self: QualityGovernor) -> bool:
+        """Checks whether overlays are alpha blended rather than multiplied.
+
+        Returns:
+            bool: True for alpha-blended overlays.
+        """
+        return self.__levels[self.__level][2]
+
+    @property
+    def hover_effects(self: QualityGovernor) -> bool:
+        """Checks whether buttons are highlighted under the mouse.
+
+        Returns:
+            bool: True if buttons react to hover.
+        """
+        return self.__levels[self.__level][3]
@@ -0,0 +1,176 @@
+from __future__ import annotations
+from typing import Any, Sequence
+from entities.bird import Bird
+from managers.game_manager import check_collisions, update_score
+from managers.pipe_manager import PipeManager
+from managers.score_manager import ScoreManager
+
+import pygame
+
+
+class RaceManager:
+    """Simulates several birds racing over one shared, seeded pipe course.
+
+    The simulation never touches the display, and its whole state can be captured
+    and restored cheaply so that a rollback session can rewind and resimulate frames.
+    """
+
+    def __init__(
+        self: RaceManager,
+        birds: Sequence[Bird],
+        pipe_manager: PipeManager,
+        score_managers: Sequence[ScoreManager],
+    ) -> None:
+        """Initializes a race between the given birds.
+
+        Args:
+            birds (Sequence[Bird]): One bird per player.
+            pipe_manager (PipeManager): The shared course; should be seeded so every
+                peer generates the same pipes.
+            score_managers (Sequence[ScoreManager]): One score manager per player.
+        """
+        self.__birds: list[Bird] = list(birds)
+        self.__pipe_manager: PipeManager = pipe_manager
+        self.__score_managers: list[ScoreManager] = list(score_managers)
+        self.__alive: list[bool] = [True] * len(self.__birds)
+        self.__last_passed: list[int] = [-1] * len(self.__birds)
+        self.__frame: int = 0
+
+    def step(self: RaceManager, jumps: Sequence[bool]) -> None:
+        """Advances the race by one frame.
+
+        Args:
+            jumps (Sequence[bool]): Jump input of each player for this frame.
+
+        Returns:
+            None
+        """
+        if not any(self.__alive):
+            return
+
+        for player, bird in enumerate(self.__birds):
+            if self.__alive[player]:
+                bird.movement()
+
+        self.__pipe_manager.update()
+
+        for player, bird in enumerate(self.__birds):
+            if not self.__alive[player]:
+                continue
+
+            if jumps[player]:
+                bird.jump()
+
+            score_manager = self.__score_managers[player]
+            self.__last_passed[player] = update_score(
+                bird, self.__pipe_manager, score_manager, self.__last_passed[player]
+            )
+            if check_collisions(bird, self.__pipe_manager):
+                score_manager.update_high_score()
+                self.__alive[player] = False
+
+        self.__frame += 1
+
+    def save_state(self: RaceManager) -> tuple[Any, ...]:
+        """Captures the complete race state.
+
+        Returns:
+            tuple[Any, ...]: An opaque snapshot to pass to `load_state`.
+        """
+        return (
+            self.__frame,
+            tuple(bird.get_state() for bird in self.__birds),
+            tuple(manager.get_state() for manager in self.__score_managers),
+            tuple(self.__alive),
+            tuple(self.__last_passed),
+            self.__pipe_manager.get_state(),
+        )
+
+    def load_state(self: RaceManager, state: tuple[Any, ...]) -> None:
+        """Restores a snapshot previously captured with `save_state`.
+
+        Args:
+            state (tuple[Any, ...]): The snapshot to restore.
+
+        Returns:
+            None
+        """
+        frame, birds, scores, alive, last_passed, pipes = state
+        self.__frame = frame
+        for bird, bird_state in zip(self.__birds, birds):
+            bird.set_state(bird_state)
+        for manager, score_state in zip(self.__score_managers, scores):
+            manager.set_state(score_state)
+        self.__alive[:] = alive
+        self.__last_passed[:] = last_passed
+        self.__pipe_manager.set_state(pipes)
+
+    def reset(self: RaceManager, x: int, y: int) -> None:
+        """Restarts the race with every bird at the given position.
+
+        Args:
+            x (int): Starting horizontal position in pixels.
+            y (int): Starting vertical position in pixels.
+
+        Returns:
+            None
+        """
+        for bird in self.__birds:
+            bird.reset(x, y)
+        for manager in self.__score_managers:
+            manager.reset_score()
+        self.__pipe_manager.reset()
+        self.__alive = [True] * len(self.__birds)
+        self.__last_passed = [-1] * len(self.__birds)
+        self.__frame = 0
+
+    def draw(self: RaceManager, screen: pygame.Surface) -> None:
+        """Draws the course and every bird onto the given screen surface.
+
+        Args:
+            screen (pygame.Surface): The main display surface.
+
+        Returns:
+            None
+        """
+        self.__pipe_manager.draw(screen)
+        for bird in self.__birds:
+            bird.draw(screen)
+
+    def is_alive(self: RaceManager, player: int) -> bool:
+        """Checks whether a player's bird is still flying.
+
+        Args:
+            player (int): Index of the player.
+
+        Returns:
+            bool: True if the bird has not crashed yet.
+        """
+        return self.__alive[player]
+
+    @property
+    def finished(self: RaceManager) -> bool:
+        """Checks whether every bird has crashed.
+
+        Returns:
+            bool: True once the race is over.
+        """
+        return not any(self.__alive)
+
+    @property
+    def frame(self: RaceManager) -> int:
+        """Gets the number of frames simulated since the race started.
+
+        Returns:
+            int: The current frame number.
+        """
+        return self.__frame
+
+    @property
+    def score_managers(self: RaceManager) -> list[ScoreManager]:
+        """Gets the per-player score managers.
+
+        Returns:
+            list[ScoreManager]: One score manager per player.
+        """
+        return self.__score_managers
@@ -0,0 +1,146 @@
+"""Internal framebuffer rendering.
+
+The game is laid out in logical units (`constants.SCREEN_WIDTH` x `SCREEN_HEIGHT`) but
+drawn into a framebuffer whose size comes from a quality profile. The framebuffer is
+scaled to the window once per frame, so lower profiles fill, blend and blit fewer pixels.
+The window itself keeps the logical size, so mouse positions are already logical.
+"""
+from __future__ import annotations
+
+import pygame
+import constants
+
+from utils.scaling import get_scale
+
+
+# Translucent black overlays by size, alpha and blending, created on first use
+_overlays: dict[tuple[int, int, int, bool], pygame.Surface] = {}
+
+
+def dim(surface: pygame.Surface, alpha: int, blended: bool = True) -> None:
+    """Darkens a whole surface as if a translucent black overlay covered it.
+
+    The overlay is created once per size and alpha, in the surface's pixel format.
+    Without blending, the surface is multiplied by a gray overlay instead: the result
+    differs by at most one shade, and the blit is several times cheaper than an alpha
+    blend.
+
+    Args:
+        surface (pygame.Surface): The surface to darken.
+        alpha (int): Opacity of the overlay, 0-255.
+        blended (bool, optional): Whether to alpha blend the overlay rather than
+            multiply by it. Defaults to True.
+
+    Returns:
+        None
+    """
+    width, height = surface.get_size()
+    key = (width, height, alpha, blended)
+    overlay = _overlays.get(key)
+    if overlay is None:
+        overlay = pygame.Surface((width, height), 0, surface)
+        if blended:
+            overlay.fill(constants.BLACK)
+            overlay.set_alpha(alpha)
+        else:
+            overlay.fill((255 - alpha, 255 - alpha, 255 - alpha))
+        _overlays[key] = overlay
+    if blended:
+        surface.blit(overlay, (0, 0))
+    else:
+        surface.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+
+
+def split_viewports(surface: pygame.Surface, count: int) -> list[pygame.Surface]:
+    """Splits a surface into equal viewports that keep the logical aspect ratio.
+
+    One viewport fills the surface, two sit side by side and three or four share a
+    2x2 grid; the area no viewport covers is left to the caller. Viewports are
+    subsurfaces, so nothing drawn into one spills into its neighbors and all of them
+    reach the window with the surface's single present.
+
+    Args:
+        surface (pygame.Surface): The surface to split, usually the framebuffer.
+        count (int): Number of viewports, 1-4.
+
+    Returns:
+        list[pygame.Surface]: The viewports, left to right and top to bottom.
+    """
+    columns = 1 if count == 1 else 2
+    rows = 1 if count <= 2 else 2
+    width = surface.get_width() // columns
+    height = surface.get_height() // columns
+    top = (surface.get_height() - rows * height) // 2
+    return [
+        surface.subsurface(
+            (index % columns * width, top + index // columns * height, width, height)
+        )
+        for index in range(count)
+    ]
+
+
+class FrameBuffer:
+    """An internal render target presented to the window once per frame."""
+
+    def __init__(
+        self: FrameBuffer, window: pygame.Surface, size: tuple[int, int]
+    ) -> None:
+        """Creates the framebuffer for a window.
+
+        When the size equals the window size, the window is drawn on directly and
+        presenting only flips the display.
+
+        Args:
+            window (pygame.Surface): The display surface.
+            size (tuple[int, int]): Width and height of the framebuffer in pixels.
+        """
+        self.__window = window
+        if tuple(size) == window.get_size():
+            self.__surface = window
+        else:
+            self.__surface = pygame.Surface(size).convert(window)
+
+    @classmethod
+    def from_quality(
+        cls: type[FrameBuffer], window: pygame.Surface, quality: str
+    ) -> FrameBuffer:
+        """Creates a framebuffer sized by a quality profile.
+
+        Args:
+            window (pygame.Surface): The display surface.
+            quality (str): A key of `constants.QUALITY_PROFILES`.
+
+        Returns:
+            FrameBuffer: The framebuffer.
+        """
+        return cls(window, constants.QUALITY_PROFILES[quality])
+
+    def present(self: FrameBuffer) -> None:
+        """Scales the framebuffer onto the window and flips the display.
+
+        Returns:
+            None
+        """
+        if self.__surface is not self.__window:
+            pygame.transform.scale(
+                self.__surface, self.__window.get_size(), self.__window
+            )
+        pygame.display.flip()
+
+    @property
+    def surface(self: FrameBuffer) -> pygame.Surface:
+        """Gets the surface to draw the frame on.
+
+        Returns:
+            pygame.Surface: The framebuffer surface.
+        """
+        return self.__surface
+
+    @property
+    def scale(self: FrameBuffer) -> float:
+        """Gets the number of framebuffer pixels per logical unit.
+
+        Returns:
+            float: The scale factor.
+        """
+        return get_scale(self.__surface)
@@ -0,0 +1,329 @@
+"""Recording and deterministic playback of single-player runs.
+
+A replay stores the pipe manager's snapshot from the start of the run and the frames
+on which a jump was applied. Because the simulation is deterministic, that is enough
+to reproduce every frame of the run, on any machine and starting at any frame.
+"""
+from __future__ import annotations
+from typing import Any, NamedTuple
+
+import json
+import queue
+import sys
+import threading
+
+import pygame
+
+from entities.bird import Bird
+from entities.course import Course
+from managers.course_validator import CourseValidator
+from managers.game_manager import reset_game, step_playing
+from managers.pipe_manager import PipeManager
+from managers.score_manager import ScoreManager
+
+REPLAY_VERSION: int = 1
+
+
+class Replay(NamedTuple):
+    """A recorded run."""
+
+    pipe_state: tuple[Any, ...]
+    """`PipeManager.get_state` snapshot taken right after the run was reset."""
+    jumps: list[int]
+    """Frames, counted from 1, after which a jump was applied."""
+    frames: int
+    """Number of simulated frames until the run ended."""
+    course: str | None = None
+    """Path of the authored course the run was flown on, if any."""
+    gap_policy: str = "random"
+    """Gap policy of generated courses: "random", "reject" or "repair"."""
+
+
+def save_replay(path: str, replay: Replay) -> None:
+    """Writes a replay as JSON.
+
+    Args:
+        path (str): Destination file.
+        replay (Replay): The replay to write.
+
+    Returns:
+        None
+    """
+    with open(path, "w") as file:
+        json.dump({"version": REPLAY_VERSION, **replay._asdict()}, file)
+
+
+class ReplayWriter:
+    """Saves replays with `save_replay` on a background thread.
+
+    A run ends in the middle of a frame; writing its replay there would stall that
+    frame on the disk. The game only queues the replay, and each one replaces the file
+    written before it.
+    """
+
+    def __init__(self: ReplayWriter, path: str) -> None:
+        """Starts the worker thread.
+
+        Args:
+            path (str): Destination file of every replay.
+        """
+        self.__path = path
+        self.__queue: queue.Queue[Replay | None] = queue.Queue()
+        self.__thread = threading.Thread(
+            target=self.__run, name="replay-writer", daemon=True
+        )
+        self.__thread.start()
+
+    def save(self: ReplayWriter, replay: Replay) -> None:
+        """Queues a replay to be written.
+
+        Args:
+            replay (Replay): The replay of a finished run.
+
+        Returns:
+            None
+        """
+        self.__queue.put(replay)
+
+    def close(self: ReplayWriter) -> None:
+        """Writes the queued replays and stops the worker thread.
+
+        Returns:
+            None
+        """
+        if self.__thread.is_alive():
+            self.__queue.put(None)
+            self.__thread.join()
+
+    def __run(self: ReplayWriter) -> None:
+        """Worker loop: writes queued replays until `close`.
+
+        Returns:
+            None
+        """
+        while True:
+            replay = self.__queue.get()
+            if replay is None:
+                return
+            try:
+                save_replay(self.__path, replay)
+            except OSError as error:
+                print(f"Failed to save replay to {self.__path}: {error}", file=sys.stderr)
+
+
+def _as_tuples(value: Any) -> Any:
+    """Turns the nested lists of a JSON-decoded snapshot back into tuples.
+
+    Args:
+        value (Any): A decoded JSON value.
+
+    Returns:
+        Any: The value with every list replaced by a tuple.
+    """
+    if isinstance(value, list):
+        return tuple(_as_tuples(item) for item in value)
+    return value
+
+
+def load_replay(path: str) -> Replay:
+    """Reads a replay written by `save_replay`.
+
+    Args:
+        path (str): The replay file.
+
+    Returns:
+        Replay: The replay.
+
+    Raises:
+        ValueError: If the file is not a supported replay.
+    """
+    with open(path) as file:
+        data = json.load(file)
+    if data.get("version") != REPLAY_VERSION:
+        raise ValueError(f"{path}: unsupported replay version {data.get('version')!r}")
+    return Replay(
+        pipe_state=_as_tuples(data["pipe_state"]),
+        jumps=list(data["jumps"]),
+        frames=int(data["frames"]),
+        course=data.get("course"),
+        gap_policy=data.get("gap_policy", "random"),
+    )
+
+
+class ReplayRecorder:
+    """Collects the inputs of the current run."""
+
+    def __init__(
+        self: ReplayRecorder, course: str | None = None, gap_policy: str = "random"
+    ) -> None:
+        """Creates a recorder for runs flown with the given course settings.
+
+        Args:
+            course (str | None, optional): Path of the authored course. Defaults to None.
+            gap_policy (str, optional): Gap policy of generated courses. Defaults to "random".
+        """
+        self.__course = course
+        self.__gap_policy = gap_policy
+        self.__pipe_state: tuple[Any, ...] = ()
+        self.__jumps: list[int] = []
+        self.__frames: int = 0
+
+    def start_run(self: ReplayRecorder, pipe_manager: PipeManager) -> None:
+        """Begins recording a run that has just been reset.
+
+        Args:
+            pipe_manager (PipeManager): The run's pipe manager, in its reset state.
+
+        Returns:
+            None
+        """
+        self.__pipe_state = pipe_manager.get_state()
+        self.__jumps = []
+        self.__frames = 0
+
+    def record_frame(self: ReplayRecorder, jump: bool) -> None:
+        """Records one simulated frame.
+
+        Args:
+            jump (bool): Whether the jump input was applied this frame.
+
+        Returns:
+            None
+        """
+        self.__frames += 1
+        if jump:
+            self.__jumps.append(self.__frames)
+
+    def finish(self: ReplayRecorder) -> Replay:
+        """Gets the replay of the run recorded so far.
+
+        Returns:
+            Replay: The replay.
+        """
+        return Replay(
+            self.__pipe_state,
+            list(self.__jumps),
+            self.__frames,
+            self.__course,
+            self.__gap_policy,
+        )
+
+
+class ReplayPlayer:
+    """Re-simulates a replay, frame by frame, without touching the display."""
+
+    def __init__(
+        self: ReplayPlayer, replay: Replay, bird_surface: pygame.Surface
+    ) -> None:
+        """Builds the run's bird, pipes and score in their starting state.
+
+        Args:
+            replay (Replay): The replay to play.
+            bird_surface (pygame.Surface): Sprite of the bird.
+        """
+        self.__replay = replay
+        self.__jumps = set(replay.jumps)
+        self.__course: Course | None = Course(replay.course) if replay.course else None
+        validator: CourseValidator | None = (
+            CourseValidator(gap=200, spacing=300, speed=4, mode=replay.gap_policy)
+            if replay.gap_policy != "random"
+            else None
+        )
+        self.__bird = Bird(70, 90, bird_surface)
+        self.__pipe_manager = PipeManager(
+            gap=200,
+            pipe_width=80,
+            speed=4,
+            spawn_distance=300,
+            course=self.__course,
+            validator=validator,
+        )
+        self.__score_manager = ScoreManager()
+        self.__frame: int = 0
+        self.__last_pipe_passed: int = -1
+
+        reset_game(self.__bird, self.__pipe_manager, self.__score_manager)
+        self.__pipe_manager.set_state(replay.pipe_state)
+
+    def step(self: ReplayPlayer) -> None:
+        """Simulates the next frame of the run; the last one ends it as the game does.
+
+        Returns:
+            None
+        """
+        self.__frame += 1
+        self.__last_pipe_passed, _ = step_playing(
+            self.__bird,
+            self.__pipe_manager,
+            self.__score_manager,
+            self.__frame in self.__jumps,
+            self.__last_pipe_passed,
+        )
+        if self.__frame == self.__replay.frames:
+            self.__score_manager.update_high_score()
+
+    def seek(self: ReplayPlayer, frame: int) -> None:
+        """Fast-forwards to a later frame.
+
+        Args:
+            frame (int): Number of frames simulated afterwards; not before the current one.
+
+        Returns:
+            None
+        """
+        while self.__frame < frame:
+            self.step()
+
+    def close(self: ReplayPlayer) -> None:
+        """Closes the authored course, if any.
+
+        Returns:
+            None
+        """
+        if self.__course is not None:
+            self.__course.close()
+
+    @property
+    def frame(self: ReplayPlayer) -> int:
+        """Gets the number of frames simulated so far.
+
+        Returns:
+            int: The current frame, 0 before the first step.
+        """
+        return self.__frame
+
+    @property
+    def finished(self: ReplayPlayer) -> bool:
+        """Checks whether every recorded frame has been simulated.
+
+        Returns:
+            bool: True once the run has ended.
+        """
+        return self.__frame >= self.__replay.frames
+
+    @property
+    def bird(self: ReplayPlayer) -> Bird:
+        """Gets the replayed bird.
+
+        Returns:
+            Bird: The bird.
+        """
+        return self.__bird
+
+    @property
+    def pipe_manager(self: ReplayPlayer) -> PipeManager:
+        """Gets the replayed pipes.
+
+        Returns:
+            PipeManager: The pipe manager.
+        """
+        return self.__pipe_manager
+
+    @property
+    def score_manager(self: ReplayPlayer) -> ScoreManager:
+        """Gets the replayed score.
+
+        Returns:
+            ScoreManager: The score manager.
+        """
+        return self.__score_manager
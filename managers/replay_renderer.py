@@ -0,0 +1,222 @@
+"""Offline rendering of a recorded run to image files or raw video frames.
+
+The frame range is split into one contiguous slice per worker process. Every worker
+renders headless under SDL's dummy video driver with the game's own screens, drawn
+over a `Scene` of the replayed bird and pipes, fast-forwards the deterministic simulation to the start of its slice, and sends
+encoded frames through a bounded queue. The parent process only writes them to disk,
+so a long run renders on every core in constant memory.
+
+Raw output is one file of 8-bit RGB frames in order, e.g. for
+`ffmpeg -f rawvideo -pix_fmt rgb24 -s 800x600 -r 60 -i run.rgb run.mp4`.
+
+Usage: python -m managers.replay_renderer REPLAY OUTPUT [--format png|raw] [--workers N]
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import multiprocessing
+import os
+import queue
+import pygame
+import constants
+
+from managers.game_states import (
+    GameOverState,
+    GameState,
+    PlayingState,
+    Scene,
+    create_bird_surface,
+)
+from managers.quality_governor import QualityGovernor
+from managers.render_manager import FrameBuffer
+from managers.replay_manager import ReplayPlayer, load_replay
+
+FORMATS: tuple[str, ...] = ("png", "raw")
+
+
+def _encode(surface: pygame.Surface, image_format: str) -> bytes:
+    """Encodes a rendered frame.
+
+    Args:
+        surface (pygame.Surface): The window surface.
+        image_format (str): "png" or "raw".
+
+    Returns:
+        bytes: A PNG file, or the frame's RGB pixels row by row.
+    """
+    if image_format == "raw":
+        return pygame.image.tobytes(surface, "RGB")
+    buffer = io.BytesIO()
+    pygame.image.save(surface, buffer, "frame.png")
+    return buffer.getvalue()
+
+
+def _render_slice(
+    replay_path: str,
+    start: int,
+    stop: int,
+    quality: str,
+    image_format: str,
+    frames: multiprocessing.Queue,
+) -> None:
+    """Worker: renders frames `start` to `stop - 1` and queues them.
+
+    Frame `n` shows the run after `n` simulated frames; the last one shows the game
+    over screen.
+
+    Args:
+        replay_path (str): The replay file.
+        start (int): First frame to render.
+        stop (int): Frame after the last one to render.
+        quality (str): Quality profile used for drawing.
+        image_format (str): "png" or "raw".
+        frames (multiprocessing.Queue): Receives (frame, data) items, then None.
+
+    Returns:
+        None
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    try:
+        pygame.display.init()
+        window = pygame.display.set_mode([constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT])
+        frame_buffer = FrameBuffer.from_quality(window, quality)
+
+        replay = load_replay(replay_path)
+        bird_surface = create_bird_surface(constants.GREEN)
+        player = ReplayPlayer(replay, bird_surface)
+        scene = Scene(
+            frame_buffer, player.bird, bird_surface, player.pipe_manager, QualityGovernor()
+        )
+        playing = PlayingState(scene, player.score_manager)
+        game_over = GameOverState(scene, player.score_manager)
+        game_over.enter(GameState.PLAYING)
+
+        for frame in range(start, stop):
+            player.seek(frame)
+            # The background scrolls by the pipes' speed every simulated frame
+            scene.background.distance = frame * player.pipe_manager.speed
+            screen = game_over if frame == replay.frames else playing
+            screen.draw(frame_buffer.surface)
+            frame_buffer.present()
+            frames.put((frame, _encode(window, image_format)))
+
+        player.close()
+        pygame.display.quit()
+    finally:
+        frames.put(None)
+
+
+def render_replay(
+    replay_path: str,
+    output: str,
+    image_format: str = "png",
+    workers: int | None = None,
+    quality: str = constants.DEFAULT_QUALITY,
+    queue_size: int = 16,
+) -> int:
+    """Renders every frame of a replay in parallel.
+
+    Args:
+        replay_path (str): The replay file.
+        output (str): Directory for PNG frames, or the raw video file.
+        image_format (str, optional): "png" or "raw". Defaults to "png".
+        workers (int | None, optional): Worker processes. Defaults to the CPU count.
+        quality (str, optional): Quality profile used for drawing.
+            Defaults to constants.DEFAULT_QUALITY.
+        queue_size (int, optional): Encoded frames buffered between the workers and
+            the writer. Defaults to 16.
+
+    Returns:
+        int: The number of frames written.
+
+    Raises:
+        ValueError: If the format is unknown.
+        RuntimeError: If a worker fails.
+    """
+    if image_format not in FORMATS:
+        raise ValueError(f"unknown frame format {image_format!r}")
+
+    total = load_replay(replay_path).frames + 1
+    workers = max(1, min(workers or os.cpu_count() or 1, total))
+    bounds = [total * worker // workers for worker in range(workers + 1)]
+
+    context = multiprocessing.get_context("spawn")
+    frames = context.Queue(queue_size)
+    processes = [
+        context.Process(
+            target=_render_slice,
+            args=(replay_path, start, stop, quality, image_format, frames),
+            daemon=True,
+        )
+        for start, stop in zip(bounds, bounds[1:])
+    ]
+    for process in processes:
+        process.start()
+
+    frame_size = constants.SCREEN_WIDTH * constants.SCREEN_HEIGHT * 3
+    if image_format == "png":
+        os.makedirs(output, exist_ok=True)
+        video = None
+    else:
+        video = open(output, "wb")
+        video.truncate(total * frame_size)
+
+    written = 0
+    running = len(processes)
+    try:
+        while running:
+            try:
+                item = frames.get(timeout=1.0)
+            except queue.Empty:
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    raise RuntimeError("a render worker exited unexpectedly")
+                continue
+
+            if item is None:
+                running -= 1
+                continue
+
+            frame, data = item
+            if video is None:
+                with open(os.path.join(output, f"frame_{frame:06d}.png"), "wb") as file:
+                    file.write(data)
+            else:
+                video.seek(frame * frame_size)
+                video.write(data)
+            written += 1
+    finally:
+        if video is not None:
+            video.close()
+        for process in processes:
+            if written < total:
+                process.terminate()
+            process.join()
+
+    if written < total:
+        raise RuntimeError(f"rendered {written} of {total} frames")
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a recorded run to frames")
+    parser.add_argument("replay", help="replay file written with --record")
+    parser.add_argument("output", help="directory for PNG frames, or the raw video file")
+    parser.add_argument("--format", choices=FORMATS, default="png", help="frame format")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument(
+        "--quality",
+        choices=list(constants.QUALITY_PROFILES),
+        default=constants.DEFAULT_QUALITY,
+        help="internal render resolution",
+    )
+    arguments = parser.parse_args()
+
+    count = render_replay(
+        arguments.replay,
+        arguments.output,
+        arguments.format,
+        arguments.workers,
+        arguments.quality,
+    )
+    print(f"Wrote {count} frames to {arguments.output}")
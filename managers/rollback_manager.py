@@ -0,0 +1,368 @@
+"""Rollback netcode for two-player races over UDP.
+
+Each peer simulates the race immediately with its own input and a prediction of the
+remote one. When the real remote input arrives and differs from the prediction, the
+race is rewound to that frame and resimulated, so neither player sees added input delay.
+"""
+from __future__ import annotations
+from typing import Any, Callable
+from managers.race_manager import RaceManager
+
+import heapq
+import random
+import socket
+import struct
+import time
+
+
+# Packet layout: magic, sender player, first input frame, ack of the receiver's inputs, input count
+PACKET_MAGIC: bytes = b"FBRB"
+PACKET_HEADER: struct.Struct = struct.Struct("<4sBiiH")
+
+# Number of frames kept in the input and snapshot rings
+HISTORY_SIZE: int = 64
+
+
+class UdpTransport:
+    """Non-blocking UDP socket bound to a local address and talking to one peer."""
+
+    def __init__(
+        self: UdpTransport,
+        local_address: tuple[str, int],
+        remote_address: tuple[str, int],
+    ) -> None:
+        """Opens and binds the socket.
+
+        Args:
+            local_address (tuple[str, int]): Host and port to listen on.
+            remote_address (tuple[str, int]): Host and port of the peer.
+        """
+        self.__remote_address = remote_address
+        self.__socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.__socket.setblocking(False)
+        self.__socket.bind(local_address)
+
+    def send(self: UdpTransport, payload: bytes) -> None:
+        """Sends a datagram to the peer, dropping it if the socket buffer is full.
+
+        Args:
+            payload (bytes): The datagram to send.
+
+        Returns:
+            None
+        """
+        try:
+            self.__socket.sendto(payload, self.__remote_address)
+        except (BlockingIOError, ConnectionRefusedError):
+            pass
+
+    def receive(self: UdpTransport) -> list[bytes]:
+        """Drains every datagram currently waiting on the socket.
+
+        Returns:
+            list[bytes]: The received datagrams, oldest first.
+        """
+        datagrams: list[bytes] = []
+        while True:
+            try:
+                payload, _ = self.__socket.recvfrom(2048)
+            except (BlockingIOError, ConnectionRefusedError, ConnectionResetError):
+                return datagrams
+            datagrams.append(payload)
+
+    def close(self: UdpTransport) -> None:
+        """Closes the socket.
+
+        Returns:
+            None
+        """
+        self.__socket.close()
+
+    @property
+    def address(self: UdpTransport) -> tuple[str, int]:
+        """Gets the address the socket is bound to.
+
+        Returns:
+            tuple[str, int]: The local host and port.
+        """
+        return self.__socket.getsockname()
+
+
+class LossyTransport:
+    """Wraps a transport to inject latency and packet loss on outgoing datagrams.
+
+    Intended for exercising a session over a loopback socket; with a fixed seed and a
+    manual clock the injected conditions are reproducible.
+    """
+
+    def __init__(
+        self: LossyTransport,
+        transport: UdpTransport,
+        latency: float = 0.0,
+        loss: float = 0.0,
+        seed: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the wrapper.
+
+        Args:
+            transport (UdpTransport): The transport actually carrying the datagrams.
+            latency (float, optional): One-way delay added to each datagram, in seconds.
+                Defaults to 0.0.
+            loss (float, optional): Probability in [0, 1] of dropping a datagram. Defaults to 0.0.
+            seed (int | None, optional): Seed for the loss decisions. Defaults to None.
+            clock (Callable[[], float], optional): Time source in seconds. Defaults to
+                time.monotonic.
+        """
+        self.__transport = transport
+        self.__latency = latency
+        self.__loss = loss
+        self.__rng = random.Random(seed)
+        self.__clock = clock
+        self.__pending: list[tuple[float, int, bytes]] = []
+        self.__sequence: int = 0
+
+    def send(self: LossyTransport, payload: bytes) -> None:
+        """Queues a datagram for delayed delivery unless it is dropped.
+
+        Args:
+            payload (bytes): The datagram to send.
+
+        Returns:
+            None
+        """
+        if self.__rng.random() < self.__loss:
+            return
+        heapq.heappush(
+            self.__pending,
+            (self.__clock() + self.__latency, self.__sequence, payload),
+        )
+        self.__sequence += 1
+        self.__flush()
+
+    def receive(self: LossyTransport) -> list[bytes]:
+        """Delivers any datagrams whose delay has elapsed, then drains the socket.
+
+        Returns:
+            list[bytes]: The received datagrams, oldest first.
+        """
+        self.__flush()
+        return self.__transport.receive()
+
+    def close(self: LossyTransport) -> None:
+        """Discards pending datagrams and closes the wrapped transport.
+
+        Returns:
+            None
+        """
+        self.__pending.clear()
+        self.__transport.close()
+
+    def __flush(self: LossyTransport) -> None:
+        """Sends every queued datagram that is due.
+
+        Returns:
+            None
+        """
+        now = self.__clock()
+        while self.__pending and self.__pending[0][0] <= now:
+            _, _, payload = heapq.heappop(self.__pending)
+            self.__transport.send(payload)
+
+
+class RollbackSession:
+    """Runs one peer of a two-player race with input prediction and rollback.
+
+    Every call to `advance` records the local input for the next frame, exchanges inputs
+    with the peer, rewinds and resimulates from the oldest mispredicted frame if needed,
+    and finally simulates the new frame. Each packet repeats every input the peer has
+    not acknowledged yet, so lost datagrams are recovered by the next one.
+    """
+
+    def __init__(
+        self: RollbackSession,
+        race: RaceManager,
+        local_player: int,
+        transport: UdpTransport | LossyTransport,
+        max_rollback: int = 8,
+    ) -> None:
+        """Initializes the session.
+
+        Args:
+            race (RaceManager): The race to drive; must contain exactly two birds.
+            local_player (int): Index of the local player, 0 or 1.
+            transport (UdpTransport | LossyTransport): Channel to the peer.
+            max_rollback (int, optional): Maximum number of frames the local simulation may
+                run ahead of the last confirmed remote input. Defaults to 8.
+        """
+        self.__race = race
+        self.__local_player = local_player
+        self.__remote_player = 1 - local_player
+        self.__transport = transport
+        self.__max_rollback = min(max_rollback, HISTORY_SIZE - 2)
+
+        self.__frame: int = 0
+        self.__local_inputs: list[bool] = [False] * HISTORY_SIZE
+        self.__remote_inputs: list[bool] = [False] * HISTORY_SIZE
+        self.__snapshots: list[Any] = [None] * HISTORY_SIZE
+        self.__jumps: list[bool] = [False, False]
+
+        # Highest remote frame received so far without gaps
+        self.__remote_confirmed: int = -1
+        # Highest local frame the peer has acknowledged
+        self.__peer_ack: int = -1
+        # Oldest frame whose remote input turned out to be mispredicted
+        self.__mispredicted: int | None = None
+        self.__rollback_frames: int = 0
+
+    def advance(self: RollbackSession, local_jump: bool) -> bool:
+        """Simulates the next frame using the local input and the best remote guess.
+
+        Args:
+            local_jump (bool): Whether the local player holds jump this frame.
+
+        Returns:
+            bool: True if a frame was simulated; False if the session is stalled waiting
+            for the peer, which happens only when it falls more than `max_rollback`
+            frames behind.
+        """
+        self.__receive()
+        self.__rollback()
+
+        if (
+            self.__frame - self.__remote_confirmed > self.__max_rollback
+            or self.__frame - self.__peer_ack >= HISTORY_SIZE - 1
+        ):
+            self.__send(self.__frame - 1)
+            return False
+
+        self.__local_inputs[self.__frame % HISTORY_SIZE] = local_jump
+        self.__send(self.__frame)
+        self.__simulate(self.__frame)
+        self.__frame += 1
+        return True
+
+    def close(self: RollbackSession) -> None:
+        """Closes the underlying transport.
+
+        Returns:
+            None
+        """
+        self.__transport.close()
+
+    def __simulate(self: RollbackSession, frame: int) -> None:
+        """Saves a snapshot of the given frame and steps the race past it.
+
+        Frames beyond the last confirmed remote input repeat that input as the prediction.
+
+        Args:
+            frame (int): The frame about to be simulated.
+
+        Returns:
+            None
+        """
+        slot = frame % HISTORY_SIZE
+        if frame > self.__remote_confirmed:
+            confirmed = self.__remote_confirmed
+            self.__remote_inputs[slot] = (
+                self.__remote_inputs[confirmed % HISTORY_SIZE] if confirmed >= 0 else False
+            )
+
+        self.__snapshots[slot] = self.__race.save_state()
+        self.__jumps[self.__local_player] = self.__local_inputs[slot]
+        self.__jumps[self.__remote_player] = self.__remote_inputs[slot]
+        self.__race.step(self.__jumps)
+
+    def __rollback(self: RollbackSession) -> None:
+        """Rewinds to the oldest mispredicted frame and resimulates up to the present.
+
+        Returns:
+            None
+        """
+        if self.__mispredicted is None:
+            return
+
+        start = self.__mispredicted
+        self.__mispredicted = None
+        self.__race.load_state(self.__snapshots[start % HISTORY_SIZE])
+        for frame in range(start, self.__frame):
+            self.__simulate(frame)
+        self.__rollback_frames += self.__frame - start
+
+    def __send(self: RollbackSession, last_frame: int) -> None:
+        """Sends every local input the peer has not acknowledged yet.
+
+        Args:
+            last_frame (int): The newest local frame whose input has been recorded.
+
+        Returns:
+            None
+        """
+        start = self.__peer_ack + 1
+        inputs = bytes(
+            self.__local_inputs[frame % HISTORY_SIZE]
+            for frame in range(start, last_frame + 1)
+        )
+        self.__transport.send(
+            PACKET_HEADER.pack(
+                PACKET_MAGIC,
+                self.__local_player,
+                start,
+                self.__remote_confirmed,
+                len(inputs),
+            )
+            + inputs
+        )
+
+    def __receive(self: RollbackSession) -> None:
+        """Applies every input packet received from the peer.
+
+        Inputs are accepted only in order; anything after a gap is ignored because the
+        peer resends it until it is acknowledged.
+
+        Returns:
+            None
+        """
+        for datagram in self.__transport.receive():
+            if len(datagram) < PACKET_HEADER.size:
+                continue
+            magic, player, start, ack, count = PACKET_HEADER.unpack_from(datagram)
+            if magic != PACKET_MAGIC or player != self.__remote_player:
+                continue
+
+            if ack > self.__peer_ack:
+                self.__peer_ack = min(ack, self.__frame)
+
+            inputs = datagram[PACKET_HEADER.size:PACKET_HEADER.size + count]
+            for offset, value in enumerate(inputs):
+                frame = start + offset
+                if frame != self.__remote_confirmed + 1:
+                    continue
+                if frame > self.__frame + HISTORY_SIZE // 2:
+                    break
+
+                slot = frame % HISTORY_SIZE
+                jump = value != 0
+                if frame < self.__frame and self.__remote_inputs[slot] != jump:
+                    if self.__mispredicted is None or frame < self.__mispredicted:
+                        self.__mispredicted = frame
+                self.__remote_inputs[slot] = jump
+                self.__remote_confirmed = frame
+
+    @property
+    def frame(self: RollbackSession) -> int:
+        """Gets the next frame to be simulated.
+
+        Returns:
+            int: The current frame number.
+        """
+        return self.__frame
+
+    @property
+    def rollback_frames(self: RollbackSession) -> int:
+        """Gets the total number of frames resimulated because of mispredictions.
+
+        Returns:
+            int: The number of resimulated frames.
+        """
+        return self.__rollback_frames
@@ -1,13 +1,44 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from managers.leaderboard_manager import LeaderboardManager
 
 
 class ScoreManager:
-    """Tracks and manages the player's current score and high score."""
+    """Tracks and manages the player's current score and high score.
+
+    With a leaderboard, finished runs are persisted and the high score includes
+    scores from previous sessions on the same profile, course seed and authored
+    course.
+    """
+
+    def __init__(
+        self: ScoreManager,
+        leaderboard: LeaderboardManager | None = None,
+        profile: str = "default",
+        seed: int | None = None,
+        course: str | None = None,
+    ) -> None:
+        """Initializes the score manager with scores set to zero.
 
-    def __init__(self: ScoreManager) -> None:
-        """Initializes the score manager with scores set to zero."""
+        Args:
+            leaderboard (LeaderboardManager | None, optional): Persistent score store.
+                Defaults to None (scores are kept in memory only).
+            profile (str, optional): Player profile the scores belong to. Defaults to "default".
+            seed (int | None, optional): Course seed the scores belong to. Defaults to None.
+            course (str | None, optional): Authored course the scores belong to.
+                Defaults to None (generated courses).
+        """
         self.__score = 0
         self.__high_score = 0
+        self.__leaderboard = leaderboard
+        self.__profile = profile
+        self.__seed = seed
+        self.__course = course
+
+        if self.__leaderboard is not None:
+            self.__leaderboard.load(profile, seed, course)
 
     def increment_score(self: ScoreManager) -> None:
         """Increments the current score by one.
@@ -28,12 +59,39 @@ class ScoreManager:
     def update_high_score(self: ScoreManager) -> None:
         """Updates the high score if the current score is greater.
 
+        Called once per finished run; the run's score is also submitted to the
+        leaderboard, which persists it in the background.
+
         Returns:
             None
         """
         if self.__score > self.__high_score:
             self.__high_score = self.__score
 
+        if self.__leaderboard is not None:
+            self.__leaderboard.submit(
+                self.__profile, self.__seed, self.__score, self.__course
+            )
+
+    def get_state(self: ScoreManager) -> tuple[int, int]:
+        """Captures the current and high score for later restoration.
+
+        Returns:
+            tuple[int, int]: The current score and the high score.
+        """
+        return self.__score, self.__high_score
+
+    def set_state(self: ScoreManager, state: tuple[int, int]) -> None:
+        """Restores scores previously captured with `get_state`.
+
+        Args:
+            state (tuple[int, int]): The current score and the high score.
+
+        Returns:
+            None
+        """
+        self.__score, self.__high_score = state
+
     @property
     def score(self: ScoreManager) -> int:
         """Gets the current score.
@@ -50,4 +108,20 @@ class ScoreManager:
         Returns:
             int: The high score value.
         """
+        if self.__leaderboard is not None:
+            return max(
+                self.__high_score,
+                self.__leaderboard.high_score(self.__profile, self.__seed, self.__course),
+            )
         return self.__high_score
+
+    @property
+    def top_scores(self: ScoreManager) -> list[int]:
+        """Gets the best persisted scores for this profile, course seed and course.
+
+        Returns:
+            list[int]: Cached leaderboard scores, best first; empty without a leaderboard.
+        """
+        if self.__leaderboard is None:
+            return []
+        return self.__leaderboard.top_scores(self.__profile, self.__seed, self.__course)
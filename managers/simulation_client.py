@@ -0,0 +1,212 @@
+"""Blocking client of the simulation server, as a trainer process would run it.
+
+Needs only the standard library, NumPy and `managers.simulation_protocol`, not pygame.
+Every batch is read into one buffer allocated at connection time, and the arrays
+returned by `reset` and `step` are views of it, overwritten by the next call.
+"""
+from __future__ import annotations
+from typing import Sequence
+
+import socket
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from managers.simulation_protocol import (
+    FLAG_SHARED,
+    INFO_HEADER,
+    KIND_ERROR,
+    KIND_INFO,
+    KIND_RESET,
+    KIND_STEP,
+    MESSAGE_HEADER,
+    MESSAGE_MAGIC,
+    batch_size,
+    batch_views,
+    result_size,
+)
+
+
+class SimulationClient:
+    """Drives the environments of a `SimulationServer` over its Unix domain socket."""
+
+    def __init__(self: SimulationClient, path: str, shared: bool = False) -> None:
+        """Connects, asks the server for its batch layout and prepares the buffers.
+
+        Args:
+            path (str): Path of the server's socket.
+            shared (bool, optional): Whether to exchange batches through the server's
+                shared memory block instead of the socket. Defaults to False.
+
+        Raises:
+            RuntimeError: If shared memory is requested but the server has none.
+        """
+        self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.__socket.connect(path)
+        self.__header = bytearray(MESSAGE_HEADER.size)
+        self.__header_view = memoryview(self.__header)
+        self.__environments = 0
+
+        self.__environments, length = self.__request(KIND_INFO, 0, b"")
+        info = bytearray(length)
+        self.__receive_into(memoryview(info))
+        (self.__observation_size,) = INFO_HEADER.unpack_from(info)
+        name = info[INFO_HEADER.size :].decode()
+
+        size = batch_size(self.__environments, self.__observation_size)
+        self.__buffer = bytearray(size)
+        self.__results = memoryview(self.__buffer)[
+            : result_size(self.__environments, self.__observation_size)
+        ]
+        views = batch_views(self.__buffer, self.__environments, self.__observation_size)
+        self.__actions_payload = memoryview(self.__buffer)[size - self.__environments :]
+
+        self.__memory: shared_memory.SharedMemory | None = None
+        self.__flags = 0
+        if shared:
+            if not name:
+                raise RuntimeError("the simulation server has no shared memory")
+            self.__memory = _attach(name)
+            views = batch_views(
+                self.__memory.buf, self.__environments, self.__observation_size
+            )
+            self.__flags = FLAG_SHARED
+        self.__observations, self.__rewards, self.__dones, self.__actions = views
+
+    def reset(self: SimulationClient, mask: Sequence[bool] | None = None) -> np.ndarray:
+        """Restarts environments.
+
+        Args:
+            mask (Sequence[bool] | None, optional): True for each environment to
+                restart. Defaults to None (all of them).
+
+        Returns:
+            np.ndarray: The observation of every environment.
+        """
+        payload = b"" if mask is None else np.asarray(mask, dtype=np.uint8).tobytes()
+        _, length = self.__request(KIND_RESET, self.__flags, payload)
+        self.__receive_into(self.__results[:length])
+        return self.__observations
+
+    def step(
+        self: SimulationClient, actions: Sequence[bool] | np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Advances every environment by one frame.
+
+        Environments that crash restart at once; their observation is the first of
+        the new run.
+
+        Args:
+            actions (Sequence[bool] | np.ndarray): Whether each environment's bird flaps.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The observations, the rewards
+            and the done flags of every environment.
+        """
+        self.__actions[:] = actions
+        payload = b"" if self.__flags else self.__actions_payload
+        _, length = self.__request(KIND_STEP, self.__flags, payload)
+        self.__receive_into(self.__results[:length])
+        return self.__observations, self.__rewards, self.__dones
+
+    def close(self: SimulationClient) -> None:
+        """Disconnects and detaches from the shared memory block.
+
+        Returns:
+            None
+        """
+        self.__socket.close()
+        if self.__memory is not None:
+            # The block can only be closed once no array views its buffer
+            self.__observations = self.__rewards = self.__dones = self.__actions = None
+            self.__memory.close()
+            self.__memory = None
+
+    def __request(
+        self: SimulationClient, kind: int, flags: int, payload: bytes | memoryview
+    ) -> tuple[int, int]:
+        """Sends a request and receives the header of its reply.
+
+        Args:
+            kind (int): The message kind.
+            flags (int): The message flags.
+            payload (bytes | memoryview): The request's payload.
+
+        Returns:
+            tuple[int, int]: The reply's environment count, and the length of its
+            payload, which is left on the socket for the caller to read.
+
+        Raises:
+            RuntimeError: If the server answers with an error.
+            ConnectionError: If the reply is not a simulation server message.
+        """
+        MESSAGE_HEADER.pack_into(
+            self.__header, 0, MESSAGE_MAGIC, kind, flags, self.__environments, len(payload)
+        )
+        self.__socket.sendmsg([self.__header, payload] if payload else [self.__header])
+
+        self.__receive_into(self.__header_view)
+        magic, reply_kind, _, count, length = MESSAGE_HEADER.unpack(self.__header)
+        if magic != MESSAGE_MAGIC:
+            raise ConnectionError("not a simulation server reply")
+        if reply_kind == KIND_ERROR:
+            message = bytearray(length)
+            self.__receive_into(memoryview(message))
+            raise RuntimeError(f"simulation server: {message.decode()}")
+        return count, length
+
+    def __receive_into(self: SimulationClient, view: memoryview) -> None:
+        """Fills a buffer from the socket.
+
+        Args:
+            view (memoryview): The bytes to fill.
+
+        Returns:
+            None
+
+        Raises:
+            ConnectionError: If the server closes the connection first.
+        """
+        received = 0
+        while received < len(view):
+            count = self.__socket.recv_into(view[received:])
+            if not count:
+                raise ConnectionError("the simulation server closed the connection")
+            received += count
+
+    @property
+    def environments(self: SimulationClient) -> int:
+        """Gets the number of environments the server hosts.
+
+        Returns:
+            int: The number of environments.
+        """
+        return self.__environments
+
+    @property
+    def observation_size(self: SimulationClient) -> int:
+        """Gets the number of values in each environment's observation.
+
+        Returns:
+            int: The size of an observation.
+        """
+        return self.__observation_size
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attaches to a shared memory block owned by another process.
+
+    Args:
+        name (str): Name of the block.
+
+    Returns:
+        shared_memory.SharedMemory: The attached block.
+    """
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # Before Python 3.13, attaching registers the block with this process's
+        # resource tracker, which would unlink it from under the server at exit
+        memory = shared_memory.SharedMemory(name)
+        resource_tracker.unregister(memory._name, "shared_memory")
+        return memory
@@ -0,0 +1,103 @@
+"""Wire format shared by the simulation server and its clients.
+
+Every message, in either direction, is a fixed header followed by a payload:
+
+    magic "FBSV" | kind (u8) | flags (u8) | environment count (u16) | payload bytes (u32)
+
+all little-endian. A request carries the number of environments the client expects
+(0 for INFO), a reply the number the server hosts. Replies carry the kind of their
+request:
+
+* INFO: no payload. The reply's payload is the observation size (u32) followed by the
+  UTF-8 name of the server's shared memory block, empty if it has none.
+* RESET: a payload of one u8 per environment, nonzero to reset it, or no payload to
+  reset them all. The reply carries the observations.
+* STEP: a payload of one u8 action per environment, nonzero to flap. The reply carries
+  the observations, the rewards and the done flags.
+
+Batches are laid out as in `batch_views`: float32 observations, float32 rewards, u8
+done flags, then u8 actions. A reply payload is the first three, back to back, so it is
+written straight from and read straight into one buffer per side. With `FLAG_SHARED`,
+STEP actions are read from and results written to the server's shared memory block
+instead, and only a RESET mask is still sent as payload: per step just the two headers
+cross the socket.
+
+A failed request is answered with kind ERROR and a UTF-8 message as payload.
+
+This module depends on nothing but the standard library and NumPy, so trainers can
+import it without pygame, and it is small enough to port to other runtimes.
+"""
+from __future__ import annotations
+
+import struct
+
+import numpy as np
+
+MESSAGE_MAGIC: bytes = b"FBSV"
+MESSAGE_HEADER: struct.Struct = struct.Struct("<4sBBHI")
+INFO_HEADER: struct.Struct = struct.Struct("<I")
+# Most environments a server can host: the count field of the header is a u16
+MAX_ENVIRONMENTS: int = 0xFFFF
+
+# Message kinds
+KIND_INFO: int = 0
+KIND_RESET: int = 1
+KIND_STEP: int = 2
+KIND_ERROR: int = 255
+
+# Message flags
+FLAG_SHARED: int = 1
+
+
+def batch_size(environments: int, observation_size: int) -> int:
+    """Gets the number of bytes a batch takes, e.g. to size a shared memory block.
+
+    Args:
+        environments (int): Number of environments.
+        observation_size (int): Values per observation.
+
+    Returns:
+        int: Bytes of observations, rewards, done flags and actions.
+    """
+    return environments * (4 * observation_size + 4 + 1 + 1)
+
+
+def result_size(environments: int, observation_size: int) -> int:
+    """Gets the number of bytes of a STEP reply's payload.
+
+    Args:
+        environments (int): Number of environments.
+        observation_size (int): Values per observation.
+
+    Returns:
+        int: Bytes of observations, rewards and done flags.
+    """
+    return environments * (4 * observation_size + 4 + 1)
+
+
+def batch_views(
+    buffer: memoryview | bytearray, environments: int, observation_size: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Maps the arrays of a batch onto a buffer, without copying.
+
+    Args:
+        buffer (memoryview | bytearray): A writable buffer of at least `batch_size`
+            bytes, e.g. a bytearray or a shared memory block's buffer.
+        environments (int): Number of environments.
+        observation_size (int): Values per observation.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The observations
+        (environments x observation_size float32), rewards (float32), done flags (uint8)
+        and actions (uint8).
+    """
+    observations = np.ndarray(
+        (environments, observation_size), dtype=np.float32, buffer=buffer
+    )
+    offset = observations.nbytes
+    rewards = np.ndarray(environments, dtype=np.float32, buffer=buffer, offset=offset)
+    offset += rewards.nbytes
+    dones = np.ndarray(environments, dtype=np.uint8, buffer=buffer, offset=offset)
+    offset += dones.nbytes
+    actions = np.ndarray(environments, dtype=np.uint8, buffer=buffer, offset=offset)
+    return observations, rewards, dones, actions
@@ -0,0 +1,434 @@
+"""Headless environments served over a Unix domain socket to external trainers.
+
+A `SimulationServer` hosts a `VectorEnvironment` of many single-player games and
+answers batched requests in the binary format of `managers.simulation_protocol`: one
+STEP message carries the actions of every environment and its reply carries every
+observation, reward and done flag, so the cost of a round trip is shared by the whole
+batch. With shared memory, only the message headers cross the socket.
+
+The server runs on asyncio and steps the environments between reads; a trainer may
+connect several times, but all connections drive the same environments.
+"""
+from __future__ import annotations
+
+import asyncio
+import errno
+import os
+import signal
+import socket
+import stat
+from multiprocessing import shared_memory
+
+import numpy as np
+import pygame
+import constants
+
+from entities.bird import Bird
+from managers.game_manager import reset_game, step_playing
+from managers.observation_manager import Observer
+from managers.pipe_manager import PipeManager
+from managers.score_manager import ScoreManager
+from managers.simulation_protocol import (
+    FLAG_SHARED,
+    INFO_HEADER,
+    KIND_ERROR,
+    KIND_INFO,
+    KIND_RESET,
+    KIND_STEP,
+    MESSAGE_HEADER,
+    MESSAGE_MAGIC,
+    MAX_ENVIRONMENTS,
+    batch_size,
+    batch_views,
+    result_size,
+)
+
+# Rewards of a step: per pipe passed, and for crashing
+PIPE_REWARD: float = 1.0
+CRASH_REWARD: float = -1.0
+
+
+class VectorEnvironment:
+    """Many headless single-player games stepped together, for training agents.
+
+    Every environment flies its own bird over its own course. An environment that
+    crashes is reset within the same step, so a batch never stalls on finished runs:
+    the observation reported along with its done flag is the first of the next run.
+    """
+
+    def __init__(
+        self: VectorEnvironment,
+        environments: int,
+        seed: int | None = None,
+        rays: int = 0,
+    ) -> None:
+        """Creates the games, each waiting for `reset` to start.
+
+        Args:
+            environments (int): Number of games.
+            seed (int | None, optional): Seed of the first game's course; game i flies
+                the course of seed + i. Defaults to None (random courses).
+            rays (int, optional): Rays cast by each game's `Observer`. Defaults to 0.
+
+        Raises:
+            ValueError: If the number of games is not between 1 and
+                `MAX_ENVIRONMENTS`.
+        """
+        if not 1 <= environments <= MAX_ENVIRONMENTS:
+            raise ValueError(
+                f"environments must be between 1 and {MAX_ENVIRONMENTS}, got {environments}"
+            )
+        surface = pygame.Surface((constants.BIRD_SIZE, constants.BIRD_SIZE))
+        self.__birds: list[Bird] = [Bird(70, 90, surface) for _ in range(environments)]
+        self.__pipe_managers: list[PipeManager] = [
+            PipeManager(
+                gap=200,
+                pipe_width=80,
+                speed=4,
+                spawn_distance=300,
+                seed=None if seed is None else seed + environment,
+            )
+            for environment in range(environments)
+        ]
+        self.__score_managers: list[ScoreManager] = [
+            ScoreManager() for _ in range(environments)
+        ]
+        self.__observers: list[Observer] = [
+            Observer(bird, pipe_manager, rays)
+            for bird, pipe_manager in zip(self.__birds, self.__pipe_managers)
+        ]
+        self.__last_passed: list[int] = [-1] * environments
+        # Observers write into rows of one batch owned by the environment, so no
+        # observer ever holds on to a caller's buffer
+        self.__observations: np.ndarray = np.zeros(
+            (environments, self.__observers[0].size), dtype=np.float32
+        )
+        self.__rows: list[np.ndarray] = list(self.__observations)
+
+    def reset(self: VectorEnvironment, mask: np.ndarray | None = None) -> None:
+        """Restarts games and observes every game into `observations`.
+
+        Args:
+            mask (np.ndarray | None, optional): Nonzero for each game to restart.
+                Defaults to None (all of them).
+
+        Returns:
+            None
+        """
+        rows = self.__rows
+        for environment in range(len(rows)):
+            if mask is None or mask[environment]:
+                self.__restart(environment)
+            self.__observers[environment].observe(rows[environment])
+
+    def step(
+        self: VectorEnvironment,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        dones: np.ndarray,
+    ) -> None:
+        """Advances every game by one frame, observing them into `observations`.
+
+        Args:
+            actions (np.ndarray): Nonzero for each game whose bird flaps.
+            rewards (np.ndarray): Receives each game's reward for the frame.
+            dones (np.ndarray): Receives 1 for each game that crashed, 0 otherwise.
+
+        Returns:
+            None
+        """
+        rows = self.__rows
+        for environment in range(len(rows)):
+            score_manager = self.__score_managers[environment]
+            score = score_manager.score
+            last_passed, crashed = step_playing(
+                self.__birds[environment],
+                self.__pipe_managers[environment],
+                score_manager,
+                bool(actions[environment]),
+                self.__last_passed[environment],
+            )
+            self.__last_passed[environment] = last_passed
+            if crashed:
+                rewards[environment] = CRASH_REWARD
+                dones[environment] = 1
+                self.__restart(environment)
+            else:
+                rewards[environment] = (score_manager.score - score) * PIPE_REWARD
+                dones[environment] = 0
+            self.__observers[environment].observe(rows[environment])
+
+    def __restart(self: VectorEnvironment, environment: int) -> None:
+        """Starts a new run in one game.
+
+        Args:
+            environment (int): Index of the game.
+
+        Returns:
+            None
+        """
+        reset_game(
+            self.__birds[environment],
+            self.__pipe_managers[environment],
+            self.__score_managers[environment],
+        )
+        self.__last_passed[environment] = -1
+
+    @property
+    def environments(self: VectorEnvironment) -> int:
+        """Gets the number of games.
+
+        Returns:
+            int: The number of games.
+        """
+        return len(self.__birds)
+
+    @property
+    def observation_size(self: VectorEnvironment) -> int:
+        """Gets the number of values in each game's observation.
+
+        Returns:
+            int: The size of an observation.
+        """
+        return self.__observers[0].size
+
+    @property
+    def observations(self: VectorEnvironment) -> np.ndarray:
+        """Gets the latest observation of every game, overwritten by each step.
+
+        Returns:
+            np.ndarray: One float32 row per game.
+        """
+        return self.__observations
+
+
+class SimulationServer:
+    """Serves a `VectorEnvironment` to trainers over a Unix domain socket."""
+
+    def __init__(
+        self: SimulationServer,
+        path: str,
+        environment: VectorEnvironment,
+        shared: bool = False,
+    ) -> None:
+        """Prepares the batch buffers and, optionally, a shared memory block.
+
+        Args:
+            path (str): Path of the socket to listen on.
+            environment (VectorEnvironment): The games to serve.
+            shared (bool, optional): Whether to create a shared memory block clients
+                can exchange batches through. Defaults to False.
+        """
+        self.__path = path
+        # Whether the socket file is ours to remove: set once listening on it
+        self.__bound = False
+        self.__environment = environment
+        environments = environment.environments
+        observation_size = environment.observation_size
+
+        # Payload replies are sent straight from this buffer
+        self.__buffer = bytearray(batch_size(environments, observation_size))
+        self.__views = batch_views(self.__buffer, environments, observation_size)
+        results = result_size(environments, observation_size)
+        self.__results = memoryview(self.__buffer)[:results]
+        self.__observations = self.__results[: self.__views[0].nbytes]
+
+        self.__memory: shared_memory.SharedMemory | None = None
+        self.__shared_views: tuple[np.ndarray, ...] | None = None
+        name = ""
+        if shared:
+            self.__memory = shared_memory.SharedMemory(
+                create=True, size=batch_size(environments, observation_size)
+            )
+            self.__shared_views = batch_views(
+                self.__memory.buf, environments, observation_size
+            )
+            name = self.__memory.name
+        self.__info = INFO_HEADER.pack(observation_size) + name.encode()
+
+    def run(self: SimulationServer) -> None:
+        """Serves until interrupted or terminated, then removes the socket and memory.
+
+        Returns:
+            None
+        """
+        try:
+            asyncio.run(self.serve())
+        finally:
+            self.close()
+
+    async def serve(self: SimulationServer) -> None:
+        """Accepts connections until SIGINT or SIGTERM is received.
+
+        Returns:
+            None
+
+        Raises:
+            FileExistsError: If the path exists and is not a socket.
+            OSError: If another server is listening on the path.
+        """
+        stopped = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signal_number, stopped.set)
+
+        self.__check_path()
+        server = await asyncio.start_unix_server(self.__serve_client, path=self.__path)
+        self.__bound = True
+        async with server:
+            await stopped.wait()
+
+    def __check_path(self: SimulationServer) -> None:
+        """Makes sure binding cannot replace a file or a live server's socket.
+
+        A socket nobody listens on is left over from a server that did not exit
+        cleanly; binding replaces it.
+
+        Returns:
+            None
+
+        Raises:
+            FileExistsError: If the path exists and is not a socket.
+            OSError: If another server is listening on the path.
+        """
+        try:
+            mode = os.stat(self.__path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise FileExistsError(f"{self.__path} exists and is not a socket")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(self.__path)
+            except OSError:
+                return
+        raise OSError(errno.EADDRINUSE, "another server is listening on", self.__path)
+
+    def close(self: SimulationServer) -> None:
+        """Removes the socket file, if this server bound it, and releases the shared
+        memory block.
+
+        Returns:
+            None
+        """
+        if self.__bound:
+            self.__bound = False
+            if os.path.exists(self.__path):
+                os.unlink(self.__path)
+        if self.__memory is not None:
+            # The block can only be closed once no array views its buffer
+            self.__shared_views = None
+            self.__memory.close()
+            self.__memory.unlink()
+            self.__memory = None
+
+    async def __serve_client(
+        self: SimulationServer,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Answers one client's requests in order until it disconnects.
+
+        Args:
+            reader (asyncio.StreamReader): The client's requests.
+            writer (asyncio.StreamWriter): The replies.
+
+        Returns:
+            None
+        """
+        environments = self.__environment.environments
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(MESSAGE_HEADER.size)
+                    magic, kind, flags, count, length = MESSAGE_HEADER.unpack(header)
+                    if magic != MESSAGE_MAGIC:
+                        break
+                    payload = await reader.readexactly(length) if length else b""
+                except (asyncio.IncompleteReadError, ConnectionResetError):
+                    break
+
+                try:
+                    reply = self.__dispatch(kind, flags, count, payload)
+                except ValueError as error:
+                    kind, flags, reply = KIND_ERROR, 0, str(error).encode()
+                # Replies carry the served environment count, e.g. to answer INFO
+                writer.write(
+                    MESSAGE_HEADER.pack(
+                        MESSAGE_MAGIC, kind, flags, environments, len(reply)
+                    )
+                )
+                if reply:
+                    writer.write(reply)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    def __dispatch(
+        self: SimulationServer, kind: int, flags: int, count: int, payload: bytes
+    ) -> bytes | memoryview:
+        """Executes one request.
+
+        Args:
+            kind (int): The message kind.
+            flags (int): The message flags.
+            count (int): Number of environments the client expects.
+            payload (bytes): The request's payload.
+
+        Returns:
+            bytes | memoryview: The reply's payload.
+
+        Raises:
+            ValueError: If the request is malformed or cannot be served.
+        """
+        if kind == KIND_INFO:
+            return self.__info
+
+        environment = self.__environment
+        if count != environment.environments:
+            raise ValueError(
+                f"request for {count} environments, serving {environment.environments}"
+            )
+        shared = bool(flags & FLAG_SHARED)
+        if shared and self.__shared_views is None:
+            raise ValueError("the server has no shared memory")
+        observations, rewards, dones, actions = (
+            self.__shared_views if shared else self.__views
+        )
+
+        if kind == KIND_RESET:
+            if payload and len(payload) != count:
+                raise ValueError(f"reset mask of {len(payload)} bytes for {count} environments")
+            mask = np.frombuffer(payload, dtype=np.uint8) if payload else None
+            environment.reset(mask)
+            np.copyto(observations, environment.observations)
+            return b"" if shared else self.__observations
+
+        if kind == KIND_STEP:
+            if not shared:
+                if len(payload) != count:
+                    raise ValueError(f"{len(payload)} actions for {count} environments")
+                actions = np.frombuffer(payload, dtype=np.uint8)
+            environment.step(actions, rewards, dones)
+            np.copyto(observations, environment.observations)
+            return b"" if shared else self.__results
+
+        raise ValueError(f"unknown message kind {kind}")
+
+    @property
+    def path(self: SimulationServer) -> str:
+        """Gets the path of the socket.
+
+        Returns:
+            str: The socket path.
+        """
+        return self.__path
+
+    @property
+    def shared_memory_name(self: SimulationServer) -> str | None:
+        """Gets the name of the shared memory block clients attach to.
+
+        Returns:
+            str | None: The block's name, or None without shared memory.
+        """
+        return None if self.__memory is None else self.__memory.name
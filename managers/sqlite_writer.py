@@ -0,0 +1,303 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Sequence
+
+import queue
+import sqlite3
+import sys
+import threading
+
+
+class SQLiteWriter:
+    """Owns a SQLite connection on a background thread and applies queued writes in batches.
+
+    Callers only enqueue statements, so the game loop never waits on the disk. All
+    statements waiting in the queue are executed in a single transaction. Queries run
+    on the same thread, after every write queued before them, and hand their rows to
+    a callback. Queuing never waits either: when the worker has fallen `max_pending`
+    items behind, further writes and queries are dropped and counted in `dropped`, and
+    the count is reported when the writer closes.
+
+    If the database cannot be opened, the failure is reported once and kept in
+    `error`; from then on writes and queries are dropped and `flush` returns at once.
+    """
+
+    def __init__(
+        self: SQLiteWriter,
+        path: str,
+        schema: str,
+        batch_size: int = 512,
+        max_pending: int = 4096,
+        migrations: Sequence[str] = (),
+    ) -> None:
+        """Opens the database on a worker thread and creates the schema.
+
+        Args:
+            path (str): Path of the database file.
+            schema (str): SQL script run once when the connection opens.
+            batch_size (int, optional): Maximum number of queued writes per transaction.
+                Defaults to 512.
+            max_pending (int, optional): Most writes and queries waiting in the queue;
+                once it is full, new ones are dropped. Defaults to 4096.
+            migrations (Sequence[str], optional): SQL scripts that change the schema,
+                in order. Each runs once per database, in its own transaction, after
+                the schema script; `PRAGMA user_version` counts those applied.
+                Defaults to none.
+        """
+        self.__path = path
+        self.__schema = schema
+        self.__migrations = list(migrations)
+        self.__batch_size = batch_size
+        self.__error: sqlite3.Error | None = None
+        self.__dropped: int = 0
+        self.__queue: queue.Queue[tuple[str, Any, Any] | None] = queue.Queue(max_pending)
+        self.__thread = threading.Thread(
+            target=self.__run, name="sqlite-writer", daemon=True
+        )
+        self.__thread.start()
+
+    def submit(
+        self: SQLiteWriter, sql: str, rows: Iterable[Sequence[Any]]
+    ) -> None:
+        """Queues a statement to be executed once per row.
+
+        Args:
+            sql (str): Parameterized SQL statement.
+            rows (Iterable[Sequence[Any]]): Parameters for each execution.
+
+        Returns:
+            None
+        """
+        if self.__error is None:
+            self.__enqueue((sql, list(rows), None))
+
+    def query(
+        self: SQLiteWriter,
+        sql: str,
+        parameters: Sequence[Any],
+        callback: Callable[[list[tuple[Any, ...]]], None],
+    ) -> None:
+        """Queues a read; the callback receives the rows on the worker thread.
+
+        A read dropped because the queue is full never calls its callback.
+
+        Args:
+            sql (str): Parameterized SQL query.
+            parameters (Sequence[Any]): Query parameters.
+            callback (Callable[[list[tuple[Any, ...]]], None]): Called with the fetched rows.
+
+        Returns:
+            None
+        """
+        if self.__error is None:
+            self.__enqueue((sql, parameters, callback))
+
+    def flush(self: SQLiteWriter) -> None:
+        """Blocks until every queued write has been committed, or dropped if the
+        database could not be opened.
+
+        Returns:
+            None
+        """
+        if self.__error is None:
+            self.__queue.join()
+
+    def close(self: SQLiteWriter, timeout: float | None = 5.0) -> None:
+        """Commits pending writes and stops the worker thread.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait for the worker. Defaults to 5.0.
+
+        Returns:
+            None
+        """
+        if self.__dropped:
+            print(
+                f"Dropped {self.__dropped} write(s) and read(s) of {self.__path}: "
+                "the writer fell behind",
+                file=sys.stderr,
+            )
+        try:
+            self.__queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self.__thread.join(timeout)
+
+    def __enqueue(self: SQLiteWriter, item: tuple[str, Any, Any]) -> None:
+        """Queues a write or query without waiting, dropping it if the queue is full.
+
+        Args:
+            item (tuple[str, Any, Any]): The SQL, its parameters and the query's
+                callback, None for a write.
+
+        Returns:
+            None
+        """
+        try:
+            self.__queue.put_nowait(item)
+        except queue.Full:
+            self.__dropped += 1
+
+    def __open(self: SQLiteWriter) -> sqlite3.Connection:
+        """Connects to the database and creates the schema.
+
+        Returns:
+            sqlite3.Connection: The open connection.
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or initialized.
+        """
+        connection = sqlite3.connect(self.__path)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(self.__schema)
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            for number in range(version, len(self.__migrations)):
+                connection.executescript(
+                    f"BEGIN; {self.__migrations[number]}; "
+                    f"PRAGMA user_version = {number + 1}; COMMIT;"
+                )
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    def __discard(self: SQLiteWriter) -> None:
+        """Worker loop without a database: drops queued items until closed.
+
+        Returns:
+            None
+        """
+        while True:
+            item = self.__queue.get()
+            self.__queue.task_done()
+            if item is None:
+                return
+
+    def __run(self: SQLiteWriter) -> None:
+        """Worker loop: waits for writes, then drains and commits them together.
+
+        Returns:
+            None
+        """
+        try:
+            connection = self.__open()
+        except sqlite3.Error as error:
+            self.__error = error
+            print(
+                f"Cannot open {self.__path}, its writes are dropped: {error}",
+                file=sys.stderr,
+            )
+            self.__discard()
+            return
+
+        running = True
+        while running:
+            batch = [self.__queue.get()]
+            while len(batch) < self.__batch_size:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                with connection:
+                    for item in batch:
+                        if item is None:
+                            running = False
+                            continue
+                        sql, parameters, callback = item
+                        if callback is None:
+                            self.__write(connection, sql, parameters)
+                        else:
+                            self.__read(connection, sql, parameters, callback)
+            except sqlite3.Error as error:
+                # The commit failed: the batch is lost, but later writes may succeed
+                print(f"Failed to commit to {self.__path}: {error}", file=sys.stderr)
+
+            for _ in batch:
+                self.__queue.task_done()
+
+        connection.close()
+
+    def __write(
+        self: SQLiteWriter,
+        connection: sqlite3.Connection,
+        sql: str,
+        rows: list[Sequence[Any]],
+    ) -> None:
+        """Executes a queued write, reporting a failure instead of raising it.
+
+        Args:
+            connection (sqlite3.Connection): The worker's connection.
+            sql (str): Parameterized SQL statement.
+            rows (list[Sequence[Any]]): Parameters for each execution.
+
+        Returns:
+            None
+        """
+        try:
+            connection.executemany(sql, rows)
+        except sqlite3.Error as error:
+            print(f"Failed to write to {self.__path}: {error}", file=sys.stderr)
+
+    def __read(
+        self: SQLiteWriter,
+        connection: sqlite3.Connection,
+        sql: str,
+        parameters: Sequence[Any],
+        callback: Callable[[list[tuple[Any, ...]]], None],
+    ) -> None:
+        """Runs a queued query and hands its rows to the callback.
+
+        Neither a failed query nor an exception in the callback may end the worker:
+        every later write of every user of the database depends on it.
+
+        Args:
+            connection (sqlite3.Connection): The worker's connection.
+            sql (str): Parameterized SQL query.
+            parameters (Sequence[Any]): Query parameters.
+            callback (Callable[[list[tuple[Any, ...]]], None]): Called with the rows.
+
+        Returns:
+            None
+        """
+        try:
+            rows = connection.execute(sql, parameters).fetchall()
+        except sqlite3.Error as error:
+            print(f"Failed to read from {self.__path}: {error}", file=sys.stderr)
+            return
+        try:
+            callback(rows)
+        except Exception as error:
+            print(
+                f"Failed to handle rows read from {self.__path}: {error!r}",
+                file=sys.stderr,
+            )
+
+    @property
+    def path(self: SQLiteWriter) -> str:
+        """Gets the path of the database file.
+
+        Returns:
+            str: The database path.
+        """
+        return self.__path
+
+    @property
+    def dropped(self: SQLiteWriter) -> int:
+        """Gets the number of writes and queries dropped because the queue was full.
+
+        Returns:
+            int: The number of dropped items.
+        """
+        return self.__dropped
+
+    @property
+    def error(self: SQLiteWriter) -> sqlite3.Error | None:
+        """Gets why the database could not be opened, if it could not.
+
+        Returns:
+            sqlite3.Error | None: The failure, None while the database is usable.
+        """
+        return self.__error
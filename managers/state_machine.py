@@ -0,0 +1,314 @@
+"""Table-driven screens: each state owns its input, update and render.
+
+A `StateMachine` runs one frame of its current `State` per `frame` call. Handlers
+answer with an action name, and a transition table maps (state, action) pairs to the
+next state, resolved to the state objects once when the machine is built. Leaving a
+state calls its `exit` hook and entering one calls `enter`, so a state builds its
+cached layouts and surfaces only while it is shown.
+
+An optional phase hook is called as each phase of a frame begins. `StateTimer` is one
+such hook: it adds up the time every state spends per phase.
+"""
+from __future__ import annotations
+from typing import Callable
+
+import time
+
+import pygame
+
+# Phases of a frame, in the order they run and are reported
+PHASES: list[str] = ["input", "update", "render"]
+
+
+class State:
+    """One screen of the game. Every handler does nothing until overridden."""
+
+    def __init__(self: State, name: str, static: bool = False) -> None:
+        """Creates a state.
+
+        Args:
+            name (str): Name of the state in the transition table.
+            static (bool, optional): Whether nothing on its screen moves by itself.
+                Defaults to False.
+        """
+        self.__name = name
+        self.__static = static
+
+    def enter(self: State, previous: str | None) -> None:
+        """Called when the state becomes current, to build its cached resources.
+
+        Args:
+            previous (str | None): Name of the state left, None when the machine starts.
+
+        Returns:
+            None
+        """
+
+    def exit(self: State, following: str | None) -> None:
+        """Called when the state stops being current, to release its cached resources.
+
+        Args:
+            following (str | None): Name of the next state, None when the machine stops.
+
+        Returns:
+            None
+        """
+
+    def handle_input(
+        self: State,
+        events: list[pygame.event.Event],
+        keys_pressed: pygame.key.ScancodeWrapper,
+    ) -> str | None:
+        """Reacts to the frame's input.
+
+        Args:
+            events (list[pygame.event.Event]): Events of the frame.
+            keys_pressed (pygame.key.ScancodeWrapper): Pressed state of all keys.
+
+        Returns:
+            str | None: An action of the transition table, or None to stay.
+        """
+        return None
+
+    def update(self: State) -> str | None:
+        """Advances the state by one frame; not called when input led elsewhere.
+
+        Returns:
+            str | None: An action of the transition table, or None to stay.
+        """
+        return None
+
+    def render(self: State) -> None:
+        """Draws the frame.
+
+        Returns:
+            None
+        """
+
+    @property
+    def name(self: State) -> str:
+        """Gets the name of the state.
+
+        Returns:
+            str: The state's name.
+        """
+        return self.__name
+
+    @property
+    def static(self: State) -> bool:
+        """Checks whether nothing on the state's screen moves by itself.
+
+        Returns:
+            bool: True for a static screen.
+        """
+        return self.__static
+
+
+class StateMachine:
+    """Runs the current state and follows its actions through a transition table."""
+
+    def __init__(
+        self: StateMachine,
+        states: list[State],
+        transitions: dict[tuple[str, str], str | None],
+        initial: str,
+        on_phase: Callable[[str, str], None] | None = None,
+    ) -> None:
+        """Creates a machine; `start` enters its initial state.
+
+        Args:
+            states (list[State]): Every state, with distinct names.
+            transitions (dict[tuple[str, str], str | None]): Next state of each
+                (state, action) pair; None stops the machine.
+            initial (str): Name of the first state.
+            on_phase (Callable[[str, str], None] | None, optional): Called with the
+                name of the state a frame began in and each phase as it begins: one of
+                `PHASES`, then "end" once the frame is done. Defaults to None.
+
+        Raises:
+            ValueError: If names repeat, or a transition or the initial state names an
+                unknown state.
+        """
+        by_name = {state.name: state for state in states}
+        if len(by_name) != len(states):
+            raise ValueError("state names must be unique")
+        if initial not in by_name:
+            raise ValueError(f"unknown initial state {initial!r}")
+
+        # Actions of every state resolved to the state they lead to
+        self.__routes: dict[str, dict[str, State | None]] = {name: {} for name in by_name}
+        for (source, action), target in transitions.items():
+            if source not in by_name or (target is not None and target not in by_name):
+                raise ValueError(
+                    f"transition {source!r} --{action}--> {target!r} names an unknown state"
+                )
+            self.__routes[source][action] = None if target is None else by_name[target]
+
+        self.__state = by_name[initial]
+        self.__actions = self.__routes[initial]
+        self.__on_phase = on_phase
+        self.__running = False
+
+    def start(self: StateMachine) -> None:
+        """Enters the initial state.
+
+        Returns:
+            None
+        """
+        self.__running = True
+        self.__state.enter(None)
+
+    def stop(self: StateMachine) -> None:
+        """Leaves the current state without entering another.
+
+        Returns:
+            None
+        """
+        if self.__running:
+            self.__running = False
+            self.__state.exit(None)
+
+    def frame(
+        self: StateMachine,
+        events: list[pygame.event.Event],
+        keys_pressed: pygame.key.ScancodeWrapper,
+    ) -> None:
+        """Runs one frame of the current state: input, update and render.
+
+        An action returned by the input handler is followed at once and the update is
+        skipped. The frame is rendered by the state current after the update, unless
+        the machine stopped.
+
+        Args:
+            events (list[pygame.event.Event]): Events of the frame.
+            keys_pressed (pygame.key.ScancodeWrapper): Pressed state of all keys.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If a state returns an action its table row does not have.
+        """
+        state = self.__state
+        name = state.name
+        on_phase = self.__on_phase
+
+        if on_phase is not None:
+            on_phase(name, "input")
+        action = state.handle_input(events, keys_pressed)
+        if action is None:
+            if on_phase is not None:
+                on_phase(name, "update")
+            action = state.update()
+        if action is not None:
+            self.__follow(action)
+
+        if self.__running:
+            if on_phase is not None:
+                on_phase(name, "render")
+            self.__state.render()
+        if on_phase is not None:
+            on_phase(name, "end")
+
+    def __follow(self: StateMachine, action: str) -> None:
+        """Leaves the current state for the one an action leads to.
+
+        Args:
+            action (str): The action returned by the current state.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the current state has no transition for the action.
+        """
+        state = self.__state
+        if action not in self.__actions:
+            raise ValueError(f"state {state.name!r} has no transition for {action!r}")
+        target = self.__actions[action]
+        if target is None:
+            self.stop()
+            return
+        state.exit(target.name)
+        self.__state = target
+        self.__actions = self.__routes[target.name]
+        target.enter(state.name)
+
+    @property
+    def state(self: StateMachine) -> str:
+        """Gets the name of the current state.
+
+        Returns:
+            str: The current state's name.
+        """
+        return self.__state.name
+
+    @property
+    def running(self: StateMachine) -> bool:
+        """Checks whether the machine has started and not stopped.
+
+        Returns:
+            bool: True while running.
+        """
+        return self.__running
+
+
+class StateTimer:
+    """Phase hook of a `StateMachine` that adds up the time spent per state and phase.
+
+    A frame is booked to the state it began in, including the render of the state it
+    switched to.
+    """
+
+    def __init__(self: StateTimer) -> None:
+        """Creates a timer with nothing recorded."""
+        # Seconds per phase, then the number of frames, of every state seen
+        self.__totals: dict[str, list[float]] = {}
+        self.__current: list[float] | None = None
+        self.__phase = 0
+        self.__started = 0.0
+
+    def __call__(self: StateTimer, state: str, phase: str) -> None:
+        """Ends the running phase and starts timing the next one.
+
+        Args:
+            state (str): Name of the state the frame began in.
+            phase (str): One of `PHASES`, or "end" once the frame is done.
+
+        Returns:
+            None
+        """
+        now = time.perf_counter()
+        current = self.__current
+        if current is not None:
+            current[self.__phase] += now - self.__started
+        if phase == "end":
+            if current is not None:
+                current[len(PHASES)] += 1
+            self.__current = None
+            return
+        if phase == "input":
+            current = self.__totals.get(state)
+            if current is None:
+                current = self.__totals[state] = [0.0] * (len(PHASES) + 1)
+            self.__current = current
+        self.__phase = PHASES.index(phase)
+        self.__started = now
+
+    def report(self: StateTimer) -> str:
+        """Summarizes the mean time per frame of every state and phase.
+
+        Returns:
+            str: One line per state, in the order they were first seen.
+        """
+        lines = ["state timing (mean per frame):"]
+        for state, totals in self.__totals.items():
+            frames = int(totals[len(PHASES)])
+            if not frames:
+                continue
+            phases = ", ".join(
+                f"{phase} {totals[index] * 1000 / frames:.3f} ms"
+                for index, phase in enumerate(PHASES)
+            )
+            lines.append(f"  {state}: {frames} frames, {phases}")
+        return "\n".join(lines)
@@ -0,0 +1,288 @@
+"""Per-run gameplay telemetry and offline aggregation.
+
+During play, run results and jump timings are written into preallocated NumPy buffers.
+Full buffers are handed to a `SQLiteWriter` in one batch, so the frame loop only ever
+copies a few numbers and disk I/O happens on the writer's thread.
+
+Run `python -m managers.telemetry_manager DATABASE` for a death heatmap and score histogram.
+"""
+from __future__ import annotations
+
+import sqlite3
+import sys
+import time
+import numpy as np
+import constants
+
+from managers.sqlite_writer import SQLiteWriter
+
+TELEMETRY_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS runs (
+    session INTEGER NOT NULL,
+    run INTEGER NOT NULL,
+    death_x REAL NOT NULL,
+    death_y REAL NOT NULL,
+    pipe_index INTEGER NOT NULL,
+    frames_alive INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (session, run)
+);
+CREATE TABLE IF NOT EXISTS jumps (
+    session INTEGER NOT NULL,
+    run INTEGER NOT NULL,
+    frame INTEGER NOT NULL
+);
+"""
+
+_INSERT_RUN: str = "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)"
+_INSERT_JUMP: str = "INSERT INTO jumps VALUES (?, ?, ?)"
+
+
+class TelemetryManager:
+    """Records per-run telemetry into fixed buffers and flushes them in batches."""
+
+    def __init__(
+        self: TelemetryManager,
+        writer: SQLiteWriter,
+        run_capacity: int = 32,
+        jump_capacity: int = 8192,
+    ) -> None:
+        """Allocates the telemetry buffers.
+
+        Args:
+            writer (SQLiteWriter): Background writer whose database uses `TELEMETRY_SCHEMA`.
+            run_capacity (int, optional): Runs buffered before a flush. Defaults to 32.
+            jump_capacity (int, optional): Jumps buffered before a flush. Defaults to 8192.
+        """
+        self.__writer = writer
+        self.__session: int = time.time_ns() // 1_000_000
+
+        # Columns of finished runs: run, death x, death y, pipe index, frames alive, score
+        self.__run_ids = np.zeros(run_capacity, dtype=np.int64)
+        self.__death_xy = np.zeros((run_capacity, 2), dtype=np.float32)
+        self.__run_stats = np.zeros((run_capacity, 3), dtype=np.int32)
+        self.__run_count: int = 0
+
+        # Jumps of every buffered run: run, frame
+        self.__jumps = np.zeros((jump_capacity, 2), dtype=np.int64)
+        self.__jump_count: int = 0
+
+        self.__run: int = -1
+        self.__frame: int = 0
+
+    def start_run(self: TelemetryManager) -> None:
+        """Begins recording a new run.
+
+        Returns:
+            None
+        """
+        self.__run += 1
+        self.__frame = 0
+
+    def record_frame(self: TelemetryManager, jump: bool) -> None:
+        """Records one simulated frame of the current run.
+
+        Args:
+            jump (bool): Whether the jump input was applied this frame.
+
+        Returns:
+            None
+        """
+        self.__frame += 1
+        if jump:
+            if self.__jump_count == len(self.__jumps):
+                self.flush()
+            self.__jumps[self.__jump_count, 0] = self.__run
+            self.__jumps[self.__jump_count, 1] = self.__frame
+            self.__jump_count += 1
+
+    def record_death(
+        self: TelemetryManager, x: float, y: float, pipe_index: int, score: int
+    ) -> None:
+        """Records how the current run ended.
+
+        Args:
+            x (float): Horizontal position of the bird at death, in pixels.
+            y (float): Vertical position of the bird at death, in pixels.
+            pipe_index (int): Index of the pipe pair the bird died at.
+            score (int): Final score of the run.
+
+        Returns:
+            None
+        """
+        slot = self.__run_count
+        self.__run_ids[slot] = self.__run
+        self.__death_xy[slot, 0] = x
+        self.__death_xy[slot, 1] = y
+        self.__run_stats[slot, 0] = pipe_index
+        self.__run_stats[slot, 1] = self.__frame
+        self.__run_stats[slot, 2] = score
+        self.__run_count += 1
+
+        if self.__run_count == len(self.__run_ids):
+            self.flush()
+
+    def flush(self: TelemetryManager) -> None:
+        """Hands every buffered run and jump to the writer and empties the buffers.
+
+        Returns:
+            None
+        """
+        session = self.__session
+        if self.__run_count:
+            count = self.__run_count
+            self.__writer.submit(
+                _INSERT_RUN,
+                (
+                    (session, run, death_x, death_y, pipe_index, frames, score)
+                    for run, (death_x, death_y), (pipe_index, frames, score) in zip(
+                        self.__run_ids[:count].tolist(),
+                        self.__death_xy[:count].tolist(),
+                        self.__run_stats[:count].tolist(),
+                    )
+                ),
+            )
+            self.__run_count = 0
+
+        if self.__jump_count:
+            self.__writer.submit(
+                _INSERT_JUMP,
+                (
+                    (session, run, frame)
+                    for run, frame in self.__jumps[:self.__jump_count].tolist()
+                ),
+            )
+            self.__jump_count = 0
+
+    def close(self: TelemetryManager) -> None:
+        """Flushes the buffers and shuts down the writer.
+
+        Returns:
+            None
+        """
+        self.flush()
+        self.__writer.close()
+
+    @property
+    def session(self: TelemetryManager) -> int:
+        """Gets the identifier of this play session.
+
+        Returns:
+            int: The session start time in milliseconds since the epoch.
+        """
+        return self.__session
+
+
+def open_telemetry(path: str) -> TelemetryManager:
+    """Creates a telemetry manager writing to the given database file.
+
+    Args:
+        path (str): Path of the SQLite database.
+
+    Returns:
+        TelemetryManager: The manager, with its writer thread running.
+    """
+    return TelemetryManager(SQLiteWriter(path, TELEMETRY_SCHEMA))
+
+
+def load_runs(path: str) -> np.ndarray:
+    """Loads every recorded run.
+
+    Args:
+        path (str): Path of the SQLite database.
+
+    Returns:
+        np.ndarray: Array of shape (runs, 5) with death x, death y, pipe index,
+        frames alive and score.
+    """
+    with sqlite3.connect(path) as connection:
+        rows = connection.execute(
+            "SELECT death_x, death_y, pipe_index, frames_alive, score FROM runs"
+        ).fetchall()
+    return np.array(rows, dtype=np.float64).reshape(-1, 5)
+
+
+def load_top_runs(path: str, limit: int) -> list[tuple[np.ndarray, int]]:
+    """Loads the jump timings of the highest-scoring recorded runs.
+
+    Args:
+        path (str): Path of the SQLite database.
+        limit (int): Maximum number of runs.
+
+    Returns:
+        list[tuple[np.ndarray, int]]: For each run, best first, the frames on which a
+        jump was applied and the number of frames the run lasted.
+    """
+    with sqlite3.connect(path) as connection:
+        rows = connection.execute(
+            "WITH top AS ("
+            "SELECT session, run, frames_alive, score FROM runs "
+            "ORDER BY score DESC, frames_alive DESC LIMIT ?"
+            ") "
+            "SELECT top.session, top.run, top.frames_alive, jumps.frame FROM top "
+            "LEFT JOIN jumps USING (session, run) "
+            "ORDER BY top.score DESC, top.frames_alive DESC, "
+            "top.session, top.run, jumps.frame",
+            (limit,),
+        ).fetchall()
+
+    runs: dict[tuple[int, int], tuple[list[int], int]] = {}
+    for session, run, frames_alive, frame in rows:
+        jumps, _ = runs.setdefault((session, run), ([], frames_alive))
+        if frame is not None:
+            jumps.append(frame)
+    return [
+        (np.array(jumps, dtype=np.int64), frames_alive)
+        for jumps, frames_alive in runs.values()
+    ]
+
+
+def death_heatmap(runs: np.ndarray, cell_size: int = 50) -> np.ndarray:
+    """Counts deaths per screen cell.
+
+    Args:
+        runs (np.ndarray): Runs as returned by `load_runs`.
+        cell_size (int, optional): Cell size in pixels. Defaults to 50.
+
+    Returns:
+        np.ndarray: Death counts of shape (rows, columns), row 0 at the top of the screen.
+    """
+    rows = -(-constants.SCREEN_HEIGHT // cell_size)
+    columns = -(-constants.SCREEN_WIDTH // cell_size)
+    heatmap, _, _ = np.histogram2d(
+        runs[:, 1],
+        runs[:, 0],
+        bins=(rows, columns),
+        range=((0, rows * cell_size), (0, columns * cell_size)),
+    )
+    return heatmap.astype(np.int64)
+
+
+def score_histogram(runs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Counts runs per final score.
+
+    Args:
+        runs (np.ndarray): Runs as returned by `load_runs`.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The scores and the number of runs with each score.
+    """
+    scores = runs[:, 4].astype(np.int64)
+    counts = np.bincount(scores) if len(scores) else np.zeros(0, dtype=np.int64)
+    present = np.flatnonzero(counts)
+    return present, counts[present]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m managers.telemetry_manager DATABASE")
+
+    all_runs = load_runs(sys.argv[1])
+    print(f"{len(all_runs)} run(s)")
+    if len(all_runs):
+        print("Deaths by screen cell (rows top to bottom):")
+        for heatmap_row in death_heatmap(all_runs):
+            print(" ".join(f"{int(count):4d}" for count in heatmap_row))
+        print("Score histogram:")
+        for value, count in zip(*score_histogram(all_runs)):
+            print(f"{int(value):5d} {int(count):6d}")
@@ -0,0 +1,43 @@
+"""Shared test setup: pygame runs without a window and caches nothing at home."""
+from __future__ import annotations
+from typing import Iterator
+
+import os
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+import constants
+
+# menu_manager builds its FontManager on import, before any test's tmp_path exists
+FONT_CACHE: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+constants.FONT_CACHE_PATH = os.path.join(FONT_CACHE.name, "fonts.json")
+
+
+@pytest.fixture
+def window() -> Iterator[pygame.Surface]:
+    """Opens the headless display for one test.
+
+    Yields:
+        pygame.Surface: The window surface.
+    """
+    pygame.display.init()
+    yield pygame.display.set_mode([constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT])
+    pygame.display.quit()
+
+
+@pytest.fixture
+def keys() -> tuple[pygame.key.ScancodeWrapper, pygame.key.ScancodeWrapper]:
+    """Builds the keyboard states a run is flown with.
+
+    Returns:
+        tuple[pygame.key.ScancodeWrapper, pygame.key.ScancodeWrapper]: Every key
+        released, then only Space held; indexed by whether the bird jumps.
+    """
+    released = [False] * 512
+    jumping = list(released)
+    # Key states are indexed by scancode; the wrappers look key codes up
+    jumping[pygame.KSCAN_SPACE] = True
+    return pygame.key.ScancodeWrapper(released), pygame.key.ScancodeWrapper(jumping)
@@ -0,0 +1,70 @@
+"""Checks that every gap of a course ends within the screen, wherever pairs come from."""
+from __future__ import annotations
+
+import json
+import pathlib
+
+import pytest
+import constants
+
+from entities.course import (
+    COURSE_MAGIC,
+    COURSE_VERSION,
+    HEADER,
+    RECORD,
+    Course,
+    convert_course,
+    write_course,
+)
+
+BOTTOM: int = constants.SCREEN_HEIGHT
+
+
+def test_gap_ending_at_the_bottom_is_accepted(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "course.bin"
+    assert write_course(path, [(100, 200, 300), (BOTTOM - 200, 200, 300)]) == 2
+    with Course(path) as course:
+        assert course.get_pair(1) == (BOTTOM - 200, 200, 300)
+
+
+def test_writer_rejects_gap_below_the_screen(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(ValueError, match="pair 1"):
+        write_course(tmp_path / "course.bin", [(100, 200, 300), (BOTTOM - 199, 200, 300)])
+
+
+def test_converter_rejects_gap_before_writing(tmp_path: pathlib.Path) -> None:
+    source = tmp_path / "course.json"
+    source.write_text(json.dumps([{"gap_top": BOTTOM, "gap": 1, "spacing": 300}]))
+    destination = tmp_path / "course.bin"
+    with pytest.raises(ValueError, match="pair 0"):
+        convert_course(source, destination)
+    assert not destination.exists()
+
+
+def test_reader_rejects_gap_below_the_screen(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "course.bin"
+    write_course(path, [(100, 200, 300), (100, 200, 300)])
+    # Files written elsewhere or edited by hand are not trusted either
+    with open(path, "r+b") as file:
+        file.seek(HEADER.size + RECORD.size)
+        file.write(RECORD.pack(BOTTOM, 200, 300))
+    # Before a run starts, not once it reaches the pair
+    with pytest.raises(ValueError, match="pair 1"):
+        Course(path)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        COURSE_MAGIC,
+        HEADER.pack(COURSE_MAGIC, COURSE_VERSION - 1, 0, 0),
+        HEADER.pack(COURSE_MAGIC, COURSE_VERSION, 0, 2) + RECORD.pack(100, 200, 300),
+    ],
+    ids=["empty", "short header", "old version", "truncated"],
+)
+def test_reader_rejects_malformed_file(tmp_path: pathlib.Path, content: bytes) -> None:
+    path = tmp_path / "course.bin"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        Course(path)
@@ -0,0 +1,222 @@
+"""Cross-checks `CourseValidator` against an exhaustive search of the game's physics.
+
+The search steps every half-pixel (height, velocity) state through the real `Bird`
+and tests collisions against real `PipePair` rects, as `step_playing` does. Every
+transition the validator rejects must leave no survivor.
+
+The gap policies are then checked on courses generated by `PipeManager`: at the
+game's own gap and spacing they have nothing to change, while on a tight course they
+must remove every infeasible transition that random gaps produce.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pygame
+import pytest
+import constants
+
+from entities.bird import Bird
+from entities.pipe_pair import PipePair
+from managers.course_validator import CourseValidator
+from managers.pipe_manager import PipeManager
+
+GAP: int = 120
+SPEED: int = 4
+BIRD_X: int = 70
+# First-gap heights sampled from every table row
+ROW_STEP: int = 24
+# Spacing at which random gaps of size GAP are often out of reach
+TIGHT_SPACING: int = 150
+COURSE_PAIRS: int = 60
+# Fastest fall tracked; faster states cannot stay inside a gap
+MAX_VELOCITY: float = 40.0
+
+SIZE: int = constants.BIRD_SIZE
+FLOOR: int = constants.SCREEN_HEIGHT - SIZE
+GRAVITY: float = constants.BIRD_GRAVITY
+JUMP: float = constants.BIRD_JUMP_FORCE
+
+
+@pytest.fixture(scope="module")
+def physics() -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Runs `Bird.movement` once from every state of the half-pixel grid.
+
+    Heights are indexed in half pixels and velocities in gravity steps from the jump
+    force, so the jump state of any height has velocity index 0.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Height index, velocity
+        index and rect top after the move, and whether the state stays on the grid.
+    """
+    heights = 2 * FLOOR + 1
+    velocities = int((MAX_VELOCITY - JUMP) / GRAVITY) + 1
+    bird = Bird(BIRD_X, 0, pygame.Surface((SIZE, SIZE)))
+    next_height = np.empty((heights, velocities), dtype=np.int64)
+    next_velocity = np.empty((heights, velocities), dtype=np.int64)
+    rect_top = np.empty((heights, velocities), dtype=np.int64)
+    for height in range(heights):
+        for velocity in range(velocities):
+            bird.set_state((BIRD_X, height / 2, JUMP + GRAVITY * velocity))
+            bird.movement()
+            _, y, speed = bird.get_state()
+            next_height[height, velocity] = round(2 * y)
+            next_velocity[height, velocity] = round((speed - JUMP) / GRAVITY)
+            rect_top[height, velocity] = bird.rect.y
+    on_grid = next_velocity < velocities
+    next_velocity[~on_grid] = 0
+    return next_height, next_velocity, rect_top, on_grid
+
+
+def clear_heights(top_a: int, top_b: int, spacing: int) -> list[np.ndarray]:
+    """Scrolls two pipe pairs past the bird and lists the rect tops clear of both.
+
+    Pipe A starts where it first overlaps the bird, at a multiple of the speed as
+    spawned pipes are.
+
+    Args:
+        top_a (int): Top edge of the first gap.
+        top_b (int): Top edge of the second gap.
+        spacing (int): Distance between the pairs.
+
+    Returns:
+        list[np.ndarray]: Per frame from the second on, whether each rect top from 0
+        to the floor collides with neither pair.
+    """
+    first_x = BIRD_X + SIZE - SPEED
+    pair_a = PipePair(first_x + SPEED, 80, GAP, SPEED, top_pipe_height=top_a)
+    pair_b = PipePair(first_x + SPEED + spacing, 80, GAP, SPEED, top_pipe_height=top_b)
+    pair_a.update()
+    pair_b.update()
+    frames = []
+    while pair_b.top_pipe.rect.right > BIRD_X:
+        pair_a.update()
+        pair_b.update()
+        rects = [
+            pair_a.top_pipe.rect,
+            pair_a.bottom_pipe.rect,
+            pair_b.top_pipe.rect,
+            pair_b.bottom_pipe.rect,
+        ]
+        frames.append(
+            np.array(
+                [
+                    pygame.Rect(BIRD_X, top, SIZE, SIZE).collidelist(rects) < 0
+                    for top in range(FLOOR + 1)
+                ]
+            )
+        )
+    return frames
+
+
+def passable(
+    physics: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    validator_velocities: int,
+    top_a: int,
+    top_b: int,
+    spacing: int,
+) -> bool:
+    """Searches every input sequence from every state inside gap A.
+
+    Args:
+        physics (tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]): The grid
+            transitions of the `physics` fixture.
+        validator_velocities (int): Velocities the validator starts from.
+        top_a (int): Top edge of the first gap.
+        top_b (int): Top edge of the second gap.
+        spacing (int): Distance between the pairs.
+
+    Returns:
+        bool: True if some state flies through both pairs.
+    """
+    next_height, next_velocity, rect_top, on_grid = physics
+    alive = np.zeros(next_height.shape, dtype=bool)
+    # Every height whose rect lies inside gap A, at any velocity the validator tracks
+    first = max(2 * top_a - 1, 0)
+    alive[first : 2 * (top_a + GAP - SIZE) + 1, :validator_velocities] = True
+    for clear in clear_heights(top_a, top_b, spacing):
+        survivors = alive & on_grid
+        survivors[survivors] = clear[rect_top[survivors]]
+        alive = np.zeros_like(alive)
+        alive[next_height[survivors], next_velocity[survivors]] = True
+        alive[next_height[survivors], 0] = True
+        if not alive.any():
+            return False
+    return True
+
+
+@pytest.mark.parametrize("spacing", [146, 150, 151])
+def test_rejected_transitions_are_impassable(
+    physics: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray], spacing: int
+) -> None:
+    """Every rejected transition next to an accepted one leaves no survivor."""
+    validator = CourseValidator(gap=GAP, spacing=spacing, speed=SPEED)
+    table = validator.transition_table()
+    validator_velocities = int(
+        (np.sqrt(2 * GRAVITY * constants.SCREEN_HEIGHT) - JUMP) / GRAVITY
+    ) + 2
+
+    checked = []
+    for top_a in range(0, len(table), ROW_STEP):
+        row = table[top_a]
+        for top_b in np.flatnonzero(~row):
+            # Boundary transitions are where an off-by-one would show
+            if row[max(top_b - 2, 0) : top_b + 3].any():
+                checked.append((top_a, int(top_b)))
+    assert checked
+
+    wrong = [
+        (top_a, top_b)
+        for top_a, top_b in checked
+        if passable(physics, validator_velocities, top_a, top_b, spacing)
+    ]
+    assert not wrong, f"rejected but passable: {wrong}"
+
+
+def generate(gap: int, spacing: int, validator: CourseValidator | None) -> list[int]:
+    """Scrolls a seeded course until `COURSE_PAIRS` pairs have spawned.
+
+    Args:
+        gap (int): Gap size of every pair.
+        spacing (int): Distance between consecutive pairs.
+        validator (CourseValidator | None): Gap policy, or None for random gaps.
+
+    Returns:
+        list[int]: Top edge of each pair's gap, in course order.
+    """
+    pipe_manager = PipeManager(
+        gap=gap,
+        pipe_width=80,
+        speed=SPEED,
+        spawn_distance=spacing,
+        seed=0,
+        validator=validator,
+    )
+    tops: dict[int, int] = {}
+    while len(tops) < COURSE_PAIRS:
+        for pair in pipe_manager.pipe_pairs:
+            tops.setdefault(pair.index, pair.top_pipe_height)
+        pipe_manager.update()
+    return [tops[index] for index in range(COURSE_PAIRS)]
+
+
+def test_default_course_needs_no_policy() -> None:
+    """At the game's gap and spacing, every gap drawn is reachable from every other."""
+    table = CourseValidator(gap=200, spacing=300, speed=SPEED).transition_table()
+    low = constants.PIPE_HEIGHT
+    high = constants.SCREEN_HEIGHT - 200 - constants.PIPE_HEIGHT
+    assert table[low : high + 1, low : high + 1].all()
+
+
+@pytest.mark.parametrize("mode", ["reject", "repair"])
+def test_policy_makes_tight_course_feasible(mode: str) -> None:
+    """Random gaps on a tight course include unreachable ones; the policy removes them."""
+    checker = CourseValidator(gap=GAP, spacing=TIGHT_SPACING, speed=SPEED)
+    policy = CourseValidator(gap=GAP, spacing=TIGHT_SPACING, speed=SPEED, mode=mode)
+    random_tops = generate(GAP, TIGHT_SPACING, None)
+    tops = generate(GAP, TIGHT_SPACING, policy)
+    assert len(checker.find_infeasible(random_tops)) > 0
+    assert len(checker.find_infeasible(tops)) == 0
+    # Until its first unreachable gap, the course is drawn exactly as without a policy
+    first = int(checker.find_infeasible(random_tops)[0])
+    assert tops[: first + 1] == random_tops[: first + 1]
+    assert tops[first + 1] != random_tops[first + 1]
@@ -0,0 +1,145 @@
+"""Cross-checks fixed-point physics against the float path.
+
+Flies the same seeded courses with the same random jump inputs twice, once with
+float physics and once in fixed point, and compares them after every frame: the
+bird's rect, position and velocity, every pipe's rect, the score and the crash. The
+same inputs are then replayed through `simulate_trajectories` in both modes and the
+ghost rows compared.
+
+With the shipped constants every float value the game produces is a multiple of a
+small power of two, so both paths must agree exactly.
+"""
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pygame
+import pytest
+import constants
+
+from entities.bird import Bird
+from managers.game_manager import reset_game, step_playing
+from managers.ghost_manager import simulate_trajectories
+from managers.pipe_manager import PipeManager
+from managers.score_manager import ScoreManager
+
+RUNS: int = 200
+FRAMES: int = 3000
+
+Snapshot = tuple[object, ...]
+
+
+def snapshot(
+    bird: Bird, pipe_manager: PipeManager, score_manager: ScoreManager
+) -> Snapshot:
+    """Captures everything the two physics modes must agree on.
+
+    Args:
+        bird (Bird): The bird.
+        pipe_manager (PipeManager): The pipes.
+        score_manager (ScoreManager): The score.
+
+    Returns:
+        Snapshot: Comparable state in pixels and logical units.
+    """
+    return (
+        tuple(bird.rect),
+        bird.y,
+        bird.velocity,
+        tuple(
+            (tuple(pair.top_pipe.rect), tuple(pair.bottom_pipe.rect), pair.x)
+            for pair in pipe_manager.pipe_pairs
+        ),
+        score_manager.score,
+    )
+
+
+def fly(run: int, fixed_point: bool) -> tuple[list[Snapshot], list[int]]:
+    """Flies one run with random jumps, or with an autopilot for odd seeds.
+
+    The autopilot flaps when the bird sinks below the middle of the next gap, with some
+    random flaps mixed in, so its runs last long and pass many pipes.
+
+    Args:
+        run (int): Seed of the course and the inputs.
+        fixed_point (bool): Whether to use fixed-point physics.
+
+    Returns:
+        tuple[list[Snapshot], list[int]]: The snapshot and crash flag after every
+        frame, and the frames (counted from 1) on which the bird jumped.
+    """
+    surface = pygame.Surface((constants.BIRD_SIZE, constants.BIRD_SIZE))
+    bird = Bird(70, 90, surface, fixed_point)
+    pipe_manager = PipeManager(
+        gap=200,
+        pipe_width=80,
+        speed=4,
+        spawn_distance=300,
+        seed=run,
+        fixed_point=fixed_point,
+    )
+    score_manager = ScoreManager()
+    reset_game(bird, pipe_manager, score_manager)
+
+    inputs = random.Random(run)
+    jump_rate = inputs.uniform(0.002, 0.2) if run % 2 else inputs.uniform(0.02, 0.2)
+    last_pipe_passed = -1
+    snapshots = []
+    jump_frames = []
+    for frame in range(1, FRAMES + 1):
+        jump = inputs.random() < jump_rate
+        if run % 2:
+            next_pair = next(
+                pair for pair in pipe_manager.pipe_pairs if pair.x + 80 >= bird.x
+            )
+            jump = jump or (bird.y > next_pair.top_pipe_height + 110 and bird.velocity > 0)
+        if jump:
+            jump_frames.append(frame)
+        last_pipe_passed, crashed = step_playing(
+            bird, pipe_manager, score_manager, jump, last_pipe_passed
+        )
+        snapshots.append(snapshot(bird, pipe_manager, score_manager) + (crashed,))
+        if crashed:
+            break
+    return snapshots, jump_frames
+
+
+@pytest.fixture(scope="module")
+def flights() -> list[tuple[list[Snapshot], list[Snapshot], list[int]]]:
+    """Flies every run in both modes.
+
+    Returns:
+        list[tuple[list[Snapshot], list[Snapshot], list[int]]]: Float and fixed-point
+        snapshots and the jump frames of every run.
+    """
+    flown = []
+    for run in range(RUNS):
+        float_snapshots, jump_frames = fly(run, False)
+        fixed_snapshots, _ = fly(run, True)
+        flown.append((float_snapshots, fixed_snapshots, jump_frames))
+    return flown
+
+
+def test_runs_match(
+    flights: list[tuple[list[Snapshot], list[Snapshot], list[int]]]
+) -> None:
+    for run, (expected, actual, _) in enumerate(flights):
+        for frame, (float_state, fixed_state) in enumerate(zip(expected, actual), 1):
+            assert float_state == fixed_state, f"run {run} diverges at frame {frame}"
+        assert len(expected) == len(actual), f"run {run} crashes at another frame"
+    # Odd seeds fly the autopilot, whose runs must score to cover pipe passing
+    assert max(flight[0][-1][-2] for flight in flights) > 0
+
+
+def test_ghost_trajectories_match(
+    flights: list[tuple[list[Snapshot], list[Snapshot], list[int]]]
+) -> None:
+    runs = [
+        (np.array(jump_frames, dtype=np.int64), len(float_snapshots))
+        for float_snapshots, _, jump_frames in flights
+    ]
+    float_rows = simulate_trajectories(runs)
+    fixed_rows = simulate_trajectories(runs, fixed_point=True)
+    for run, (expected, actual) in enumerate(zip(float_rows, fixed_rows)):
+        assert np.array_equal(expected, actual), f"ghost of run {run} diverges"
@@ -0,0 +1,139 @@
+"""Checks that steady-state PLAYING frames do not allocate.
+
+Flies a seeded run through the game's `PlayingState` with a simple autopilot and
+traces every frame with `FrameProfiler`:
+
+* update (`step_playing` and scrolling the background): no transient or retained
+  allocation at all;
+* render: nothing retained, and no more transient memory than a single pygame drawing
+  call needs for the Rect it returns, except on frames whose score changed: they
+  render the new label, which outlives the frame.
+
+Frames that spawn a pipe pair are exempt: they draw random numbers and a new index, and
+the first few create the pairs that later spawns reuse.
+
+The Rect a drawing call returns outweighs a small object such as a freshly rendered
+label, so the score label is also checked on its own: drawing it may cost no more than
+the blit that puts it on screen.
+"""
+from __future__ import annotations
+
+import pygame
+import pytest
+import constants
+import main
+
+from entities.bird import Bird
+from managers.game_states import GameState, Scene, create_bird_surface, create_screens
+from managers.menu_manager import draw_score
+from managers.pipe_manager import PipeManager
+from managers.quality_governor import QualityGovernor
+from managers.render_manager import FrameBuffer
+from managers.score_manager import ScoreManager
+from utils.scaling import scale_point
+
+FRAMES: int = 1200
+WARMUP_FRAMES: int = 10
+
+
+def fly(
+    frame_buffer: FrameBuffer,
+    score_manager: ScoreManager,
+    keys: tuple[pygame.key.ScancodeWrapper, pygame.key.ScancodeWrapper],
+) -> list[str]:
+    """Flies a run with the autopilot and describes the steady-state frames that allocated.
+
+    Tracing starts once the run is set up, as `--trace-allocations` starts it before
+    the game loop.
+
+    Args:
+        frame_buffer (FrameBuffer): The framebuffer frames are drawn into.
+        score_manager (ScoreManager): Score of the run.
+        keys (tuple[pygame.key.ScancodeWrapper, pygame.key.ScancodeWrapper]): Keyboard
+            states without and with the jump key held.
+
+    Returns:
+        list[str]: One line per offending frame, or for the crash ending the run early.
+    """
+    bird_surface = create_bird_surface(constants.GREEN)
+    bird = Bird(70, 90, bird_surface)
+    pipe_manager = PipeManager(gap=200, pipe_width=80, speed=4, spawn_distance=300, seed=0)
+    scene = Scene(frame_buffer, bird, bird_surface, pipe_manager, QualityGovernor())
+    playing = create_screens(scene, score_manager)[GameState.PLAYING]
+    playing.enter(None)
+
+    profiler = main._start_frame_profiler(frame_buffer, verbose=False)
+    render_budget = profiler.get_budget("render")
+    offending = []
+    try:
+        for frame in range(FRAMES):
+            # Autopilot: flap whenever the bird sinks below the middle of the next gap
+            next_pair = next(
+                pair for pair in pipe_manager.pipe_pairs if pair.x + 80 >= bird.x
+            )
+            jump = bird.y > next_pair.top_pipe_height + 110 and bird.velocity > 0
+            playing.handle_input([], keys[jump])
+            last_index = pipe_manager.pipe_pairs[-1].index
+            score = score_manager.score
+
+            profiler.begin_frame()
+            profiler.begin_phase("update")
+            crashed = playing.update() is not None
+            profiler.begin_phase("render")
+            playing.render()
+            profiler.end_frame()
+
+            if crashed:
+                offending.append(f"autopilot crashed at frame {frame}")
+                break
+            if frame < WARMUP_FRAMES or pipe_manager.pipe_pairs[-1].index != last_index:
+                continue
+
+            update_transient, update_retained = profiler.last_frame["update"]
+            render_transient, render_retained = profiler.last_frame["render"]
+            rescored = score_manager.score != score
+            if (
+                update_transient
+                or update_retained > 0
+                or (
+                    not rescored
+                    and (render_retained > 0 or render_transient > render_budget)
+                )
+            ):
+                offending.append(f"frame {frame}: {profiler.describe_frame()}")
+    finally:
+        profiler.stop()
+    return offending
+
+
+@pytest.mark.parametrize("quality", list(constants.QUALITY_PROFILES))
+def test_playing_frames_do_not_allocate(
+    window: pygame.Surface,
+    keys: tuple[pygame.key.ScancodeWrapper, pygame.key.ScancodeWrapper],
+    quality: str,
+) -> None:
+    score_manager = ScoreManager()
+    assert fly(FrameBuffer.from_quality(window, quality), score_manager, keys) == []
+    # Passed pipes exercise scoring and the score label's redraws
+    assert score_manager.score > 0
+
+
+def test_score_label_costs_no_more_than_its_blit(window: pygame.Surface) -> None:
+    frame_buffer = FrameBuffer.from_quality(window, constants.DEFAULT_QUALITY)
+    score_manager = ScoreManager()
+    # The label is rendered once; later draws only blit it
+    draw_score(frame_buffer.surface, score_manager)
+
+    profiler = main._start_frame_profiler(frame_buffer, verbose=False)
+    try:
+        label = pygame.Surface((1, 1))
+        scale = frame_buffer.scale
+        blit_cost = profiler.measure(
+            lambda: frame_buffer.surface.blit(label, scale_point((20, 20), scale))
+        )
+        score_cost = profiler.measure(
+            lambda: draw_score(frame_buffer.surface, score_manager)
+        )
+    finally:
+        profiler.stop()
+    assert score_cost <= blit_cost
@@ -0,0 +1,126 @@
+"""Checks the game's transition table and the state machine that follows it."""
+from __future__ import annotations
+
+import pygame
+import pytest
+import constants
+
+from entities.bird import Bird
+from managers.game_states import (
+    TRANSITIONS,
+    GameState,
+    Scene,
+    create_bird_surface,
+    create_screens,
+)
+from managers.pipe_manager import PipeManager
+from managers.quality_governor import QualityGovernor
+from managers.render_manager import FrameBuffer
+from managers.score_manager import ScoreManager
+from managers.state_machine import State, StateMachine
+
+NAMES: list[str] = [
+    GameState.MENU,
+    GameState.PLAYING,
+    GameState.GAME_OVER,
+    GameState.CONFIRM_EXIT_MENU,
+    GameState.CONFIRM_EXIT_GAME_OVER,
+]
+# Frames a run may last when nobody flaps
+MAX_FALL_FRAMES: int = 600
+
+
+class Scripted(State):
+    """A state whose update answers with a preset action."""
+
+    def __init__(self: Scripted, name: str, action: str | None = None) -> None:
+        """Create the state.
+
+        Args:
+            name (str): Name of the state.
+            action (str | None, optional): Action returned by every update. Defaults
+                to None.
+        """
+        super().__init__(name)
+        self.action = action
+
+    def update(self: Scripted) -> str | None:
+        """Answer with the preset action."""
+        return self.action
+
+
+def key(code: int) -> list[pygame.event.Event]:
+    """Builds the events of a frame in which one key is pressed.
+
+    Args:
+        code (int): The key pressed.
+
+    Returns:
+        list[pygame.event.Event]: A single key press.
+    """
+    return [pygame.event.Event(pygame.KEYDOWN, key=code)]
+
+
+def test_every_screen_has_a_row() -> None:
+    assert {source for source, _ in TRANSITIONS} == set(NAMES)
+    assert {target for target in TRANSITIONS.values() if target is not None} <= set(NAMES)
+
+
+def test_illegal_action_is_rejected() -> None:
+    states = {name: Scripted(name) for name in NAMES}
+    machine = StateMachine(list(states.values()), TRANSITIONS, GameState.MENU)
+    machine.start()
+    # The menu has no run to crash
+    states[GameState.MENU].action = "crash"
+    with pytest.raises(ValueError, match="no transition for 'crash'"):
+        machine.frame([], pygame.key.ScancodeWrapper([False] * 512))
+    assert machine.state == GameState.MENU
+
+
+def test_unknown_target_is_rejected() -> None:
+    transitions = {**TRANSITIONS, (GameState.GAME_OVER, "menu"): "title"}
+    states = [Scripted(name) for name in NAMES]
+    with pytest.raises(ValueError, match="unknown state"):
+        StateMachine(states, transitions, GameState.MENU)
+
+
+def test_screens_follow_the_table(
+    window: pygame.Surface,
+    keys: tuple[pygame.key.ScancodeWrapper, pygame.key.ScancodeWrapper],
+) -> None:
+    frame_buffer = FrameBuffer.from_quality(window, constants.DEFAULT_QUALITY)
+    bird_surface = create_bird_surface(constants.GREEN)
+    bird = Bird(70, 90, bird_surface)
+    pipe_manager = PipeManager(gap=200, pipe_width=80, speed=4, spawn_distance=300, seed=0)
+    scene = Scene(frame_buffer, bird, bird_surface, pipe_manager, QualityGovernor())
+    screens = create_screens(scene, ScoreManager())
+    machine = StateMachine(list(screens.values()), TRANSITIONS, GameState.MENU)
+    released = keys[False]
+
+    def crash() -> None:
+        # Nobody flaps, so the bird falls until it hits the ground
+        for _ in range(MAX_FALL_FRAMES):
+            machine.frame([], released)
+            if machine.state != GameState.PLAYING:
+                return
+
+    machine.start()
+    for events, expected in [
+        (key(pygame.K_ESCAPE), GameState.CONFIRM_EXIT_MENU),
+        (key(pygame.K_n), GameState.MENU),
+        (key(pygame.K_RETURN), GameState.PLAYING),
+        (None, GameState.GAME_OVER),
+        (key(pygame.K_ESCAPE), GameState.CONFIRM_EXIT_GAME_OVER),
+        (key(pygame.K_n), GameState.GAME_OVER),
+        (key(pygame.K_r), GameState.PLAYING),
+        (None, GameState.GAME_OVER),
+        (key(pygame.K_ESCAPE), GameState.CONFIRM_EXIT_GAME_OVER),
+    ]:
+        if events is None:
+            crash()
+        else:
+            machine.frame(events, released)
+        assert machine.state == expected
+
+    machine.frame(key(pygame.K_y), released)
+    assert not machine.running
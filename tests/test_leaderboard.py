@@ -0,0 +1,94 @@
+"""Checks the leaderboard's boards, its persistence and its schema migration."""
+from __future__ import annotations
+
+import pathlib
+import sqlite3
+
+from managers.leaderboard_manager import (
+    LEADERBOARD_MIGRATIONS,
+    LEADERBOARD_SCHEMA,
+    LeaderboardManager,
+)
+
+
+def reload(
+    path: str, boards: list[tuple[str, int | None, str | None]]
+) -> LeaderboardManager:
+    """Opens a database again and reads some of its boards.
+
+    Args:
+        path (str): The score database.
+        boards (list[tuple[str, int | None, str | None]]): Profile, seed and course of
+            each board to read.
+
+    Returns:
+        LeaderboardManager: The closed manager, its cache holding the boards read.
+    """
+    leaderboard = LeaderboardManager(path, size=3)
+    for profile, seed, course in boards:
+        leaderboard.load(profile, seed, course)
+    # Closing waits for the reads queued before it
+    leaderboard.close()
+    return leaderboard
+
+
+def test_boards_are_kept_apart(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "scores.db")
+    leaderboard = LeaderboardManager(path, size=3)
+    for score in (4, 9, 1, 7):
+        leaderboard.submit("ada", 1, score)
+    leaderboard.submit("ada", 2, 5)
+    leaderboard.submit("ada", None, 6)
+    leaderboard.submit("ada", None, 8, "courses/spiral.bin")
+    leaderboard.submit("bob", 1, 3)
+    assert leaderboard.top_scores("ada", 1) == [9, 7, 4]
+    leaderboard.close()
+
+    boards = [
+        ("ada", 1, None),
+        ("ada", 2, None),
+        ("ada", None, None),
+        ("ada", None, "courses/spiral.bin"),
+        ("bob", 1, None),
+        ("bob", 2, None),
+    ]
+    reloaded = reload(path, boards)
+    assert [reloaded.top_scores(*board) for board in boards] == [
+        [9, 7, 4],
+        [5],
+        [6],
+        [8],
+        [3],
+        [],
+    ]
+    assert reloaded.high_score("ada", None, "courses/spiral.bin") == 8
+    assert reloaded.high_score("bob", 2) == 0
+
+
+def test_first_release_database_is_migrated(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "scores.db")
+    # A database written before authored courses had boards of their own
+    with sqlite3.connect(path) as connection:
+        connection.executescript(LEADERBOARD_SCHEMA)
+        connection.executemany(
+            "INSERT INTO scores VALUES (?, ?, ?, ?)",
+            [("ada", 1, 12, 0.0), ("ada", None, 3, 0.0)],
+        )
+    connection.close()
+
+    leaderboard = LeaderboardManager(path, size=3)
+    leaderboard.submit("ada", 1, 5, "courses/spiral.bin")
+    leaderboard.close()
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("PRAGMA user_version").fetchone() == (
+            len(LEADERBOARD_MIGRATIONS),
+        )
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(scores)")]
+    connection.close()
+    assert columns[-1] == "course"
+
+    # Old scores stay on the generated-course boards; a second open migrates nothing
+    boards = [("ada", 1, None), ("ada", None, None), ("ada", 1, "courses/spiral.bin")]
+    reloaded = reload(path, boards)
+    assert [reloaded.top_scores(*board) for board in boards] == [[12], [3], [5]]
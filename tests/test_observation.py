@@ -0,0 +1,157 @@
+"""Checks `Observer` as a bot would use it every tick.
+
+Flies a seeded run with an autopilot that decides from observations alone, and for
+every frame:
+
+* traces `Observer.observe` with `FrameProfiler`: it must allocate nothing, without
+  rays and with a fan of rays;
+* compares every ray distance with a reference that intersects the ray with each pipe
+  edge in plain Python.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pygame
+import pytest
+import constants
+
+from entities.bird import Bird
+from managers.frame_profiler import FrameProfiler
+from managers.game_manager import reset_game, step_playing
+from managers.observation_manager import FEATURE_NAMES, Observer
+from managers.pipe_manager import PipeManager
+from managers.score_manager import ScoreManager
+
+FRAMES: int = 1200
+RAYS: int = 16
+# Distances are stored as float32, good to about this much at a screen's length
+TOLERANCE: float = 1e-3
+WARMUP_FRAMES: int = 10
+
+
+def trace(
+    bird: Bird, pipe_manager: PipeManager, angle: float, length: float
+) -> float:
+    """Finds where a ray first meets a pipe, the ceiling or the floor, edge by edge.
+
+    A plain-Python reference for the slab method: the ray is intersected with every
+    edge of every pipe separately and the nearest crossing wins.
+
+    Args:
+        bird (Bird): The bird the ray starts from, at its center.
+        pipe_manager (PipeManager): The pipes.
+        angle (float): Direction of the ray in radians, 0 pointing forward.
+        length (float): Longest distance reported.
+
+    Returns:
+        float: The distance to the nearest hit, or `length` if nothing is that close.
+    """
+    x0 = bird.x + bird.rect.width / 2
+    y0 = bird.y + bird.rect.height / 2
+    dx = math.cos(angle)
+    dy = math.sin(angle)
+    hits = [length]
+    if dy < -1e-9:
+        hits.append(-y0 / dy)
+    elif dy > 1e-9:
+        hits.append((constants.SCREEN_HEIGHT - y0) / dy)
+
+    for pair in pipe_manager.pipe_pairs:
+        left = pair.x
+        right = pair.x + pair.top_pipe.rect.width
+        for top, bottom in ((-math.inf, pair.top_pipe_height), (pair.gap_bottom, math.inf)):
+            if left <= x0 <= right and top <= y0 <= bottom:
+                return 0.0
+            if abs(dx) > 1e-9:
+                for edge in (left, right):
+                    t = (edge - x0) / dx
+                    if t >= 0 and top <= y0 + t * dy <= bottom:
+                        hits.append(t)
+            if abs(dy) > 1e-9:
+                for edge in (top, bottom):
+                    if math.isfinite(edge):
+                        t = (edge - y0) / dy
+                        if t >= 0 and left <= x0 + t * dx <= right:
+                            hits.append(t)
+    return min(hits)
+
+
+@pytest.fixture(scope="module")
+def flight() -> tuple[list[str], list[str], int]:
+    """Flies a run, tracing and cross-checking every observation.
+
+    Returns:
+        tuple[list[str], list[str], int]: One line per frame whose observations
+        allocated, one line per ray that disagrees with `trace` or for the crash
+        ending the run early, and the score.
+    """
+    surface = pygame.Surface((constants.BIRD_SIZE, constants.BIRD_SIZE))
+    bird = Bird(70, 90, surface)
+    pipe_manager = PipeManager(gap=200, pipe_width=80, speed=4, spawn_distance=300, seed=0)
+    score_manager = ScoreManager()
+    reset_game(bird, pipe_manager, score_manager)
+
+    plain = Observer(bird, pipe_manager)
+    casting = Observer(bird, pipe_manager, rays=RAYS)
+    plain_buffer = plain.create_buffer()
+    casting_buffer = casting.create_buffer()
+    angles = np.radians(np.linspace(-60.0, 60.0, RAYS)).tolist()
+    bird_y = FEATURE_NAMES.index("bird_y")
+    gap_top = FEATURE_NAMES.index("gap_top")
+    velocity = FEATURE_NAMES.index("bird_velocity")
+
+    allocating = []
+    mismatches = []
+    profiler = FrameProfiler(verbose=False)
+    profiler.start()
+    try:
+        last_pipe_passed = -1
+        for frame in range(FRAMES):
+            profiler.begin_frame()
+            profiler.begin_phase("plain")
+            plain.observe(plain_buffer)
+            profiler.begin_phase("rays")
+            casting.observe(casting_buffer)
+            profiler.end_frame()
+            if frame >= WARMUP_FRAMES and any(
+                transient or retained
+                for transient, retained in profiler.last_frame.values()
+            ):
+                allocating.append(f"frame {frame}: {profiler.describe_frame()}")
+
+            for ray, angle in enumerate(angles):
+                expected = trace(bird, pipe_manager, angle, constants.SCREEN_WIDTH / 2)
+                actual = float(casting_buffer[len(FEATURE_NAMES) + ray])
+                if abs(actual - expected) > TOLERANCE:
+                    mismatches.append(
+                        f"frame {frame}, ray {ray}: cast {actual:.3f}, traced {expected:.3f}"
+                    )
+
+            # Autopilot on observations only: flap below the middle of the next gap
+            jump = bool(
+                plain_buffer[bird_y] > plain_buffer[gap_top] + 110
+                and plain_buffer[velocity] > 0
+            )
+            last_pipe_passed, crashed = step_playing(
+                bird, pipe_manager, score_manager, jump, last_pipe_passed
+            )
+            if crashed:
+                mismatches.append(f"autopilot crashed at frame {frame}")
+                break
+    finally:
+        profiler.stop()
+    return allocating, mismatches, score_manager.score
+
+
+def test_observations_do_not_allocate(flight: tuple[list[str], list[str], int]) -> None:
+    allocating, _, _ = flight
+    assert allocating == []
+
+
+def test_rays_match_the_reference(flight: tuple[list[str], list[str], int]) -> None:
+    _, mismatches, score = flight
+    assert mismatches == []
+    # Passed pipes put rays through gaps and against both pipes of a pair
+    assert score > 0
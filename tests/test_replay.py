@@ -0,0 +1,89 @@
+"""Checks that a recorded run plays back, and renders, exactly as it was flown.
+
+A run is flown through the game's own `PlayingState` with a `ReplayRecorder` and a
+`ReplayWriter`, steered by an autopilot until it scores and then left to fall. The
+saved replay must resimulate to the state the run ended in, and the renderer's last
+frame must match the game over screen the game drew.
+"""
+from __future__ import annotations
+
+import pathlib
+import queue
+import random
+
+import pygame
+import pytest
+import constants
+
+from entities.bird import Bird
+from managers.game_states import (
+    GameOverState,
+    GameState,
+    PlayingState,
+    Scene,
+    create_bird_surface,
+)
+from managers.pipe_manager import PipeManager
+from managers.quality_governor import QualityGovernor
+from managers.render_manager import FrameBuffer
+from managers.replay_manager import ReplayPlayer, ReplayRecorder, ReplayWriter, load_replay
+from managers.replay_renderer import _render_slice
+from managers.score_manager import ScoreManager
+
+# Frames the autopilot flies before it lets the bird fall
+AUTOPILOT_FRAMES: int = 600
+MAX_FRAMES: int = 1000
+
+
+def test_replay_plays_back_and_renders_the_run(
+    window: pygame.Surface,
+    keys: tuple[pygame.key.ScancodeWrapper, pygame.key.ScancodeWrapper],
+    tmp_path: pathlib.Path,
+) -> None:
+    frame_buffer = FrameBuffer.from_quality(window, constants.DEFAULT_QUALITY)
+    bird_surface = create_bird_surface(constants.GREEN)
+    bird = Bird(70, 90, bird_surface)
+    pipe_manager = PipeManager(gap=200, pipe_width=80, speed=4, spawn_distance=300, seed=0)
+    score_manager = ScoreManager()
+    scene = Scene(frame_buffer, bird, bird_surface, pipe_manager, QualityGovernor())
+    path = str(tmp_path / "run.json")
+    writer = ReplayWriter(path)
+    playing = PlayingState(scene, score_manager, None, ReplayRecorder(), writer)
+
+    inputs = random.Random(0)
+    playing.enter(None)
+    for frame in range(MAX_FRAMES):
+        next_pair = next(pair for pair in pipe_manager.pipe_pairs if pair.x + 80 >= bird.x)
+        jump = frame < AUTOPILOT_FRAMES and (
+            (bird.y > next_pair.top_pipe_height + 110 and bird.velocity > 0)
+            or inputs.random() < 0.01
+        )
+        playing.handle_input([], keys[jump])
+        if playing.update() == "crash":
+            break
+    else:
+        pytest.fail("the run never ended")
+    writer.close()
+    assert score_manager.score > 0
+
+    replay = load_replay(path)
+    player = ReplayPlayer(replay, bird_surface)
+    player.seek(replay.frames)
+    assert player.finished
+    assert player.bird.get_state() == bird.get_state()
+    assert player.pipe_manager.get_state() == pipe_manager.get_state()
+    assert player.score_manager.get_state() == score_manager.get_state()
+    player.close()
+
+    game_over = GameOverState(scene, score_manager)
+    game_over.enter(GameState.PLAYING)
+    game_over.draw(frame_buffer.surface)
+    frame_buffer.present()
+    expected = pygame.image.tobytes(window, "RGB")
+
+    frames: queue.Queue = queue.Queue()
+    _render_slice(
+        path, replay.frames, replay.frames + 1, constants.DEFAULT_QUALITY, "raw", frames
+    )
+    assert frames.get_nowait() == (replay.frames, expected)
+    assert frames.get_nowait() is None
@@ -0,0 +1,138 @@
+"""Races two rollback sessions against each other over a lossy loopback link.
+
+Both peers run their own `RaceManager` over real UDP sockets wrapped in
+`LossyTransport`, on a manual clock so the injected latency is measured in frames.
+Each player flies an autopilot with random flaps mixed in, so the remote input often
+differs from its prediction, then idles long enough for every input to arrive. Both
+peers must end on the same race state, which must also match a race stepped locally
+with the inputs both players actually gave.
+"""
+from __future__ import annotations
+
+import random
+import socket
+
+import pygame
+import constants
+
+from entities.bird import Bird
+from managers.pipe_manager import PipeManager
+from managers.race_manager import RaceManager
+from managers.rollback_manager import LossyTransport, RollbackSession, UdpTransport
+from managers.score_manager import ScoreManager
+
+FRAME_TIME: float = 1 / constants.FPS
+PLAY_FRAMES: int = 600
+# Idle frames after play; longer than any rollback, so every input is confirmed
+IDLE_FRAMES: int = 60
+LATENCY: float = 4 * FRAME_TIME
+LOSS: float = 0.2
+# Ticks allowed for both peers to finish, stalls included
+MAX_TICKS: int = 10 * (PLAY_FRAMES + IDLE_FRAMES)
+
+
+def create_race() -> tuple[RaceManager, list[Bird], PipeManager]:
+    """Creates a two-player race on the seeded course `main` races on.
+
+    Returns:
+        tuple[RaceManager, list[Bird], PipeManager]: The race, its birds, both at the
+        start, and its course.
+    """
+    surface = pygame.Surface((constants.BIRD_SIZE, constants.BIRD_SIZE))
+    birds = [Bird(70, 90, surface), Bird(70, 90, surface)]
+    pipe_manager = PipeManager(gap=200, pipe_width=80, speed=4, spawn_distance=300, seed=0)
+    race = RaceManager(birds, pipe_manager, [ScoreManager(), ScoreManager()])
+    return race, birds, pipe_manager
+
+
+def free_port() -> int:
+    """Finds a loopback UDP port that nothing is bound to.
+
+    Returns:
+        int: The port number.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def choose_jump(
+    bird: Bird, pipe_manager: PipeManager, frame: int, inputs: random.Random
+) -> bool:
+    """Flaps when the bird sinks below the middle of the next gap, plus random flaps.
+
+    Neither the player's own bird nor the course depends on predicted remote input, so
+    the choice is the same whatever the peer has received.
+
+    Args:
+        bird (Bird): The player's own bird.
+        pipe_manager (PipeManager): The peer's course.
+        frame (int): The frame the input is for.
+        inputs (random.Random): The player's source of random flaps.
+
+    Returns:
+        bool: Whether the player jumps.
+    """
+    if frame >= PLAY_FRAMES:
+        return False
+    next_pair = next(pair for pair in pipe_manager.pipe_pairs if pair.x + 80 >= bird.x)
+    sinking = bird.y > next_pair.top_pipe_height + 110 and bird.velocity > 0
+    return sinking or inputs.random() < 0.01
+
+
+def test_peers_agree_after_rollbacks() -> None:
+    ports = [free_port(), free_port()]
+    now = [0.0]
+    (race, birds, course), (peer_race, peer_birds, peer_course) = (
+        create_race(),
+        create_race(),
+    )
+    races = [race, peer_race]
+    own_birds = [birds[0], peer_birds[1]]
+    courses = [course, peer_course]
+    transports = [
+        LossyTransport(
+            UdpTransport(("127.0.0.1", ports[player]), ("127.0.0.1", ports[1 - player])),
+            latency=LATENCY,
+            loss=LOSS,
+            seed=player,
+            clock=lambda: now[0],
+        )
+        for player in range(2)
+    ]
+    sessions = [
+        RollbackSession(races[player], player, transports[player]) for player in range(2)
+    ]
+    randoms = [random.Random(player) for player in range(2)]
+    given: list[list[bool]] = [[], []]
+    total = PLAY_FRAMES + IDLE_FRAMES
+
+    try:
+        for _ in range(MAX_TICKS):
+            if all(session.frame == total for session in sessions):
+                break
+            for player, session in enumerate(sessions):
+                if session.frame == total:
+                    # Finished peers still deliver their delayed datagrams
+                    transports[player].receive()
+                    continue
+                jump = choose_jump(
+                    own_birds[player], courses[player], session.frame, randoms[player]
+                )
+                if session.advance(jump):
+                    given[player].append(jump)
+            now[0] += FRAME_TIME
+    finally:
+        for session in sessions:
+            session.close()
+
+    assert [session.frame for session in sessions] == [total, total]
+    assert max(session.rollback_frames for session in sessions) > 0
+    assert races[0].save_state() == races[1].save_state()
+
+    reference, _, _ = create_race()
+    for frame in range(total):
+        reference.step([given[0][frame], given[1][frame]])
+    assert races[0].save_state() == reference.save_state()
+    # The birds flew through pipes before crashing, so the race was not trivial
+    assert max(manager.score for manager in reference.score_managers) > 0
@@ -0,0 +1,159 @@
+"""Checks the simulation server through its client, as a trainer would drive it.
+
+A server started with `main.py --serve` must answer every reset and step, over the
+socket and through shared memory, with the observations, rewards and done flags of
+the same environments stepped in this process, and must answer a malformed request
+with an error. Binding must never replace a file or a live server's socket.
+"""
+from __future__ import annotations
+from typing import Iterator
+
+import errno
+import os
+import pathlib
+import socket
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from managers.simulation_client import SimulationClient
+from managers.simulation_protocol import KIND_ERROR, MESSAGE_HEADER, MESSAGE_MAGIC
+from managers.simulation_server import SimulationServer, VectorEnvironment
+
+ENVIRONMENTS: int = 32
+FRAMES: int = 400
+# Rate of random flaps: often enough to keep birds airborne, rarely enough to crash
+FLAP_RATE: float = 0.08
+MAIN: pathlib.Path = pathlib.Path(__file__).resolve().parent.parent / "main.py"
+
+
+def start_server(path: str) -> subprocess.Popen[bytes]:
+    """Starts a server process with shared memory and waits until it listens.
+
+    Args:
+        path (str): Path of the socket.
+
+    Returns:
+        subprocess.Popen[bytes]: The server process.
+    """
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            str(MAIN),
+            "--serve",
+            path,
+            "--envs",
+            str(ENVIRONMENTS),
+            "--seed",
+            "0",
+            "--shared-memory",
+        ],
+        cwd=MAIN.parent,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(path)
+                return server
+            except OSError:
+                time.sleep(0.05)
+    server.kill()
+    raise RuntimeError(f"the server did not start listening on {path}")
+
+
+@pytest.fixture(scope="module")
+def served(tmp_path_factory: pytest.TempPathFactory) -> Iterator[str]:
+    """Serves `ENVIRONMENTS` games seeded with 0 for the tests of this module.
+
+    Yields:
+        str: Path of the server's socket.
+    """
+    path = str(tmp_path_factory.mktemp("server") / "simulation.sock")
+    server = start_server(path)
+    yield path
+    server.terminate()
+    server.wait()
+    # A terminated server removes the socket it bound
+    assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize("shared", [False, True], ids=["socket", "shared memory"])
+def test_served_games_match_local_games(served: str, shared: bool) -> None:
+    client = SimulationClient(served, shared)
+    local = VectorEnvironment(ENVIRONMENTS, seed=0)
+    rewards = np.zeros(ENVIRONMENTS, dtype=np.float32)
+    dones = np.zeros(ENVIRONMENTS, dtype=np.uint8)
+    rng = np.random.default_rng(0)
+
+    observations = client.reset()
+    local.reset()
+    np.testing.assert_array_equal(observations, local.observations)
+
+    crashes = 0
+    for frame in range(FRAMES):
+        if frame == FRAMES // 2:
+            mask = rng.random(ENVIRONMENTS) < 0.5
+            observations = client.reset(mask)
+            local.reset(mask)
+        else:
+            actions = rng.random(ENVIRONMENTS) < FLAP_RATE
+            observations, served_rewards, served_dones = client.step(actions)
+            local.step(actions, rewards, dones)
+            np.testing.assert_array_equal(served_rewards, rewards)
+            np.testing.assert_array_equal(served_dones, dones)
+            crashes += int(dones.sum())
+        np.testing.assert_array_equal(observations, local.observations)
+    client.close()
+    # Otherwise done flags and restarts went untested
+    assert crashes > 0
+
+
+def test_unknown_request_is_answered_with_an_error(served: str) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(served)
+        connection.sendall(MESSAGE_HEADER.pack(MESSAGE_MAGIC, 7, 0, ENVIRONMENTS, 0))
+        _, kind, _, _, length = MESSAGE_HEADER.unpack(
+            connection.recv(MESSAGE_HEADER.size, socket.MSG_WAITALL)
+        )
+        message = connection.recv(length, socket.MSG_WAITALL).decode()
+    assert kind == KIND_ERROR
+    assert message == "unknown message kind 7"
+
+
+def test_live_socket_is_not_replaced(served: str) -> None:
+    server = SimulationServer(served, VectorEnvironment(1, seed=0))
+    with pytest.raises(OSError) as error:
+        server.run()
+    assert error.value.errno == errno.EADDRINUSE
+    # The socket belongs to the live server, which still answers
+    SimulationClient(served).close()
+
+
+def test_file_is_not_replaced(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "simulation.sock"
+    path.write_text("not a socket")
+    server = SimulationServer(str(path), VectorEnvironment(1, seed=0))
+    with pytest.raises(FileExistsError):
+        server.run()
+    assert path.read_text() == "not a socket"
+
+
+def test_stale_socket_is_replaced(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "simulation.sock")
+    # Left over from a server that did not exit cleanly: bound, nobody listening
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(path)
+    server = start_server(path)
+    try:
+        client = SimulationClient(path)
+        assert client.environments == ENVIRONMENTS
+        client.close()
+    finally:
+        server.terminate()
+        server.wait()
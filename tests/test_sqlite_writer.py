@@ -0,0 +1,62 @@
+"""Checks that `SQLiteWriter` commits in order and that queuing never waits."""
+from __future__ import annotations
+from typing import Any
+
+import pathlib
+import sqlite3
+import threading
+
+from managers.sqlite_writer import SQLiteWriter
+
+SCHEMA: str = "CREATE TABLE IF NOT EXISTS items (value INTEGER NOT NULL);"
+INSERT: str = "INSERT INTO items VALUES (?)"
+
+
+def test_reads_see_every_earlier_write(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "items.db")
+    writer = SQLiteWriter(path, SCHEMA, batch_size=4)
+    seen: list[list[tuple[Any, ...]]] = []
+    for value in range(10):
+        writer.submit(INSERT, [(value,)])
+    writer.query("SELECT SUM(value) FROM items", (), seen.append)
+    writer.submit(INSERT, [(100,), (200,)])
+    writer.close()
+
+    assert seen == [[(45,)]]
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM items").fetchone() == (12,)
+
+
+def test_full_queue_drops_instead_of_waiting(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "items.db")
+    writer = SQLiteWriter(path, SCHEMA, max_pending=2)
+    busy = threading.Event()
+    release = threading.Event()
+
+    def stall(rows: list[tuple[Any, ...]]) -> None:
+        busy.set()
+        release.wait(5.0)
+
+    # Hold the worker in a callback while the queue fills up behind it
+    writer.query("SELECT 1", (), stall)
+    assert busy.wait(5.0)
+    for value in range(5):
+        writer.submit(INSERT, [(value,)])
+    writer.query("SELECT 1", (), stall)
+    assert writer.dropped == 4
+
+    release.set()
+    writer.close()
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT value FROM items").fetchall() == [(0,), (1,)]
+
+
+def test_unopenable_database_drops_everything(tmp_path: pathlib.Path) -> None:
+    writer = SQLiteWriter(str(tmp_path / "missing" / "items.db"), SCHEMA)
+    writer.submit(INSERT, [(1,)])
+    writer.flush()
+    writer.close()
+    assert writer.error is not None
+    # Once the failure is known, nothing is queued at all
+    writer.submit(INSERT, [(2,)])
+    writer.flush()
@@ -0,0 +1,76 @@
+"""Checks telemetry from recording through the writer to the offline aggregates."""
+from __future__ import annotations
+
+import pathlib
+
+import numpy as np
+
+from managers.sqlite_writer import SQLiteWriter
+from managers.telemetry_manager import (
+    TELEMETRY_SCHEMA,
+    TelemetryManager,
+    death_heatmap,
+    load_runs,
+    load_top_runs,
+    score_histogram,
+)
+
+# Jump frames, frames alive, death position, pipe index and score of each run
+RUNS: list[tuple[list[int], int, tuple[float, float], int, int]] = [
+    ([2, 5], 10, (100.0, 120.0), 0, 0),
+    ([1], 20, (70.0, 560.0), 3, 2),
+    ([], 5, (70.0, 580.0), 1, 2),
+]
+
+
+def record(path: str) -> None:
+    """Records `RUNS` with buffers small enough to flush in the middle.
+
+    Args:
+        path (str): The telemetry database.
+
+    Returns:
+        None
+    """
+    telemetry = TelemetryManager(
+        SQLiteWriter(path, TELEMETRY_SCHEMA), run_capacity=2, jump_capacity=2
+    )
+    for jumps, frames, (x, y), pipe_index, score in RUNS:
+        telemetry.start_run()
+        for frame in range(1, frames + 1):
+            telemetry.record_frame(frame in jumps)
+        telemetry.record_death(x, y, pipe_index, score)
+    telemetry.close()
+
+
+def test_runs_are_stored(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "telemetry.db")
+    record(path)
+    expected = [
+        [x, y, pipe_index, frames, score] for _, frames, (x, y), pipe_index, score in RUNS
+    ]
+    assert load_runs(path).tolist() == expected
+
+
+def test_top_runs_are_ranked_with_their_jumps(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "telemetry.db")
+    record(path)
+    # Equal scores are ranked by how long the run lasted
+    top = load_top_runs(path, 2)
+    assert [(jumps.tolist(), frames) for jumps, frames in top] == [([1], 20), ([], 5)]
+
+
+def test_aggregates(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "telemetry.db")
+    record(path)
+    runs = load_runs(path)
+
+    heatmap = death_heatmap(runs, cell_size=50)
+    assert heatmap.sum() == len(RUNS)
+    assert heatmap[2, 2] == 1
+    assert heatmap[11, 1] == 2
+
+    scores, counts = score_histogram(runs)
+    assert scores.tolist() == [0, 2]
+    assert counts.tolist() == [1, 2]
+    assert score_histogram(np.zeros((0, 5)))[0].tolist() == []
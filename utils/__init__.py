@@ -0,0 +1 @@
+"""Leaf helpers shared by entities and managers; they depend only on constants."""
@@ -0,0 +1,72 @@
+"""Conversions from logical units to the pixels of a scaled surface.
+
+The game is laid out in logical units (`constants.SCREEN_WIDTH` x `SCREEN_HEIGHT`);
+a surface of another width, such as a lower quality framebuffer, is drawn on at a
+proportional scale.
+"""
+from __future__ import annotations
+
+import pygame
+import constants
+
+
+def get_scale(surface: pygame.Surface) -> float:
+    """Gets the number of surface pixels per logical unit.
+
+    Args:
+        surface (pygame.Surface): The surface being drawn on.
+
+    Returns:
+        float: The scale factor, 1.0 when the surface has the logical size.
+    """
+    return surface.get_width() / constants.SCREEN_WIDTH
+
+
+def to_pixels(value: float, scale: float) -> int:
+    """Converts a logical length or coordinate to pixels.
+
+    Args:
+        value (float): The logical value.
+        scale (float): Pixels per logical unit.
+
+    Returns:
+        int: The value in pixels, at least 1 for positive lengths.
+    """
+    pixels = round(value * scale)
+    return pixels if pixels or value <= 0 else 1
+
+
+def scale_point(point: tuple[float, float], scale: float) -> tuple[int, int]:
+    """Converts a logical point to pixels.
+
+    Args:
+        point (tuple[float, float]): The logical x and y.
+        scale (float): Pixels per logical unit.
+
+    Returns:
+        tuple[int, int]: The point in pixels.
+    """
+    return round(point[0] * scale), round(point[1] * scale)
+
+
+def scale_rect(
+    rect: pygame.Rect | tuple[float, float, float, float], scale: float
+) -> pygame.Rect:
+    """Converts a logical rectangle to pixels.
+
+    The edges are rounded rather than the size, so rectangles that touch in logical
+    units still touch after scaling.
+
+    Args:
+        rect (pygame.Rect | tuple[float, float, float, float]): The logical rectangle.
+        scale (float): Pixels per logical unit.
+
+    Returns:
+        pygame.Rect: The rectangle in pixels.
+    """
+    x, y, width, height = rect
+    left = round(x * scale)
+    top = round(y * scale)
+    return pygame.Rect(
+        left, top, round((x + width) * scale) - left, round((y + height) * scale) - top
+    )